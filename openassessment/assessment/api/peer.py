@@ -15,10 +15,11 @@ from django.utils import timezone
 from submissions import api as sub_api
 from openassessment.assessment.errors import (PeerAssessmentInternalError, PeerAssessmentRequestError,
                                               PeerAssessmentWorkflowError)
-from openassessment.assessment.models import (Assessment, AssessmentFeedback, AssessmentPart, InvalidRubricSelection,
+from openassessment.assessment.models import (Assessment, AssessmentFeedback, InvalidRubricSelection,
                                               PeerWorkflow, PeerWorkflowItem, PeerGradingStrategy)
 from openassessment.assessment.serializers import (AssessmentFeedbackSerializer, InvalidRubric, RubricSerializer,
                                                    full_assessment_dict, rubric_from_dict, serialize_assessments)
+from openassessment.xblock.apis.data_loader import load_in_scope
 
 logger = logging.getLogger("openassessment.assessment.api.peer")  # pylint: disable=invalid-name
 
@@ -135,7 +136,7 @@ def submitter_is_finished(submission_uuid, peer_requirements):
             return True
         elif workflow.num_peers_graded() >= peer_requirements["must_grade"]:
             workflow.completed_at = timezone.now()
-            workflow.save()
+            workflow.save(update_fields=['completed_at'])
             return True
         return False
     except PeerWorkflow.DoesNotExist:
@@ -153,11 +154,7 @@ def get_graded_by_count(submission_uuid):
     if workflow is None:
         return None
 
-    scored_items = workflow.graded_by.filter(
-        assessment__submission_uuid=submission_uuid,
-        assessment__score_type=PEER_TYPE
-    )
-    return scored_items.count()
+    return workflow.graded_by_count
 
 
 def assessment_is_finished(submission_uuid, peer_requirements, course_settings):
@@ -182,7 +179,7 @@ def assessment_is_finished(submission_uuid, peer_requirements, course_settings):
     if not peer_requirements:
         return False
 
-    count = get_graded_by_count(submission_uuid)
+    count = load_in_scope(("peer_graded_by_count", submission_uuid), get_graded_by_count, submission_uuid)
     if count is None:
         return False
 
@@ -265,7 +262,7 @@ def get_score(submission_uuid, peer_requirements, course_settings):
     items = workflow.graded_by.filter(
         assessment__submission_uuid=submission_uuid,
         assessment__score_type=PEER_TYPE
-    ).order_by('-assessment')
+    ).order_by('-assessment').select_related('assessment')
 
     # Check if enough peers have graded this submission
     # This value will be the number configured on the peer step, or the reduced number if flexible
@@ -284,24 +281,24 @@ def get_score(submission_uuid, peer_requirements, course_settings):
             peer_requirements['must_be_graded_by']
         )
 
-    # Unfortunately, we cannot use update() after taking a slice,
-    # so we need to update the and save the items individually.
-    # One might be tempted to first query for the first n assessments,
-    # then select items that have those assessments.
-    # However, this generates a SQL query with a LIMIT in a subquery,
-    # which is not supported by some versions of MySQL.
-    # Although this approach generates more database queries, the number is likely to
-    # be relatively small (at least 1 and very likely less than 5).
+    # We cannot use update() after taking a slice, and filtering on a subquery
+    # with a LIMIT is not supported by some versions of MySQL, so we read the
+    # ids of the items to mark and then update them all in one query.
+    unscored_item_ids = []
     for scored_item in items[:num_required_peer_grades]:
         # If we've already gone through and marked items as scored, that should
         # not change; if we've found a scored item we've done it already and should stop
         if scored_item.scored:
             break
-        scored_item.scored = True
-        scored_item.save()
+        unscored_item_ids.append(scored_item.id)
+    if unscored_item_ids:
+        PeerWorkflowItem.objects.filter(id__in=unscored_item_ids).update(scored=True)
     assessments = [item.assessment for item in items]
 
-    scores_dict = get_assessment_scores_with_grading_strategy(
+    # Shared with the grade page, which shows these scores by criterion
+    scores_dict = load_in_scope(
+        ("peer_median_scores", submission_uuid),
+        get_assessment_scores_with_grading_strategy,
         submission_uuid,
         peer_requirements,
     )
@@ -465,21 +462,20 @@ def _complete_assessment(
     # Get or create the rubric
     rubric = rubric_from_dict(rubric_dict)
 
-    # Create the peer assessment
+    # Create the peer assessment, with assessment parts for each criterion in the rubric
+    # This will raise an `InvalidRubricSelection` if the selected options do not
+    # match the rubric.
     assessment = Assessment.create(
         rubric,
         scorer_id,
         peer_submission_uuid,
         PEER_TYPE,
         scored_at=scored_at,
-        feedback=overall_feedback
+        feedback=overall_feedback,
+        options_selected=options_selected,
+        criterion_feedback=criterion_feedback,
     )
 
-    # Create assessment parts for each criterion in the rubric
-    # This will raise an `InvalidRubricSelection` if the selected options do not
-    # match the rubric.
-    AssessmentPart.create_from_option_names(assessment, options_selected, feedback=criterion_feedback)
-
     # Close the active assessment
     scorer_workflow.close_active_assessment(peer_submission_uuid, assessment, num_required_grades)
     return assessment
@@ -548,7 +544,8 @@ def get_assessment_scores_with_grading_strategy(submission_uuid, workflow_requir
     try:
         workflow = PeerWorkflow.objects.get(submission_uuid=submission_uuid)
         items = workflow.graded_by.filter(scored=True)
-        assessments = [item.assessment for item in items]
+        # Scores only need the assessment ids, so load the assessments in one query
+        assessments = Assessment.objects.filter(pk__in=[item.assessment_id for item in items])
         scores = Assessment.scores_by_criterion(assessments)
         return Assessment.get_score_dict(
             scores,
@@ -1075,7 +1072,7 @@ def on_cancel(submission_uuid):
         workflow = PeerWorkflow.get_by_submission_uuid(submission_uuid)
         if workflow:
             workflow.cancelled_at = timezone.now()
-            workflow.save()
+            workflow.save(update_fields=['cancelled_at'])
     except (PeerAssessmentWorkflowError, DatabaseError) as ex:
         error_message = (
             "An internal error occurred while cancelling the peer"
@@ -1090,7 +1087,13 @@ def get_waiting_step_details(
     course_id,
     item_id,
     submission_uuids,
-    must_be_graded_by
+    must_be_graded_by,
+    workflow_status_list=None,
+    sort_by='created_at',
+    descending=False,
+    offset=0,
+    limit=None,
+    read_replica=False,
 ):
     """
     Proxy method to `get_waiting_step_details` model method.
@@ -1104,17 +1107,62 @@ def get_waiting_step_details(
                                     the peer step is not complete.
         must_be_graded_by (int): number of required peer reviews for this problem.
 
+    Keyword Arguments:
+        workflow_status_list (list): If given, only return students whose assessment
+            workflow is in one of these statuses, and include that status as
+            `workflow_status` in the results.
+        sort_by (str): One of `created_at`, `graded` or `graded_by`.
+        descending (bool): Sort in descending order.
+        offset (int): Number of matching students to skip.
+        limit (int): Maximum number of students to return.
+        read_replica (bool): If True, read from the read replica database when one is configured.
+
     Returns:
         dict: a dictionary that contains information about students in the waiting step.
               The dictionary includes the following information: `student_id`, `created_at` (
               timestamp of when the step was created), `graded` (how many peers the student
               graded) and `graded_by` (how many peers graded this student).
+
+    Raises:
+        ValueError: `sort_by` is not a supported sort field.
     """
     return PeerWorkflow.get_waiting_step_details(
         course_id,
         item_id,
         submission_uuids,
-        must_be_graded_by
+        must_be_graded_by,
+        workflow_status_list=workflow_status_list,
+        sort_by=sort_by,
+        descending=descending,
+        offset=offset,
+        limit=limit,
+        read_replica=read_replica,
+    )
+
+
+def get_waiting_step_status_counts(course_id, item_id, must_be_graded_by, workflow_status_list, read_replica=False):
+    """
+    Proxy method to `get_waiting_step_status_counts` model method.
+    Counts the users in the waiting step, grouped by assessment workflow status.
+
+    Args:
+        course_id (str): The course that this problem belongs to.
+        item_id (str): The student_item (problem) that we want to know statistics about.
+        must_be_graded_by (int): number of required peer reviews for this problem.
+        workflow_status_list (list): The assessment workflow statuses to count.
+
+    Keyword Arguments:
+        read_replica (bool): If True, read from the read replica database when one is configured.
+
+    Returns:
+        dict: maps each status in `workflow_status_list` to a number of users.
+    """
+    return PeerWorkflow.get_waiting_step_status_counts(
+        course_id,
+        item_id,
+        must_be_graded_by,
+        workflow_status_list,
+        read_replica=read_replica,
     )
 
 
@@ -9,7 +9,7 @@ from django.db import DatabaseError, transaction
 
 from submissions.api import SubmissionNotFoundError, get_submission_and_student
 from openassessment.assessment.errors import SelfAssessmentInternalError, SelfAssessmentRequestError
-from openassessment.assessment.models import Assessment, AssessmentPart, InvalidRubricSelection
+from openassessment.assessment.models import Assessment, InvalidRubricSelection
 from openassessment.assessment.serializers import (InvalidRubric, full_assessment_dict, rubric_from_dict,
                                                    serialize_assessments)
 from openassessment.assessment.score_type_constants import SELF_TYPE
@@ -213,18 +213,18 @@ def _complete_assessment(
     # Get or create the rubric
     rubric = rubric_from_dict(rubric_dict)
 
-    # Create the self assessment
+    # Create the self assessment and its parts
+    # This will raise an `InvalidRubricSelection` if the selected options do not match the rubric.
     assessment = Assessment.create(
         rubric,
         user_id,
         submission_uuid,
         SELF_TYPE,
         scored_at=scored_at,
-        feedback=overall_feedback
+        feedback=overall_feedback,
+        options_selected=options_selected,
+        criterion_feedback=criterion_feedback,
     )
-
-    # This will raise an `InvalidRubricSelection` if the selected options do not match the rubric.
-    AssessmentPart.create_from_option_names(assessment, options_selected, feedback=criterion_feedback)
     return assessment
 
 
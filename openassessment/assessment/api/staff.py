@@ -5,13 +5,16 @@ Public interface for staff grading, used by students/course staff.
 
 import logging
 
+from django.core.cache import cache
 from django.db import DatabaseError, transaction
 from django.utils.timezone import now
 
 from submissions import api as submissions_api
+from submissions.models import Submission
+from submissions.serializers import SubmissionSerializer
 
 from openassessment.assessment.errors import StaffAssessmentInternalError, StaffAssessmentRequestError
-from openassessment.assessment.models import Assessment, AssessmentPart, InvalidRubricSelection, StaffWorkflow
+from openassessment.assessment.models import Assessment, InvalidRubricSelection, StaffWorkflow
 from openassessment.assessment.serializers import (
     InvalidRubric,
     full_assessment_dict,
@@ -284,6 +287,107 @@ def get_submission_to_assess(course_id, item_id, scorer_id):
         return None
 
 
+def get_submissions_to_assess(course_id, item_id, scorer_id, count):
+    """
+    Reserve several submissions for staff evaluation at once.
+
+    Reserves up to `count` submissions for the given staff member (see
+    StaffWorkflow.get_submissions_for_review) and fetches them in bulk.
+
+    Args:
+        course_id (str): The course that we would like to fetch submissions from.
+        item_id (str): The student_item (problem) that we would like to retrieve submissions for.
+        scorer_id (str): The user id of the staff member scoring these submissions
+        count (int): The maximum number of submissions to reserve
+
+    Returns:
+        list of dict: The reserved student submissions, oldest first, in the same
+            format as get_submission_to_assess.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            retrieving staff workflow information.
+
+    """
+    submission_uuids = StaffWorkflow.get_submissions_for_review(course_id, item_id, scorer_id, count)
+    if not submission_uuids:
+        logger.info("No submissions found for staff to assess (%s, %s)", course_id, item_id)
+        return []
+
+    try:
+        return _bulk_get_submissions(submission_uuids)
+    except (DatabaseError, submissions_api.SubmissionError) as ex:
+        error_message = (
+            "Could not fetch the submissions with uuids {}"
+        ).format(submission_uuids)
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message) from ex
+
+
+def release_submissions_to_assess(course_id, item_id, scorer_id, submission_uuids):
+    """
+    Give back submissions reserved with get_submissions_to_assess that the staff member won't grade,
+    so that other staff members can claim them (see StaffWorkflow.release_submissions_for_review).
+
+    Args:
+        course_id (str): The course that the submissions belong to.
+        item_id (str): The student_item (problem) that the submissions belong to.
+        scorer_id (str): The user id of the staff member who reserved the submissions.
+        submission_uuids (list of str): The submissions to release.
+
+    Returns:
+        int: The number of submissions released.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            updating staff workflow information.
+
+    """
+    return StaffWorkflow.release_submissions_for_review(course_id, item_id, scorer_id, submission_uuids)
+
+
+def _bulk_get_submissions(submission_uuids):
+    """
+    Fetch serialized submissions in the same format as submissions_api.get_submission,
+    reading and filling the same cache entries, with a single cache round trip and a
+    single query for all of the uncached submissions.
+
+    Args:
+        submission_uuids (list of str): The submissions to fetch
+
+    Returns:
+        list of dict: The serialized submissions, in the same order as submission_uuids
+    """
+    cache_keys = {submission_uuid: Submission.get_cache_key(submission_uuid) for submission_uuid in submission_uuids}
+    cached_submissions = cache.get_many(list(cache_keys.values()))
+    submissions = {
+        submission_uuid: cached_submissions[cache_key]
+        for submission_uuid, cache_key in cache_keys.items()
+        if cached_submissions.get(cache_key)
+    }
+
+    missing_uuids = [submission_uuid for submission_uuid in submission_uuids if submission_uuid not in submissions]
+    if missing_uuids:
+        fetched_submissions = {
+            str(submission.uuid): SubmissionSerializer(submission).data
+            for submission in Submission.objects.filter(uuid__in=missing_uuids).select_related('team_submission')
+        }
+        cache.set_many({
+            cache_keys[submission_uuid]: submission_data
+            for submission_uuid, submission_data in fetched_submissions.items()
+            if submission_uuid in cache_keys
+        })
+        submissions.update(fetched_submissions)
+
+        # Anything left over (e.g. uuids stored without hyphens) goes through the submissions API,
+        # which knows how to find those.
+        for submission_uuid in missing_uuids:
+            if submission_uuid not in submissions:
+                submissions[submission_uuid] = submissions_api.get_submission(submission_uuid)
+
+    return [submissions[submission_uuid] for submission_uuid in submission_uuids]
+
+
 def get_staff_grading_statistics(course_id, item_id):
     """
     Returns the number of graded, ungraded, and in-progress submissions for staff grading.
@@ -427,21 +531,20 @@ def _complete_assessment(
     # Get or create the rubric
     rubric = rubric_from_dict(rubric_dict)
 
-    # Create the staff assessment
+    # Create the staff assessment, with assessment parts for each criterion in the rubric
+    # This will raise an `InvalidRubricSelection` if the selected options do not
+    # match the rubric.
     assessment = Assessment.create(
         rubric,
         scorer_id,
         submission_uuid,
         STAFF_TYPE,
         scored_at=scored_at,
-        feedback=overall_feedback
+        feedback=overall_feedback,
+        options_selected=options_selected,
+        criterion_feedback=criterion_feedback,
     )
 
-    # Create assessment parts for each criterion in the rubric
-    # This will raise an `InvalidRubricSelection` if the selected options do not
-    # match the rubric.
-    AssessmentPart.create_from_option_names(assessment, options_selected, feedback=criterion_feedback)
-
     # Close the active assessment
     if scorer_workflow is not None:
         scorer_workflow.close_active_assessment(assessment, scorer_id)
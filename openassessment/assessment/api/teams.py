@@ -9,6 +9,8 @@ from django.db import DatabaseError
 from django.utils.timezone import now
 
 from submissions import team_api as team_submissions_api
+from submissions.models import TeamSubmission
+from submissions.serializers import TeamSubmissionSerializer
 
 from openassessment.assessment.api.staff import _complete_assessment
 from openassessment.assessment.errors import StaffAssessmentInternalError, StaffAssessmentRequestError
@@ -285,6 +287,88 @@ def get_submission_to_assess(course_id, item_id, scorer_id):
         return None
 
 
+def get_submissions_to_assess(course_id, item_id, scorer_id, count):
+    """
+    Reserve several team submissions for staff evaluation at once.
+
+    Args:
+        course_id (str): The course that we would like to fetch submissions from.
+        item_id (str): The student_item (problem) that we would like to retrieve submissions for.
+        scorer_id (str): The user id of the staff member scoring these submissions
+        count (int): The maximum number of team submissions to reserve
+
+    Returns:
+        list of dict: The reserved team submissions, oldest first, in the same
+            format as get_submission_to_assess.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            retrieving staff workflow information.
+
+    """
+    team_submission_uuids = TeamStaffWorkflow.get_submissions_for_review(course_id, item_id, scorer_id, count)
+    if not team_submission_uuids:
+        logger.info("No team submissions found for staff to assess (%s, %s)", course_id, item_id)
+        return []
+
+    try:
+        return _bulk_get_team_submissions(team_submission_uuids)
+    except DatabaseError as ex:
+        error_message = (
+            "Could not fetch the team submissions with uuids {}"
+        ).format(team_submission_uuids)
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message) from ex
+
+
+def release_submissions_to_assess(course_id, item_id, scorer_id, team_submission_uuids):
+    """
+    Give back team submissions reserved with get_submissions_to_assess that the staff member won't grade,
+    so that other staff members can claim them (see StaffWorkflow.release_submissions_for_review).
+
+    Args:
+        course_id (str): The course that the team submissions belong to.
+        item_id (str): The student_item (problem) that the team submissions belong to.
+        scorer_id (str): The user id of the staff member who reserved the team submissions.
+        team_submission_uuids (list of str): The team submissions to release.
+
+    Returns:
+        int: The number of team submissions released.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            updating staff workflow information.
+
+    """
+    return TeamStaffWorkflow.release_submissions_for_review(course_id, item_id, scorer_id, team_submission_uuids)
+
+
+def _bulk_get_team_submissions(team_submission_uuids):
+    """
+    Fetch serialized team submissions in the same format as team_submissions_api.get_team_submission,
+    with a single query for the team submissions and one for their individual submissions.
+
+    Args:
+        team_submission_uuids (list of str): The team submissions to fetch
+
+    Returns:
+        list of dict: The serialized team submissions, in the same order as team_submission_uuids
+    """
+    team_submissions = {
+        str(team_submission.uuid): TeamSubmissionSerializer(team_submission).data
+        for team_submission in TeamSubmission.objects.filter(
+            uuid__in=team_submission_uuids
+        ).prefetch_related('submissions')
+    }
+
+    # Anything left over (e.g. uuids stored without hyphens) goes through the team submissions API,
+    # which knows how to find those.
+    return [
+        team_submissions.get(team_submission_uuid) or team_submissions_api.get_team_submission(team_submission_uuid)
+        for team_submission_uuid in team_submission_uuids
+    ]
+
+
 def get_staff_grading_statistics(course_id, item_id):
     """
     Returns the number of graded, ungraded, and in-progress team submissions for staff grading.
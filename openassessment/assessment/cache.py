@@ -0,0 +1,229 @@
+"""
+Two-level caching for immutable assessment data.
+
+Rubrics, training examples and completed assessments are never changed once
+written, so their serialized forms can be kept in process as well as in the
+Django cache. A `TieredCache` checks a bounded in-process LRU first and only
+falls back to the Django cache (usually memcached) on a local miss.
+"""
+from collections import OrderedDict
+import pickle
+import threading
+
+from django.core.cache import cache
+
+_MISSING = object()
+
+
+class LocalLRUCache:
+    """
+    A thread-safe, in-process LRU cache bounded by number of entries and,
+    optionally, by the total size of the entries.
+
+    Values are stored and returned as-is, so they are shared by every caller.
+    """
+
+    def __init__(self, max_entries, max_size=None):
+        """
+        Args:
+            max_entries (int): Maximum number of entries to keep.
+
+        Keyword Arguments:
+            max_size (int): Maximum total size of the entries, as given to `set`.
+                If None, only the number of entries is bounded.
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Return the value for `key`, marking it as most recently used,
+        or `default` if it isn't cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, size=0):
+        """
+        Cache `value` under `key`, evicting the least recently used entries
+        to stay within the limits. Values larger than `max_size` are not cached.
+        """
+        if self.max_size is not None and size > self.max_size:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (
+                self.max_size is not None and self._size > self.max_size
+            ):
+                __, (__, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def delete(self, key):
+        """
+        Remove `key` from the cache, if present.
+        """
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key):
+        """ Remove `key` from the cache. The caller must hold the lock. """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+
+class TieredCache:
+    """
+    An in-process LRU in front of the Django cache, for values that never change
+    once they have been cached.
+
+    The in-process tier holds pickled values, so every `get` returns a fresh copy
+    that callers may modify, just like a value read from the Django cache, but
+    without the network round trip.
+
+    Hits and misses on each tier are counted; see `stats`.
+    """
+
+    def __init__(self, max_entries=1000, max_size=16 * 1024 * 1024):
+        """
+        Keyword Arguments:
+            max_entries (int): Maximum number of values kept in process.
+            max_size (int): Maximum total size in bytes of the pickled values kept in process.
+        """
+        self.local = LocalLRUCache(max_entries, max_size=max_size)
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached under `key`, or `default` if neither tier has it.
+        A value found in the Django cache is copied into the in-process tier.
+        """
+        payload = self.local.get(key)
+        if payload is not None:
+            self._count('local_hits')
+            return pickle.loads(payload)
+
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            self._count('misses')
+            return default
+
+        self._count('remote_hits')
+        self._set_local(key, value)
+        return value
+
+    def get_many(self, keys):
+        """
+        Return a dict of the values cached under any of `keys`, leaving out keys
+        that neither tier has. Keys missing locally are fetched from the Django
+        cache in a single round trip.
+        """
+        found = {}
+        remote_keys = []
+        for key in keys:
+            payload = self.local.get(key)
+            if payload is None:
+                remote_keys.append(key)
+            else:
+                self._count('local_hits')
+                found[key] = pickle.loads(payload)
+
+        if remote_keys:
+            remote_values = cache.get_many(remote_keys)
+            for key, value in remote_values.items():
+                self._count('remote_hits')
+                self._set_local(key, value)
+                found[key] = value
+            for __ in range(len(remote_keys) - len(remote_values)):
+                self._count('misses')
+
+        return found
+
+    def set(self, key, value):
+        """
+        Cache `value` under `key` in both tiers.
+        """
+        cache.set(key, value)
+        self._set_local(key, value)
+
+    def set_many(self, values):
+        """
+        Cache every item of the `values` dict in both tiers, writing to the
+        Django cache in a single round trip.
+        """
+        if not values:
+            return
+        cache.set_many(values)
+        for key, value in values.items():
+            self._set_local(key, value)
+
+    def clear_local(self):
+        """
+        Empty the in-process tier. The Django cache is left alone.
+        """
+        self.local.clear()
+
+    @property
+    def stats(self):
+        """
+        Return a dict with the number of `local_hits`, `remote_hits` and `misses` so far.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        """
+        Set the hit and miss counters back to zero.
+        """
+        with self._stats_lock:
+            self._stats = {'local_hits': 0, 'remote_hits': 0, 'misses': 0}
+
+    def _count(self, counter):
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def _set_local(self, key, value):
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self.local.set(key, payload, size=len(payload))
+
+
+# Shared cache for serialized rubrics, training examples and assessments
+immutable_cache = TieredCache()
+
+
+def bump_cache_version(version_key):
+    """
+    Increment the counter stored in the Django cache under `version_key`, starting it at 1.
+
+    Values cached under keys that include the counter are invalidated by moving on to the next
+    version, rather than by finding and deleting each of them.
+    """
+    # The version has to outlive any value cached under it
+    if not cache.add(version_key, 1, None):
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            # Evicted between add() and incr()
+            cache.set(version_key, 1, None)
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0009_increase_item_id_max_length_peer_staff_studenttraining_workflows'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='peerworkflow',
+            name='graded_by_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='peerworkflow',
+            name='graded_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
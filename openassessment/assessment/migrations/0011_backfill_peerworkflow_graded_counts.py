@@ -0,0 +1,62 @@
+"""
+Backfill the denormalised PeerWorkflow.graded_count and graded_by_count columns
+from the existing peer workflow items.
+"""
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+PEER_TYPE = "PE"
+
+
+def backfill_graded_counts(apps, schema_editor):  # pylint: disable=unused-argument
+    """
+    Recount the peer assessments given and received by each workflow, in batches of workflow ids.
+    """
+    PeerWorkflow = apps.get_model('assessment', 'PeerWorkflow')
+    PeerWorkflowItem = apps.get_model('assessment', 'PeerWorkflowItem')
+
+    last_id = 0
+    while True:
+        workflow_ids = list(
+            PeerWorkflow.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not workflow_ids:
+            break
+        last_id = workflow_ids[-1]
+
+        graded = dict(
+            PeerWorkflowItem.objects.filter(
+                scorer_id__in=workflow_ids,
+                assessment__isnull=False,
+            ).values('scorer_id').annotate(count=models.Count('id')).order_by().values_list('scorer_id', 'count')
+        )
+        graded_by = dict(
+            PeerWorkflowItem.objects.filter(
+                author_id__in=workflow_ids,
+                assessment__score_type=PEER_TYPE,
+                assessment__submission_uuid=models.F('author__submission_uuid'),
+            ).values('author_id').annotate(count=models.Count('id')).order_by().values_list('author_id', 'count')
+        )
+
+        workflows = [
+            PeerWorkflow(
+                id=workflow_id,
+                graded_count=graded.get(workflow_id, 0),
+                graded_by_count=graded_by.get(workflow_id, 0),
+            )
+            for workflow_id in workflow_ids
+            if workflow_id in graded or workflow_id in graded_by
+        ]
+        PeerWorkflow.objects.bulk_update(workflows, ['graded_count', 'graded_by_count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0010_peerworkflow_graded_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_graded_counts, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0011_backfill_peerworkflow_graded_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessment',
+            name='stored_points_earned',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='stored_points_possible',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
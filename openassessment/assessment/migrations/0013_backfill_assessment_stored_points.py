@@ -0,0 +1,72 @@
+"""
+Backfill the denormalised Assessment.stored_points_earned and stored_points_possible
+columns from the existing assessment parts and rubrics.
+"""
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_stored_points(apps, schema_editor):  # pylint: disable=unused-argument
+    """
+    Sum the points earned on each assessment's parts and the points possible in its rubric,
+    in batches of assessment ids.
+    """
+    Assessment = apps.get_model('assessment', 'Assessment')
+    AssessmentPart = apps.get_model('assessment', 'AssessmentPart')
+    CriterionOption = apps.get_model('assessment', 'CriterionOption')
+
+    rubric_points_possible = {}
+    last_id = 0
+    while True:
+        assessments = list(
+            Assessment.objects.filter(id__gt=last_id).order_by('id').values_list('id', 'rubric_id')[:BATCH_SIZE]
+        )
+        if not assessments:
+            break
+        last_id = assessments[-1][0]
+
+        points_earned = dict(
+            AssessmentPart.objects.filter(
+                assessment_id__in=[assessment_id for assessment_id, __ in assessments],
+            ).values('assessment_id').annotate(
+                points=models.Sum('option__points')
+            ).order_by().values_list('assessment_id', 'points')
+        )
+
+        # Rubrics are shared by many assessments, so only look up the ones we haven't seen yet.
+        # By convention, criteria with no options (only feedback) have 0 points possible.
+        new_rubric_ids = {rubric_id for __, rubric_id in assessments} - set(rubric_points_possible)
+        for rubric_id in new_rubric_ids:
+            rubric_points_possible[rubric_id] = 0
+        criterion_points = CriterionOption.objects.filter(
+            criterion__rubric_id__in=new_rubric_ids,
+        ).values('criterion__rubric_id', 'criterion_id').annotate(
+            points=models.Max('points')
+        ).order_by().values_list('criterion__rubric_id', 'points')
+        for rubric_id, points in criterion_points:
+            rubric_points_possible[rubric_id] += points
+
+        Assessment.objects.bulk_update(
+            [
+                Assessment(
+                    id=assessment_id,
+                    stored_points_earned=points_earned.get(assessment_id) or 0,
+                    stored_points_possible=rubric_points_possible[rubric_id],
+                )
+                for assessment_id, rubric_id in assessments
+            ],
+            ['stored_points_earned', 'stored_points_possible'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0012_assessment_stored_points'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_stored_points, reverse_code=migrations.RunPython.noop),
+    ]
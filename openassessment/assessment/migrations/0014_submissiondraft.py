@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:02
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0013_backfill_assessment_stored_points'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionDraft',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('student_id', models.CharField(max_length=255)),
+                ('course_id', models.CharField(max_length=255)),
+                ('item_id', models.CharField(max_length=255)),
+                ('response', models.TextField(blank=True, default='')),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('student_id', 'course_id', 'item_id')},
+            },
+        ),
+    ]
@@ -14,13 +14,11 @@ need to then generate a matching migration for it using:
 
 
 from collections import defaultdict
-from copy import deepcopy
 from hashlib import sha1
 import json
 import logging
 import math
 
-from django.core.cache import cache
 from django.db import models
 from django.utils.functional import cached_property
 from django.utils.timezone import now
@@ -31,6 +29,8 @@ from model_utils.models import TimeStampedModel
 
 from lazy import lazy
 
+from openassessment.assessment.cache import LocalLRUCache, immutable_cache
+
 logger = logging.getLogger("openassessment.assessment.models")  # pylint: disable=invalid-name
 
 KEY_SEPARATOR = '/'
@@ -96,7 +96,7 @@ class Rubric(models.Model):
             RubricIndex
 
         """
-        return RubricIndex(self)
+        return RubricIndex.for_rubric(self)
 
     @staticmethod
     def content_hash_from_dict(rubric_dict):
@@ -110,7 +110,8 @@ class Rubric(models.Model):
         database, the child object needs to have the ID of the parent, meaning
         that Rubric would have to have already been created and persisted.
         """
-        rubric_dict = deepcopy(rubric_dict)
+        # Only top-level keys are removed, so a shallow copy is enough
+        rubric_dict = dict(rubric_dict)
 
         # Neither "id" nor "content_hash" would count towards calculating the
         # content_hash.
@@ -241,7 +242,39 @@ class RubricIndex:
     """
     Loads a rubric's criteria and options into memory so that they
     can be repeatedly queried without hitting the database.
+
+    Since rubrics are never changed once written, indexes are also kept in an
+    in-process LRU cache keyed by content hash; use `for_rubric` to share them.
     """
+    # Rubric indexes shared through `for_rubric`, keyed by content hash
+    _cache = LocalLRUCache(max_entries=256)
+
+    @classmethod
+    def for_rubric(cls, rubric):
+        """
+        Return the index for a rubric, loading it from the database only if
+        it isn't already in the in-process cache.
+
+        Args:
+            rubric (Rubric): The Rubric model to index.
+
+        Returns:
+            RubricIndex
+
+        """
+        rubric_index = cls._cache.get(rubric.content_hash)
+        # Guard against a cached index for a rubric row that no longer exists
+        if rubric_index is None or rubric_index.rubric.pk != rubric.pk:
+            rubric_index = cls(rubric)
+            cls._cache.set(rubric.content_hash, rubric_index)
+        return rubric_index
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Empty the in-process rubric index cache.
+        """
+        cls._cache.clear()
 
     def __init__(self, rubric):
         """
@@ -281,6 +314,12 @@ class RubricIndex:
 
         self._option_index = option_index
 
+        # By convention, criteria with 0 options (only feedback) have 0 points possible
+        max_points = {}
+        for option in options:
+            max_points[option.criterion.name] = max(option.points, max_points.get(option.criterion.name, 0))
+        self.points_possible = sum(max_points.values())
+
         # By convention, if multiple options in the same criterion have the
         # same point value, we return the *first* option.
         # Since the options are in descending order by order number,
@@ -431,19 +470,44 @@ class Assessment(models.Model):
 
     feedback = models.TextField(max_length=10000, default="", blank=True)
 
+    # Scores stored when the assessment parts are created, so that reading them
+    # doesn't need the parts or the rubric. Null for rows that predate them.
+    stored_points_earned = models.PositiveIntegerField(null=True, blank=True)
+    stored_points_possible = models.PositiveIntegerField(null=True, blank=True)
+
     class Meta:
         ordering = ["-scored_at", "-id"]
         app_label = "assessment"
 
     @property
     def points_earned(self):
+        if self.stored_points_earned is not None:
+            return self.stored_points_earned
         parts = [part.points_earned for part in self.parts.all()]
         return sum(parts) if parts else 0
 
     @property
     def points_possible(self):
+        if self.stored_points_possible is not None:
+            return self.stored_points_possible
         return self.rubric.points_possible
 
+    def store_points(self, points_earned, points_possible):
+        """
+        Save the assessment's scores on its row.
+
+        Args:
+            points_earned (int): The total points earned across the assessment parts.
+            points_possible (int): The total points possible in the rubric.
+
+        Returns:
+            None
+
+        """
+        self.stored_points_earned = points_earned
+        self.stored_points_possible = points_possible
+        self.save(update_fields=['stored_points_earned', 'stored_points_possible'])
+
     def to_float(self):
         """
         Calculate the score percentage (points earned / points possible).
@@ -460,7 +524,10 @@ class Assessment(models.Model):
         return f"Assessment {self.id}"
 
     @classmethod
-    def create(cls, rubric, scorer_id, submission_uuid, score_type, feedback=None, scored_at=None):
+    def create(
+        cls, rubric, scorer_id, submission_uuid, score_type, feedback=None, scored_at=None,
+        options_selected=None, criterion_feedback=None,
+    ):
         """
         Create a new assessment.
 
@@ -473,10 +540,18 @@ class Assessment(models.Model):
         Keyword Arguments:
             feedback (unicode): Overall feedback on the submission.
             scored_at (datetime): The time the assessment was created.  Defaults to the current time.
+            options_selected (dict): A dictionary mapping criterion names to option names.
+                When given, the assessment parts are created too, and the scores they add up to
+                are stored by the same INSERT as the assessment.
+            criterion_feedback (dict): A dictionary mapping criterion names to written feedback,
+                for the parts created from `options_selected`.
 
         Returns:
             Assessment
 
+        Raises:
+            InvalidRubricSelection
+
         """
         assessment_params = {
             'rubric': rubric,
@@ -492,7 +567,13 @@ class Assessment(models.Model):
         if feedback is not None:
             assessment_params['feedback'] = feedback[0:cls.MAX_FEEDBACK_SIZE]
 
-        return cls.objects.create(**assessment_params)
+        if options_selected is None:
+            return cls.objects.create(**assessment_params)
+
+        # The parts save the assessment along with its scores before they are saved themselves
+        assessment = cls(**assessment_params)
+        AssessmentPart.create_from_option_names(assessment, options_selected, feedback=criterion_feedback)
+        return assessment
 
     @classmethod
     def get_score_dict(cls, scores_dict, grading_strategy):
@@ -663,17 +744,26 @@ class Assessment(models.Model):
         cache_key = "assessments.scores_by_criterion.{}".format(
             ",".join(str(assessment.id) for assessment in assessments)
         )
-        scores = cache.get(cache_key)
+        scores = immutable_cache.get(cache_key)
         if scores:
             return scores
 
+        # Read the parts of every assessment in one query, then add their scores
+        # in the order of the assessments.
+        parts_by_assessment = defaultdict(list)
+        parts = AssessmentPart.objects.filter(
+            assessment__in=[assessment.id for assessment in assessments]
+        ).order_by('id').values_list('assessment_id', 'criterion__name', 'option__points')
+        for assessment_id, criterion_name, option_points in parts:
+            parts_by_assessment[assessment_id].append((criterion_name, option_points))
+
         scores = defaultdict(list)
         for assessment in assessments:
-            for part in assessment.parts.all().select_related():
-                criterion_name = part.criterion.name
-                scores[criterion_name].append(part.points_earned)
+            for criterion_name, option_points in parts_by_assessment[assessment.id]:
+                # By convention, a part with no option (only feedback) earns 0 points
+                scores[criterion_name].append(option_points if option_points is not None else 0)
 
-        cache.set(cache_key, scores)
+        immutable_cache.set(cache_key, scores)
         return scores
 
 
@@ -783,7 +873,7 @@ class AssessmentPart(models.Model):
         # Create assessment parts for each criterion and associate them with the assessment
         # We use the dictionary we created earlier, which may have null options
         # for feedback-only assessment parts.
-        return cls.objects.bulk_create([
+        return cls._create_parts(assessment, rubric_index, [
             cls(
                 assessment=assessment,
                 criterion=assessment_part['criterion'],
@@ -843,7 +933,7 @@ class AssessmentPart(models.Model):
 
         # Create assessment parts for each criterion and associate them with the assessment
         # Since we're not accepting written feedback, set all feedback to an empty string.
-        return cls.objects.bulk_create([
+        return cls._create_parts(assessment, rubric_index, [
             cls(
                 assessment=assessment,
                 criterion=assessment_part['criterion'],
@@ -853,6 +943,31 @@ class AssessmentPart(models.Model):
             for assessment_part in assessment_parts
         ])
 
+    @classmethod
+    def _create_parts(cls, assessment, rubric_index, parts):
+        """
+        Save new assessment parts, and store the resulting scores on the assessment.
+        An assessment which isn't saved yet is inserted with its scores, otherwise they are
+        written by an UPDATE.
+
+        Args:
+            assessment (Assessment): The assessment the parts belong to.
+            rubric_index (RubricIndex): The index of the assessment's rubric.
+            parts (list of AssessmentPart): The unsaved assessment parts.
+
+        Returns:
+            list of `AssessmentPart`s
+
+        """
+        points_earned = sum(part.points_earned for part in parts)
+        if assessment.pk is None:
+            assessment.stored_points_earned = points_earned
+            assessment.stored_points_possible = rubric_index.points_possible
+            assessment.save()
+        else:
+            assessment.store_points(points_earned, rubric_index.points_possible)
+        return cls.objects.bulk_create(parts)
+
     @classmethod
     def _check_has_all_criteria(cls, rubric_index, selected_criteria):
         """
@@ -952,3 +1067,26 @@ class SharedFileUpload(TimeStampedModel):
     @classmethod
     def by_student_course_item(cls, student_id, course_id, item_id, **kwargs):  # pylint: disable=unused-argument
         return cls.objects.filter(owner_id=student_id, course_id=course_id, item_id=item_id)
+
+
+class SubmissionDraft(TimeStampedModel):
+    """
+    The draft response of a learner to an ORA, autosaved while they write it.
+
+    Drafts are kept out of courseware user state, which is rewritten in full, with its
+    history, on every save. See openassessment.xblock.utils.draft_store.
+    """
+    student_id = models.CharField(max_length=255)
+    course_id = models.CharField(max_length=255)
+    item_id = models.CharField(max_length=255)
+    # Serialized as the `saved_response` XBlock field is: {"parts": [{"text": ...}, ...]}
+    response = models.TextField(default="", blank=True)
+    # When the response was saved, in microseconds. A response only replaces an older one.
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        app_label = "assessment"
+        unique_together = ('student_id', 'course_id', 'item_id')
+
+    def __str__(self):
+        return f"SubmissionDraft {self.student_id} {self.item_id}"
@@ -110,6 +110,13 @@ class PeerWorkflow(models.Model):
     # Amount of time before a lease on a submission expires
     TIME_LIMIT = timedelta(hours=8)
 
+    # Sort keys accepted by `get_waiting_step_details`, mapped to the fields they order by
+    WAITING_STEP_SORT_FIELDS = {
+        'created_at': 'created_at',
+        'graded': 'graded_count',
+        'graded_by': 'graded_by_count',
+    }
+
     student_id = models.CharField(max_length=40, db_index=True)
     item_id = models.CharField(max_length=255, db_index=True)
     course_id = models.CharField(max_length=255, db_index=True)
@@ -119,6 +126,12 @@ class PeerWorkflow(models.Model):
     grading_completed_at = models.DateTimeField(null=True, db_index=True)
     cancelled_at = models.DateTimeField(null=True, db_index=True)
 
+    # Denormalised peer assessment counts, maintained by `close_active_assessment`:
+    # how many peers this student has assessed, and how many peer assessments
+    # this student's submission has received.
+    graded_count = models.PositiveIntegerField(default=0)
+    graded_by_count = models.PositiveIntegerField(default=0, db_index=True)
+
     class Meta:
         ordering = ["created_at", "id"]
         app_label = "assessment"
@@ -215,13 +228,63 @@ class PeerWorkflow(models.Model):
             logger.exception(error_message)
             raise PeerAssessmentInternalError(error_message) from ex
 
+    @classmethod
+    def _get_waiting_step_queryset(
+        cls,
+        course_id,
+        item_id,
+        submission_uuids,
+        must_be_graded_by,
+        workflow_status_list=None,
+        read_replica=False,
+    ):
+        """
+        Build the queryset behind `get_waiting_step_details` and `get_waiting_step_status_counts`.
+
+        When `workflow_status_list` is given, workflows are matched against the
+        assessment workflow table with a correlated subquery, and each row is
+        annotated with its `workflow_status`. This avoids passing every waiting
+        submission UUID back to the database as query parameters.
+        """
+        # Imports are placed here to avoid circular imports between the assessment and workflow apps.
+        from openassessment.data import use_read_replica
+        from openassessment.workflow.models import AssessmentWorkflow
+
+        waiting = cls.objects.filter(
+            item_id=item_id, course_id=course_id,
+            grading_completed_at__isnull=True,
+        )
+        if read_replica:
+            # The workflow subquery is compiled into the same query, so it is read from the replica too
+            waiting = use_read_replica(waiting)
+        if workflow_status_list is not None:
+            workflow_status = AssessmentWorkflow.objects.filter(
+                submission_uuid=models.OuterRef('submission_uuid'),
+                status__in=workflow_status_list,
+            ).values('status')[:1]
+            waiting = waiting.annotate(
+                workflow_status=models.Subquery(workflow_status)
+            ).filter(
+                workflow_status__isnull=False
+            )
+        if submission_uuids is not None:
+            waiting = waiting.filter(submission_uuid__in=submission_uuids)
+
+        return waiting.filter(graded_by_count__lt=must_be_graded_by)
+
     @classmethod
     def get_waiting_step_details(
         cls,
         course_id,
         item_id,
         submission_uuids,
-        must_be_graded_by
+        must_be_graded_by,
+        workflow_status_list=None,
+        sort_by='created_at',
+        descending=False,
+        offset=0,
+        limit=None,
+        read_replica=False,
     ):
         """
         Retrieves information about users in the waiting step (waiting for peer reviews).
@@ -234,12 +297,26 @@ class PeerWorkflow(models.Model):
                                      the peer step is not complete.
             must_be_graded_by (int): number of required peer reviews for this problem.
 
+        Keyword Arguments:
+            workflow_status_list (list): If given, only return students whose assessment
+                workflow is in one of these statuses, and include that status as
+                `workflow_status` in the results.
+            sort_by (str): One of `WAITING_STEP_SORT_FIELDS`. Defaults to `created_at`.
+            descending (bool): Sort in descending order.
+            offset (int): Number of matching students to skip.
+            limit (int): Maximum number of students to return. If None, all matching
+                students (after `offset`) are returned.
+            read_replica (bool): If True, read from the read replica database when one is configured.
+
         Returns:
             dict: a dictionary that contains information about students in the waiting step.
                   The dictionary includes the following information: `student_id`, `created_at` (
                   timestamp of when the step was created), `graded` (how many peers the student
                   graded) and `graded_by` (how many peers graded this student).
 
+        Raises:
+            ValueError: `sort_by` is not a supported sort field.
+
         Examples:
             >>> PeerWorkflow.get_waiting_step_details(course_id, item_id)
             {
@@ -249,46 +326,60 @@ class PeerWorkflow(models.Model):
                 'graded_by': 2
             }
         """
-        waiting = cls.objects.filter(
-            item_id=item_id, course_id=course_id,
-            grading_completed_at__isnull=True,
-            submission_uuid__in=submission_uuids,
-        ).annotate(
-            # distinct=True required due to
-            # https://docs.djangoproject.com/en/3.2/topics/db/aggregation/#combining-multiple-aggregations
-            graded_count=models.Count(
-                'graded',
-                distinct=True,
-                # From PeerWorkflow.num_peers_graded
-                filter=models.Q(
-                    graded__assessment__isnull=False
-                )
-            ),
-            graded_by_count=models.Count(
-                'graded_by',
-                distinct=True,
-                # from peer_api.get_graded_by_count
-                filter=models.Q(
-                    graded_by__assessment__submission_uuid__in=submission_uuids,
-                    graded_by__assessment__score_type=PEER_TYPE
-                )
-            )
-        ).filter(
-            graded_by_count__lt=must_be_graded_by
-        ).order_by(
-            'created_at',
-            'id'
-        )
-
-        return [
-            {
+        if sort_by not in cls.WAITING_STEP_SORT_FIELDS:
+            raise ValueError(f"Unsupported waiting step sort field: {sort_by}")
+
+        sort_field = cls.WAITING_STEP_SORT_FIELDS[sort_by]
+        ordering = [sort_field, 'id']
+        if descending:
+            ordering = [f'-{field}' for field in ordering]
+
+        waiting = cls._get_waiting_step_queryset(
+            course_id, item_id, submission_uuids, must_be_graded_by, workflow_status_list, read_replica
+        ).order_by(*ordering)
+        waiting = waiting[offset:offset + limit] if limit is not None else waiting[offset:]
+
+        details = []
+        for item in waiting:
+            item_details = {
                 'student_id': item.student_id,
                 'created_at': str(item.created_at),
                 'graded': item.graded_count,
                 'graded_by': item.graded_by_count,
                 'submission_uuid': item.submission_uuid,
-            } for item in waiting
-        ]
+            }
+            if workflow_status_list is not None:
+                item_details['workflow_status'] = item.workflow_status
+            details.append(item_details)
+        return details
+
+    @classmethod
+    def get_waiting_step_status_counts(
+        cls, course_id, item_id, must_be_graded_by, workflow_status_list, read_replica=False
+    ):
+        """
+        Count the students in the waiting step, grouped by assessment workflow status.
+
+        Args:
+            course_id (str): The course that this problem belongs to.
+            item_id (str): The student_item (problem) that we want to know statistics about.
+            must_be_graded_by (int): number of required peer reviews for this problem.
+            workflow_status_list (list): The assessment workflow statuses to count.
+
+        Keyword Arguments:
+            read_replica (bool): If True, read from the read replica database when one is configured.
+
+        Returns:
+            dict: maps each status in `workflow_status_list` to the number of students
+                  in the waiting step whose workflow has that status.
+        """
+        waiting = cls._get_waiting_step_queryset(
+            course_id, item_id, None, must_be_graded_by, workflow_status_list, read_replica
+        )
+        return waiting.aggregate(**{
+            status: models.Count('id', filter=models.Q(workflow_status=status))
+            for status in workflow_status_list
+        })
 
     def find_active_assessments(self):
         """Given a student item, return an active assessment if one is found.
@@ -446,6 +537,9 @@ class PeerWorkflow(models.Model):
         assessment. When a workflow item has an assessment, it is considered
         finished.
 
+        This should be called inside the transaction that creates the assessment,
+        so the denormalised assessment counts are only updated along with it.
+
         Args:
             submission_uuid (str): The submission the scorer is grading.
             assessment (PeerAssessment): The associate assessment for this action.
@@ -468,13 +562,16 @@ class PeerWorkflow(models.Model):
                 ).format(self.student_id, submission_uuid)
                 raise PeerAssessmentWorkflowError(msg)
             item = items[0]
+            newly_assessed = item.assessment_id is None
             item.assessment = assessment
             item.save()
+            if newly_assessed:
+                self._increment_graded_counts(item.author, assessment)
 
             if not item.author.grading_completed_at:
-                if item.author.graded_by.filter(assessment__isnull=False).count() >= num_required_grades:
+                if item.author.graded_by_count >= num_required_grades:
                     item.author.grading_completed_at = now()
-                    item.author.save()
+                    item.author.save(update_fields=['grading_completed_at'])
 
         except (DatabaseError, PeerWorkflowItem.DoesNotExist) as ex:
             error_message = (
@@ -485,6 +582,70 @@ class PeerWorkflow(models.Model):
             logger.exception(error_message)
             raise PeerAssessmentWorkflowError(error_message) from ex
 
+    def _increment_graded_counts(self, author_workflow, assessment):
+        """
+        Record a newly completed assessment by this workflow's student in the
+        denormalised `graded_count` and `graded_by_count` columns.
+
+        Both columns are incremented in a single UPDATE, so concurrent assessments
+        are not lost, and the in-memory instances are kept in step.
+        """
+        # Mirrors peer_api.get_graded_by_count
+        counts_as_graded_by = (
+            assessment.score_type == PEER_TYPE and assessment.submission_uuid == author_workflow.submission_uuid
+        )
+        graded_by_count = models.F('graded_by_count')
+        if counts_as_graded_by:
+            graded_by_count = models.Case(
+                models.When(pk=author_workflow.pk, then=models.F('graded_by_count') + 1),
+                default=models.F('graded_by_count'),
+                output_field=models.PositiveIntegerField(),
+            )
+        PeerWorkflow.objects.filter(pk__in={self.pk, author_workflow.pk}).update(
+            graded_count=models.Case(
+                models.When(pk=self.pk, then=models.F('graded_count') + 1),
+                default=models.F('graded_count'),
+                output_field=models.PositiveIntegerField(),
+            ),
+            graded_by_count=graded_by_count,
+        )
+
+        self.graded_count += 1
+        if counts_as_graded_by:
+            author_workflow.graded_by_count += 1
+            if author_workflow.pk == self.pk:
+                self.graded_by_count = author_workflow.graded_by_count
+
+    @classmethod
+    def count_graded(cls, workflow_ids):
+        """
+        Count the peer assessments given and received by each workflow from the
+        workflow items, ignoring the denormalised columns.
+
+        Args:
+            workflow_ids (list): PeerWorkflow primary keys.
+
+        Returns:
+            dict: maps each workflow id to a `(graded_count, graded_by_count)` tuple.
+        """
+        counts = {workflow_id: [0, 0] for workflow_id in workflow_ids}
+        graded = PeerWorkflowItem.objects.filter(
+            scorer_id__in=workflow_ids,
+            assessment__isnull=False,
+        ).values('scorer_id').annotate(count=models.Count('id')).order_by()
+        for row in graded:
+            counts[row['scorer_id']][0] = row['count']
+
+        graded_by = PeerWorkflowItem.objects.filter(
+            author_id__in=workflow_ids,
+            assessment__score_type=PEER_TYPE,
+            assessment__submission_uuid=models.F('author__submission_uuid'),
+        ).values('author_id').annotate(count=models.Count('id')).order_by()
+        for row in graded_by:
+            counts[row['author_id']][1] = row['count']
+
+        return {workflow_id: tuple(count) for workflow_id, count in counts.items()}
+
     def num_peers_graded(self):
         """
         Returns the number of peers the student owning the workflow has graded.
@@ -493,7 +654,7 @@ class PeerWorkflow(models.Model):
             integer
 
         """
-        return self.graded.filter(assessment__isnull=False).count()
+        return self.graded_count
 
     def __repr__(self):
         return (
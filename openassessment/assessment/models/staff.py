@@ -6,9 +6,12 @@ Models for managing staff assessments.
 from datetime import timedelta
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import DatabaseError, models
 from django.utils.timezone import now
 
+from openassessment.assessment.cache import bump_cache_version
 from openassessment.assessment.errors import StaffAssessmentInternalError
 
 logger = logging.getLogger("openassessment.assessment.models")  # pylint: disable=invalid-name
@@ -30,6 +33,16 @@ class StaffWorkflow(models.Model):
     # Amount of time before a lease on a submission expires
     TIME_LIMIT = timedelta(hours=8)
 
+    # Seconds grading statistics are cached for, unless overridden by the
+    # ORA_STAFF_GRADING_STATISTICS_CACHE_TIMEOUT setting. 0 disables caching.
+    DEFAULT_STATISTICS_CACHE_TIMEOUT = 30
+
+    # Number of workflows a scorer tries to claim before giving up when racing other scorers
+    CLAIM_ATTEMPTS = 5
+
+    # Lookup, from StaffWorkflow, of the identifying_uuid of the workflows of this class
+    IDENTIFYING_UUID_LOOKUP = 'submission_uuid'
+
     scorer_id = models.CharField(max_length=40, db_index=True, blank=True)
     course_id = models.CharField(max_length=255, db_index=True)
     item_id = models.CharField(max_length=255, db_index=True)
@@ -44,6 +57,10 @@ class StaffWorkflow(models.Model):
         ordering = ["created_at", "id"]
         app_label = "assessment"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.bump_workflow_statistics(self.course_id, self.item_id)
+
     @property
     def is_cancelled(self):
         """
@@ -67,6 +84,9 @@ class StaffWorkflow(models.Model):
         """
         Returns the number of graded, ungraded, and in-progress submissions for staff grading.
 
+        Results are cached for a short time; the cache is invalidated through
+        `bump_workflow_statistics` whenever a workflow changes grading state.
+
         Args:
             course_id (str): The course that this problem belongs to
             item_id (str): The student_item (problem) that we want to know statistics about.
@@ -74,23 +94,57 @@ class StaffWorkflow(models.Model):
         Returns:
             dict: a dictionary that contains the following keys: 'graded', 'ungraded', and 'in-progress'
         """
+        cache_timeout = getattr(
+            settings, 'ORA_STAFF_GRADING_STATISTICS_CACHE_TIMEOUT', cls.DEFAULT_STATISTICS_CACHE_TIMEOUT
+        )
+        if not cache_timeout:
+            return cls._compute_workflow_statistics(course_id, item_id)
+
+        cache_key = "{}.workflow_statistics.{}.{}.v{}".format(
+            cls.__name__, course_id, item_id, cache.get(cls._statistics_version_key(course_id, item_id), 0)
+        )
+        stats = cache.get(cache_key)
+        if stats is None:
+            stats = cls._compute_workflow_statistics(course_id, item_id)
+            cache.set(cache_key, stats, cache_timeout)
+        return stats
+
+    @classmethod
+    def _compute_workflow_statistics(cls, course_id, item_id):
+        """
+        Count graded, ungraded, and in-progress submissions in a single aggregate query.
+        """
         # pylint: disable=unicode-format-string
         timeout = (now() - cls.TIME_LIMIT).strftime("%Y-%m-%d %H:%M:%S")
-        ungraded = cls.objects.filter(
-            models.Q(grading_started_at=None) | models.Q(grading_started_at__lte=timeout),
-            course_id=course_id, item_id=item_id, grading_completed_at=None, cancelled_at=None
-        ).count()
+        not_started = models.Q(grading_started_at=None) | models.Q(grading_started_at__lte=timeout)
+        counts = cls.objects.filter(
+            course_id=course_id, item_id=item_id, cancelled_at=None
+        ).aggregate(
+            ungraded=models.Count('pk', filter=models.Q(grading_completed_at=None) & not_started),
+            in_progress=models.Count('pk', filter=models.Q(
+                grading_completed_at=None, grading_started_at__gt=timeout
+            )),
+            graded=models.Count('pk', filter=models.Q(grading_completed_at__isnull=False)),
+        )
 
-        in_progress = cls.objects.filter(
-            course_id=course_id, item_id=item_id, grading_completed_at=None, cancelled_at=None,
-            grading_started_at__gt=timeout
-        ).count()
+        return {'ungraded': counts['ungraded'], 'in-progress': counts['in_progress'], 'graded': counts['graded']}
 
-        graded = cls.objects.filter(
-            course_id=course_id, item_id=item_id, cancelled_at=None
-        ).exclude(grading_completed_at=None).count()
+    @staticmethod
+    def _statistics_version_key(course_id, item_id):
+        """
+        Cache key of the counter that versions cached statistics for an item.
+        Shared by StaffWorkflow and TeamStaffWorkflow.
+        """
+        return f"StaffWorkflow.workflow_statistics_version.{course_id}.{item_id}"
 
-        return {'ungraded': ungraded, 'in-progress': in_progress, 'graded': graded}
+    @classmethod
+    def bump_workflow_statistics(cls, course_id, item_id):
+        """
+        Invalidate cached grading statistics for an item, after a workflow
+        is created, claimed, completed or cancelled. Called on every save();
+        queryset updates need to call it explicitly.
+        """
+        bump_cache_version(cls._statistics_version_key(course_id, item_id))
 
     @classmethod
     def get_submission_for_review(cls, course_id, item_id, scorer_id):
@@ -116,38 +170,186 @@ class StaffWorkflow(models.Model):
         timeout = (now() - cls.TIME_LIMIT).strftime("%Y-%m-%d %H:%M:%S")
         try:
             # Search for existing submissions that the scorer has worked on.
-            staff_workflows = cls.objects.filter(
+            workflow = cls.objects.filter(
                 course_id=course_id,
                 item_id=item_id,
                 scorer_id=scorer_id,
                 grading_completed_at=None,
                 cancelled_at=None,
+            ).first()
+            if workflow is not None:
+                StaffWorkflow.objects.filter(pk=workflow.pk).update(grading_started_at=now())
+                cls.bump_workflow_statistics(course_id, item_id)
+                return workflow.identifying_uuid
+
+            # If no existing submissions exist, then claim any other available workflow.
+            # The claim is a conditional UPDATE that only succeeds if the workflow is still
+            # available, so two scorers can never claim the same workflow. If another scorer
+            # got there first, try the next candidate.
+            is_available = models.Q(
+                models.Q(scorer_id='') | models.Q(grading_started_at__lte=timeout),
+                course_id=course_id,
+                item_id=item_id,
+                grading_completed_at=None,
+                cancelled_at=None,
             )
-            # If no existing submissions exist, then get any other
-            # available workflows.
-            if not staff_workflows:
-                staff_workflows = cls.objects.filter(
-                    models.Q(scorer_id='') | models.Q(grading_started_at__lte=timeout),
+            lost_claims = []
+            for _ in range(cls.CLAIM_ATTEMPTS):
+                workflow = cls.objects.filter(is_available).exclude(pk__in=lost_claims).first()
+                if workflow is None:
+                    return None
+
+                # Update the StaffWorkflow table directly, even for TeamStaffWorkflow: updating through
+                # the child model makes Django select the matching ids first, which isn't atomic.
+                claimed = StaffWorkflow.objects.filter(is_available, pk=workflow.pk).update(
+                    scorer_id=scorer_id,
+                    grading_started_at=now(),
+                )
+                if claimed:
+                    cls.bump_workflow_statistics(course_id, item_id)
+                    return workflow.identifying_uuid
+                lost_claims.append(workflow.pk)
+
+            logger.warning(
+                "Scorer %s could not claim a submission for staff grading in course %s item %s after %s attempts",
+                scorer_id, course_id, item_id, cls.CLAIM_ATTEMPTS
+            )
+            return None
+        except DatabaseError as ex:
+            error_message = (
+                "An internal error occurred while retrieving a submission for staff grading"
+            )
+            logger.exception(error_message)
+            raise StaffAssessmentInternalError(error_message) from ex
+
+    @classmethod
+    def get_submissions_for_review(cls, course_id, item_id, scorer_id, count):
+        """
+        Reserve up to `count` submissions for staff assessment, so that a staff member can
+        grade them one after the other without waiting for the next one to be found.
+
+        Submissions the scorer is already grading come first, and have their reservation renewed.
+        The rest are claimed from the available workflows in the same order as
+        get_submission_for_review, with a conditional UPDATE that only claims workflows which are
+        still available, so two scorers can never reserve the same submission.
+
+        Args:
+            course_id (str): The course that we would like to retrieve submissions for,
+            item_id (str): The student_item that we would like to retrieve submissions for.
+            scorer_id (str): The user id of the staff member scoring these submissions
+            count (int): The maximum number of submissions to reserve
+
+        Returns:
+            list of identifying_uuids (str) for the reserved (team or individual) submissions,
+            oldest first. This has fewer than `count` entries when not enough submissions are available.
+
+        Raises:
+            StaffAssessmentInternalError: Raised when there is an error retrieving
+                the workflows for this request.
+
+        """
+        # pylint: disable=unicode-format-string
+        timeout = (now() - cls.TIME_LIMIT).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            reserved = list(
+                cls.objects.filter(
                     course_id=course_id,
                     item_id=item_id,
+                    scorer_id=scorer_id,
                     grading_completed_at=None,
                     cancelled_at=None,
+                ).values_list('pk', flat=True)[:count]
+            )
+            if reserved:
+                StaffWorkflow.objects.filter(pk__in=reserved).update(grading_started_at=now())
+
+            is_available = models.Q(
+                models.Q(scorer_id='') | models.Q(grading_started_at__lte=timeout),
+                course_id=course_id,
+                item_id=item_id,
+                grading_completed_at=None,
+                cancelled_at=None,
+            )
+            lost_claims = []
+            for _ in range(cls.CLAIM_ATTEMPTS):
+                needed = count - len(reserved)
+                if needed <= 0:
+                    break
+                candidates = list(
+                    cls.objects.filter(is_available).exclude(
+                        pk__in=reserved + lost_claims
+                    ).values_list('pk', flat=True)[:needed]
                 )
-            if not staff_workflows:
-                return None
-
-            workflow = staff_workflows[0]
-            workflow.scorer_id = scorer_id
-            workflow.grading_started_at = now()
-            workflow.save()
-            return workflow.identifying_uuid
+                if not candidates:
+                    break
+
+                # Claim all of the candidates at once, then read back which ones we got. Any that
+                # were claimed by another scorer in the meantime are skipped on the next attempt.
+                claimed_at = now()
+                StaffWorkflow.objects.filter(is_available, pk__in=candidates).update(
+                    scorer_id=scorer_id,
+                    grading_started_at=claimed_at,
+                )
+                claimed = set(
+                    StaffWorkflow.objects.filter(
+                        pk__in=candidates, scorer_id=scorer_id, grading_started_at=claimed_at
+                    ).values_list('pk', flat=True)
+                )
+                reserved.extend(pk for pk in candidates if pk in claimed)
+                lost_claims.extend(pk for pk in candidates if pk not in claimed)
+
+            if not reserved:
+                return []
+            cls.bump_workflow_statistics(course_id, item_id)
+            return [workflow.identifying_uuid for workflow in cls.objects.filter(pk__in=reserved)]
         except DatabaseError as ex:
             error_message = (
-                "An internal error occurred while retrieving a submission for staff grading"
+                "An internal error occurred while reserving submissions for staff grading"
+            )
+            logger.exception(error_message)
+            raise StaffAssessmentInternalError(error_message) from ex
+
+    @classmethod
+    def release_submissions_for_review(cls, course_id, item_id, scorer_id, identifying_uuids):
+        """
+        Give back submissions reserved with get_submissions_for_review that the scorer won't grade after all,
+        so that other staff members can claim them straight away rather than once the reservation times out.
+        The reservations are cleared with a single UPDATE, and submissions the scorer no longer has
+        reserved are left alone.
+
+        Args:
+            course_id (str): The course that the submissions belong to.
+            item_id (str): The student_item that the submissions belong to.
+            scorer_id (str): The user id of the staff member who reserved the submissions.
+            identifying_uuids (list of str): The (team or individual) submissions to release.
+
+        Returns:
+            int: The number of submissions released.
+
+        Raises:
+            StaffAssessmentInternalError: Raised when there is an error updating the workflows.
+        """
+        if not identifying_uuids:
+            return 0
+        try:
+            released = StaffWorkflow.objects.filter(
+                course_id=course_id,
+                item_id=item_id,
+                scorer_id=scorer_id,
+                grading_completed_at=None,
+                **{f'{cls.IDENTIFYING_UUID_LOOKUP}__in': identifying_uuids},
+            ).update(scorer_id='', grading_started_at=None)
+        except DatabaseError as ex:
+            error_message = (
+                "An internal error occurred while releasing submissions reserved for staff grading"
             )
             logger.exception(error_message)
             raise StaffAssessmentInternalError(error_message) from ex
 
+        if released:
+            cls.bump_workflow_statistics(course_id, item_id)
+        return released
+
     @classmethod
     def bulk_retrieve_workflow_status(cls, course_id, item_id, submission_uuids):
         """
@@ -216,6 +418,8 @@ class TeamStaffWorkflow(StaffWorkflow):
     """
     team_submission_uuid = models.CharField(max_length=128, unique=True, null=False)
 
+    IDENTIFYING_UUID_LOOKUP = 'teamstaffworkflow__team_submission_uuid'
+
     @property
     def identifying_uuid(self):
         """
@@ -6,9 +6,10 @@ Django models for training (both student and AI).
 from hashlib import sha1
 import json
 
-from django.core.cache import cache
 from django.db import models
 
+from openassessment.assessment.cache import immutable_cache
+
 from .base import CriterionOption, Rubric
 
 
@@ -83,13 +84,13 @@ class TrainingExample(models.Model):
         """
         # Since training examples are immutable, we can safely cache this
         cache_key = self.cache_key_serialized(attribute="options_selected_dict")
-        options_selected = cache.get(cache_key)
+        options_selected = immutable_cache.get(cache_key)
         if options_selected is None:
             options_selected = {
                 option.criterion.name: option.name
                 for option in self.options_selected.all()
             }
-            cache.set(cache_key, options_selected)
+            immutable_cache.set(cache_key, options_selected)
         return options_selected
 
     def cache_key_serialized(self, attribute=None):
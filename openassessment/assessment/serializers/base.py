@@ -9,8 +9,10 @@ import logging
 from rest_framework import serializers
 from rest_framework.fields import DateTimeField, IntegerField
 
-from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Prefetch, prefetch_related_objects
 
+from openassessment.assessment.cache import immutable_cache
 from openassessment.assessment.models import Assessment, AssessmentPart, Criterion, CriterionOption, Rubric
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -64,8 +66,8 @@ class RubricSerializer(serializers.ModelSerializer):
         """For a given `Rubric` model object, return a serialized version.
 
         This method will attempt to use the cache if possible, first looking at
-        the `local_cache` dict you can pass in, and then looking at whatever
-        Django cache is configured.
+        the `local_cache` dict you can pass in, and then looking at the
+        immutable data cache (in process, then whatever Django cache is configured).
 
         Args:
             rubric (Rubric): The Rubric model to get the serialized form of.
@@ -85,19 +87,21 @@ class RubricSerializer(serializers.ModelSerializer):
         if rubric.content_hash in local_cache:
             return local_cache[rubric.content_hash]
 
-        # Check the external cache (e.g. memcached)
+        # Check the in-process and external caches (e.g. memcached)
         rubric_dict_cache_key = (
             "RubricSerializer.serialized_from_cache.{}"
             .format(rubric.content_hash)
         )
-        rubric_dict = cache.get(rubric_dict_cache_key)
+        rubric_dict = immutable_cache.get(rubric_dict_cache_key)
         if rubric_dict:
             local_cache[rubric.content_hash] = rubric_dict
             return rubric_dict
 
-        # Grab it from the database
+        # Grab it from the database, loading all criteria and options up front
+        # instead of following the relations once per criterion
+        prefetch_related_objects([rubric], 'criteria__options')
         rubric_dict = RubricSerializer(rubric).data
-        cache.set(rubric_dict_cache_key, rubric_dict)
+        immutable_cache.set(rubric_dict_cache_key, rubric_dict)
         local_cache[rubric.content_hash] = rubric_dict
 
         return rubric_dict
@@ -161,18 +165,47 @@ class AssessmentSerializer(serializers.ModelSerializer):
 
 
 def serialize_assessments(assessments_qset):
-    assessments = list(assessments_qset.select_related("rubric"))
-    rubric_cache = {}
+    """
+    Serialize a queryset of assessments, as `full_assessment_dict` would.
 
-    return [
-        full_assessment_dict(
-            assessment,
-            RubricSerializer.serialized_from_cache(
-                assessment.rubric, rubric_cache
-            )
-        )
+    Cached assessments are fetched with a single multi-get. The parts of every
+    assessment that wasn't cached are loaded with one query, and the new
+    serializations are written back to the cache together.
+
+    Args:
+        assessments_qset (QuerySet): The Assessment models to serialize
+
+    Returns:
+        list of dicts, in the order of the queryset
+    """
+    assessments = list(assessments_qset.select_related("rubric"))
+    cache_keys = {
+        assessment.id: _full_assessment_dict_cache_key(assessment)
         for assessment in assessments
+    }
+    cached_dicts = immutable_cache.get_many(list(cache_keys.values()))
+
+    uncached = [
+        assessment for assessment in assessments
+        if cache_keys[assessment.id] not in cached_dicts
     ]
+    if uncached:
+        prefetch_related_objects(uncached, Prefetch(
+            'parts',
+            queryset=AssessmentPart.objects.order_by('criterion__order_num').select_related("criterion", "option")
+        ))
+
+    rubric_cache = {}
+    new_dicts = {}
+    for assessment in uncached:
+        rubric_dict = RubricSerializer.serialized_from_cache(assessment.rubric, rubric_cache)
+        new_dicts[cache_keys[assessment.id]] = _build_full_assessment_dict(
+            assessment, rubric_dict, assessment.parts.all()
+        )
+    immutable_cache.set_many(new_dicts)
+    cached_dicts.update(new_dicts)
+
+    return [cached_dicts[cache_keys[assessment.id]] for assessment in assessments]
 
 
 def full_assessment_dict(assessment, rubric_dict=None):
@@ -190,17 +223,36 @@ def full_assessment_dict(assessment, rubric_dict=None):
     Returns:
         dict with keys 'rubric' (serialized Rubric model) and 'parts' (serialized assessment parts)
     """
-    assessment_cache_key = "assessment.full_assessment_dict.{}.{}.{}".format(
-        assessment.id, assessment.submission_uuid, assessment.scored_at.isoformat()
-    )
-    assessment_dict = cache.get(assessment_cache_key)
+    assessment_cache_key = _full_assessment_dict_cache_key(assessment)
+    assessment_dict = immutable_cache.get(assessment_cache_key)
     if assessment_dict:
         return assessment_dict
 
-    assessment_dict = AssessmentSerializer(assessment).data
     if not rubric_dict:
         rubric_dict = RubricSerializer.serialized_from_cache(assessment.rubric)
+    parts = assessment.parts.order_by('criterion__order_num').all().select_related("criterion", "option")
+    assessment_dict = _build_full_assessment_dict(assessment, rubric_dict, parts)
 
+    immutable_cache.set(assessment_cache_key, assessment_dict)
+
+    return assessment_dict
+
+
+def _full_assessment_dict_cache_key(assessment):
+    """
+    Cache key for the serialized form of an assessment.
+    """
+    return "assessment.full_assessment_dict.{}.{}.{}".format(
+        assessment.id, assessment.submission_uuid, assessment.scored_at.isoformat()
+    )
+
+
+def _build_full_assessment_dict(assessment, rubric_dict, parts):
+    """
+    Serialize an assessment given its serialized rubric and its parts,
+    ordered by criterion, with their criterion and option loaded.
+    """
+    assessment_dict = AssessmentSerializer(assessment).data
     assessment_dict["rubric"] = rubric_dict
 
     # This part looks a little goofy, but it's in the name of saving dozens of
@@ -210,14 +262,14 @@ def full_assessment_dict(assessment, rubric_dict=None):
     # the DB model. Instead of invoking the serializers for `Criterion` and
     # `CriterionOption` again, we simply index into the places we expect them to
     # be from the big, saved `Rubric` serialization.
-    parts = []
-    for part in assessment.parts.order_by('criterion__order_num').all().select_related("criterion", "option"):
+    part_dicts = []
+    for part in parts:
         criterion_dict = dict(rubric_dict["criteria"][part.criterion.order_num])
         options_dict = None
         if part.option is not None:
             options_dict = criterion_dict["options"][part.option.order_num]
             options_dict["criterion"] = criterion_dict
-        parts.append({
+        part_dicts.append({
             "option": options_dict,
             "criterion": criterion_dict,
             "feedback": part.feedback
@@ -225,17 +277,15 @@ def full_assessment_dict(assessment, rubric_dict=None):
 
     # Now manually built up the dynamically calculated values on the
     # `Assessment` so we can again avoid DB calls.
-    assessment_dict["parts"] = parts
+    assessment_dict["parts"] = part_dicts
     assessment_dict["points_earned"] = sum(
         part_dict["option"]["points"]
         if part_dict["option"] is not None else 0
-        for part_dict in parts
+        for part_dict in part_dicts
     )
     assessment_dict["points_possible"] = rubric_dict["points_possible"]
     assessment_dict["id"] = assessment.id
 
-    cache.set(assessment_cache_key, assessment_dict)
-
     return assessment_dict
 
 
@@ -272,14 +322,24 @@ def rubric_from_dict(rubric_dict):
         }
 
     """
-    rubric_dict = deepcopy(rubric_dict)
-
     # Calculate the hash based on the rubric content...
     content_hash = Rubric.content_hash_from_dict(rubric_dict)
 
+    # Rubrics never change once written, so the ID found for a hash can be cached
+    rubric_cache_key = f"rubric_from_dict.{content_hash}"
+    cached_fields = immutable_cache.get(rubric_cache_key)
+    if cached_fields:
+        return Rubric.from_db(
+            router.db_for_read(Rubric),
+            ['id', 'content_hash', 'structure_hash'],
+            [cached_fields['id'], content_hash, cached_fields['structure_hash']],
+        )
+
     try:
         rubric = Rubric.objects.get(content_hash=content_hash)
+        immutable_cache.set(rubric_cache_key, {'id': rubric.id, 'structure_hash': rubric.structure_hash})
     except Rubric.DoesNotExist as ex:
+        rubric_dict = deepcopy(rubric_dict)
         rubric_dict["content_hash"] = content_hash
         rubric_dict["structure_hash"] = Rubric.structure_hash_from_dict(rubric_dict)
         for crit_idx, criterion in enumerate(rubric_dict.get("criteria", {})):
@@ -294,4 +354,8 @@ def rubric_from_dict(rubric_dict):
             raise InvalidRubric(rubric_serializer.errors) from ex
         rubric = rubric_serializer.save()
 
+        # Don't cache the ID of a rubric that might still be rolled back
+        cached_fields = {'id': rubric.id, 'structure_hash': rubric.structure_hash}
+        transaction.on_commit(lambda: immutable_cache.set(rubric_cache_key, cached_fields))
+
     return rubric
@@ -3,9 +3,9 @@ Serializers for the training assessment type.
 """
 
 
-from django.core.cache import cache
 from django.db import IntegrityError, transaction
 
+from openassessment.assessment.cache import immutable_cache
 from openassessment.assessment.data_conversion import update_training_example_answer_format
 from openassessment.assessment.models import TrainingExample
 
@@ -59,14 +59,14 @@ def serialize_training_example(example):
     """
     # Since training examples are immutable, we can safely cache them
     cache_key = example.cache_key_serialized()
-    example_dict = cache.get(cache_key)
+    example_dict = immutable_cache.get(cache_key)
     if example_dict is None:
         example_dict = {
             'answer': update_training_example_answer_format(example.answer),
             'options_selected': example.options_selected_dict,
             'rubric': RubricSerializer.serialized_from_cache(example.rubric),
         }
-        cache.set(cache_key, example_dict)
+        immutable_cache.set(cache_key, example_dict)
     return example_dict
 
 
@@ -173,7 +173,7 @@ def deserialize_training_examples(examples, rubric_dict):
             example_dict['options_selected'],
             rubric
         )
-        example = cache.get(cache_key)
+        example = immutable_cache.get(cache_key)
 
         # If we couldn't retrieve the example from the cache, create it
         if example is None:
@@ -195,7 +195,7 @@ def deserialize_training_examples(examples, rubric_dict):
                     example = TrainingExample.objects.get(content_hash=content_hash)
 
             # Add the example to the cache
-            cache.set(cache_key, example)
+            immutable_cache.set(cache_key, example)
 
         created_examples.append(example)
 
@@ -4,15 +4,21 @@ Tests for the assessment Django models.
 
 
 import copy
+import importlib
+from unittest.mock import patch
 
 import ddt
+from django.apps import apps
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from submissions.api import create_submission
+from openassessment.assessment.api import self as self_api, staff as staff_api
 from openassessment.assessment.api.self import create_assessment
 from openassessment.assessment.errors import SelfAssessmentRequestError
 from openassessment.assessment.models import Assessment, AssessmentPart, InvalidRubricSelection
 from openassessment.assessment.serializers import rubric_from_dict
-from openassessment.test_utils import CacheResetTest
+from openassessment.test_utils import CacheResetTest, _clear_all_caches
 
 from .constants import RUBRIC
 
@@ -101,6 +107,83 @@ class AssessmentTest(CacheResetTest):
         self.assertEqual(assessment.points_earned, 0)
         self.assertEqual(assessment.points_possible, 0)
 
+    def test_stored_points(self):
+        rubric = self._rubric_with_one_feedback_only_criterion()
+        assessment = Assessment.create(rubric, "Bob", "submission UUID", "PE")
+        AssessmentPart.create_from_option_names(
+            assessment, {"vøȼȺƀᵾłȺɍɏ": "𝓰𝓸𝓸𝓭", "ﻭɼค๓๓คɼ": "єχ¢єℓℓєηт"}, feedback={"feedback": ""}
+        )
+
+        # Scores are read from the assessment row, without loading the parts or the rubric
+        assessment = Assessment.objects.get(pk=assessment.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual((assessment.points_earned, assessment.points_possible), (3, 4))
+
+        # Rows without stored scores fall back to computing them
+        Assessment.objects.filter(pk=assessment.pk).update(stored_points_earned=None, stored_points_possible=None)
+        assessment = Assessment.objects.get(pk=assessment.pk)
+        self.assertEqual((assessment.points_earned, assessment.points_possible), (3, 4))
+
+    def test_create_with_parts_stores_points_on_insert(self):
+        rubric = self._rubric_with_one_feedback_only_criterion()
+        rubric.index  # pylint: disable=pointless-statement
+
+        with CaptureQueriesContext(connection) as queries:
+            assessment = Assessment.create(
+                rubric, "Bob", "submission UUID", "PE",
+                options_selected={"vøȼȺƀᵾłȺɍɏ": "𝓰𝓸𝓸𝓭", "ﻭɼค๓๓คɼ": "єχ¢єℓℓєηт"},
+                criterion_feedback={"feedback": ""},
+            )
+
+        # The scores are part of the INSERT, rather than written by an UPDATE afterwards
+        self.assertFalse([query for query in queries.captured_queries if query['sql'].startswith('UPDATE')])
+        assessment = Assessment.objects.get(pk=assessment.pk)
+        self.assertEqual((assessment.stored_points_earned, assessment.stored_points_possible), (3, 4))
+        self.assertEqual(assessment.parts.count(), 3)
+
+    def test_create_with_invalid_parts(self):
+        rubric = self._rubric_with_one_feedback_only_criterion()
+        with self.assertRaises(InvalidRubricSelection):
+            Assessment.create(rubric, "Bob", "submission UUID", "PE", options_selected={"vøȼȺƀᵾłȺɍɏ": "𝓰𝓸𝓸𝓭"})
+
+        # Nothing is saved when the selections don't match the rubric
+        self.assertFalse(Assessment.objects.exists())
+
+    def test_backfill_stored_points(self):
+        backfill_migration = importlib.import_module(
+            'openassessment.assessment.migrations.0013_backfill_assessment_stored_points'
+        )
+        rubric = self._rubric_with_one_feedback_only_criterion()
+        selections = [
+            {"vøȼȺƀᵾłȺɍɏ": "𝓰𝓸𝓸𝓭", "ﻭɼค๓๓คɼ": "єχ¢єℓℓєηт"},
+            {"vøȼȺƀᵾłȺɍɏ": "𝒑𝒐𝒐𝒓", "ﻭɼค๓๓คɼ": "𝓰𝓸𝓸𝓭"},
+        ]
+        for selected in selections:
+            assessment = Assessment.create(rubric, "Bob", "submission UUID", "PE")
+            AssessmentPart.create_from_option_names(assessment, selected, feedback={"feedback": ""})
+        all_feedback_assessment = Assessment.create(
+            self._rubric_with_all_feedback_only_criteria(), "Bob", "submission UUID", "PE"
+        )
+        expected = {
+            assessment.id: (assessment.points_earned, assessment.points_possible)
+            for assessment in Assessment.objects.all()
+        }
+        self.assertEqual(expected[all_feedback_assessment.id], (0, 0))
+
+        Assessment.objects.update(stored_points_earned=None, stored_points_possible=None)
+        with patch.object(backfill_migration, 'BATCH_SIZE', 2):
+            backfill_migration.backfill_stored_points(apps, None)
+
+        self.assertEqual(
+            {
+                assessment_id: (points_earned, points_possible)
+                for assessment_id, points_earned, points_possible in Assessment.objects.values_list(
+                    'id', 'stored_points_earned', 'stored_points_possible'
+                )
+            },
+            expected,
+        )
+
     def test_default_feedback_for_feedback_only_criterion(self):
         rubric = self._rubric_with_one_feedback_only_criterion()
         assessment = Assessment.create(rubric, "Bob", "submission UUID", "PE")
@@ -139,6 +222,42 @@ class AssessmentTest(CacheResetTest):
         with self.assertRaises(InvalidRubricSelection):
             AssessmentPart.create_from_option_names(assessment, selected, feedback=feedback)
 
+    @ddt.data(self_api, staff_api)
+    def test_create_assessment_queries_independent_of_criteria(self, assessment_api):
+        # Once a rubric exists, creating an assessment against it takes the same
+        # number of queries however many criteria the rubric has.
+        num_queries = []
+        for num_criteria in (2, 4):
+            rubric_dict = {
+                'criteria': [
+                    {
+                        'name': f'criterion {criterion_num}',
+                        'prompt': f'Criterion {criterion_num}?',
+                        'options': [
+                            {'name': f'option {option_num}', 'points': option_num, 'explanation': ''}
+                            for option_num in range(3)
+                        ],
+                    }
+                    for criterion_num in range(num_criteria)
+                ]
+            }
+            rubric_from_dict(rubric_dict)
+            _clear_all_caches()
+
+            student_item = {
+                'student_id': 'Bob',
+                'item_id': f'item {num_criteria}',
+                'course_id': 'course',
+                'item_type': 'openassessment',
+            }
+            submission = create_submission(student_item, "Bob's answer")
+            options_selected = {f'criterion {criterion_num}': 'option 1' for criterion_num in range(num_criteria)}
+            with CaptureQueriesContext(connection) as queries:
+                assessment_api.create_assessment(submission['uuid'], 'Bob', options_selected, {}, '', rubric_dict)
+            num_queries.append(len(queries))
+
+        self.assertEqual(num_queries[0], num_queries[1])
+
     def _rubric_with_one_feedback_only_criterion(self):
         """Create a rubric with one feedback-only criterion."""
         rubric_dict = copy.deepcopy(RUBRIC)
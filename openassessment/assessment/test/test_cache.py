@@ -0,0 +1,134 @@
+"""
+Tests for the two-level immutable data cache.
+"""
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from submissions.api import create_submission
+from openassessment.assessment.api import self as self_api
+from openassessment.assessment.cache import LocalLRUCache, TieredCache, bump_cache_version, immutable_cache
+from openassessment.assessment.test.constants import OPTIONS_SELECTED_DICT, RUBRIC
+from openassessment.test_utils import CacheResetTest
+
+
+class LocalLRUCacheTest(CacheResetTest):
+    """ Tests for the in-process LRU tier """
+
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRUCache(max_entries=2)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        self.assertEqual(lru.get('a'), 1)
+
+        # 'b' is now the least recently used
+        lru.set('c', 3)
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual((lru.get('a'), lru.get('c')), (1, 3))
+
+    def test_size_limit(self):
+        lru = LocalLRUCache(max_entries=10, max_size=10)
+        lru.set('a', 'a', size=6)
+        lru.set('b', 'b', size=4)
+        lru.set('c', 'c', size=3)
+        self.assertEqual(lru.get('a', 'missing'), 'missing')
+        self.assertEqual((lru.get('b'), lru.get('c')), ('b', 'c'))
+
+        # Values bigger than the whole cache are never kept
+        lru.set('d', 'd', size=11)
+        self.assertIsNone(lru.get('d'))
+        self.assertEqual(len(lru), 2)
+
+    def test_replace_delete_and_clear(self):
+        lru = LocalLRUCache(max_entries=10, max_size=10)
+        lru.set('a', 'a', size=8)
+        lru.set('a', 'A', size=2)
+        lru.set('b', 'b', size=8)
+        self.assertEqual((lru.get('a'), lru.get('b')), ('A', 'b'))
+
+        lru.delete('a')
+        lru.delete('not cached')
+        self.assertIsNone(lru.get('a'))
+
+        lru.clear()
+        self.assertEqual(len(lru), 0)
+
+
+class TieredCacheTest(CacheResetTest):
+    """ Tests for the in-process LRU in front of the Django cache """
+
+    def setUp(self):
+        super().setUp()
+        self.tiered_cache = TieredCache(max_entries=10)
+
+    def test_tiers(self):
+        self.assertIsNone(self.tiered_cache.get('key'))
+
+        self.tiered_cache.set('key', {'points': [1, 2]})
+        self.assertEqual(cache.get('key'), {'points': [1, 2]})
+        self.assertEqual(self.tiered_cache.get('key'), {'points': [1, 2]})
+
+        # Once the in-process tier is empty, the Django cache is used and the in-process tier refilled
+        self.tiered_cache.clear_local()
+        self.assertEqual(self.tiered_cache.get('key'), {'points': [1, 2]})
+        self.assertEqual(self.tiered_cache.get('key'), {'points': [1, 2]})
+
+        self.assertEqual(self.tiered_cache.stats, {'local_hits': 2, 'remote_hits': 1, 'misses': 1})
+        self.tiered_cache.reset_stats()
+        self.assertEqual(self.tiered_cache.stats, {'local_hits': 0, 'remote_hits': 0, 'misses': 0})
+
+    def test_many(self):
+        self.tiered_cache.set_many({'a': 1, 'b': 2})
+        self.tiered_cache.clear_local()
+        self.tiered_cache.set('c', 3)
+
+        self.assertEqual(self.tiered_cache.get_many(['a', 'b', 'c', 'd']), {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(self.tiered_cache.stats, {'local_hits': 1, 'remote_hits': 2, 'misses': 1})
+        self.assertEqual(self.tiered_cache.get_many(['a', 'b']), {'a': 1, 'b': 2})
+        self.assertEqual(self.tiered_cache.stats['local_hits'], 3)
+
+    def test_values_are_copied(self):
+        self.tiered_cache.set('key', {'points': [1, 2]})
+        self.tiered_cache.get('key')['points'].append(3)
+        self.assertEqual(self.tiered_cache.get('key'), {'points': [1, 2]})
+
+    def test_falsy_values(self):
+        self.tiered_cache.set('key', {})
+        self.assertEqual(self.tiered_cache.get('key', 'missing'), {})
+        self.assertEqual(self.tiered_cache.stats['local_hits'], 1)
+
+    def test_assessment_served_in_process(self):
+        # Creating an assessment caches its serialized form and its rubric
+        submission = create_submission(
+            {'student_id': 'Bob', 'item_id': 'item', 'course_id': 'course', 'item_type': 'openassessment'},
+            "Bob's answer",
+        )
+        self_api.create_assessment(
+            submission['uuid'], 'Bob', OPTIONS_SELECTED_DICT['most']['options'], {}, '', RUBRIC
+        )
+
+        # Serializing it again doesn't go to the Django cache at all
+        immutable_cache.reset_stats()
+        with patch('openassessment.assessment.cache.cache') as mock_cache:
+            assessment = self_api.get_assessment(submission['uuid'])
+        mock_cache.get.assert_not_called()
+        mock_cache.get_many.assert_not_called()
+        self.assertEqual(assessment['submission_uuid'], submission['uuid'])
+        self.assertEqual(immutable_cache.stats, {'local_hits': 1, 'remote_hits': 0, 'misses': 0})
+
+
+class BumpCacheVersionTest(CacheResetTest):
+    """ Tests for the cache version counters """
+
+    def test_bump(self):
+        bump_cache_version('version')
+        self.assertEqual(cache.get('version'), 1)
+        bump_cache_version('version')
+        self.assertEqual(cache.get('version'), 2)
+
+    def test_evicted_between_add_and_incr(self):
+        cache.set('version', 3, None)
+        with patch.object(cache, 'incr', side_effect=ValueError):
+            bump_cache_version('version')
+        self.assertEqual(cache.get('version'), 1)
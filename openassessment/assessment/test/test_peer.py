@@ -181,7 +181,7 @@ class TestPeerApi(CacheResetTest):
     Tests for the peer assessment API functions.
     """
 
-    CREATE_ASSESSMENT_NUM_QUERIES = 38
+    CREATE_ASSESSMENT_NUM_QUERIES = 26
 
     def test_create_assessment_points(self):
         self._create_student_and_submission("Tim", "Tim's answer")
@@ -256,6 +256,134 @@ class TestPeerApi(CacheResetTest):
         self.assertEqual(students_waiting[0]['graded_by'], 0)
         self.assertEqual(students_waiting[0]['graded'], 1)
 
+    def test_get_waiting_step_details_workflow_status(self):
+        """
+        Waiting step details can be joined against assessment workflow statuses,
+        sorted and paginated, and counted by status.
+        """
+        submissions = {}
+        for name, status in (("Tim", "waiting"), ("Bob", "done"), ("Sue", "waiting"), ("Ann", "peer")):
+            submissions[name], _ = self._create_student_and_submission(name, f"{name}'s answer")
+            AssessmentWorkflow.objects.filter(submission_uuid=submissions[name]['uuid']).update(status=status)
+
+        # Bob has graded a peer, so he comes first when sorting by `graded` descending
+        peer_api.get_submission_to_assess(submissions["Bob"]['uuid'], 1)
+        peer_api.create_assessment(
+            submissions["Bob"]["uuid"],
+            "Bob",
+            ASSESSMENT_DICT['options_selected'],
+            ASSESSMENT_DICT['criterion_feedback'],
+            ASSESSMENT_DICT['overall_feedback'],
+            RUBRIC_DICT,
+            REQUIRED_GRADED_BY,
+        )
+
+        with self.assertNumQueries(1):
+            students_waiting = peer_api.get_waiting_step_details(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                None,
+                must_be_graded_by=2,
+                workflow_status_list=["waiting", "done"],
+            )
+        self.assertEqual(
+            [(student['student_id'], student['workflow_status']) for student in students_waiting],
+            [("Tim", "waiting"), ("Bob", "done"), ("Sue", "waiting")],
+        )
+
+        students_waiting = peer_api.get_waiting_step_details(
+            STUDENT_ITEM['course_id'],
+            STUDENT_ITEM['item_id'],
+            None,
+            must_be_graded_by=2,
+            workflow_status_list=["waiting", "done"],
+            sort_by='graded',
+            descending=True,
+            offset=1,
+            limit=1,
+        )
+        self.assertEqual([student['student_id'] for student in students_waiting], ["Sue"])
+
+        with self.assertNumQueries(1):
+            status_counts = peer_api.get_waiting_step_status_counts(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                2,
+                ["waiting", "done"],
+            )
+        self.assertEqual(status_counts, {"waiting": 2, "done": 1})
+
+        # Both can be read from the read replica, when asked to
+        with patch('openassessment.data.use_read_replica', side_effect=lambda queryset: queryset) as mock_replica:
+            peer_api.get_waiting_step_details(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                None,
+                must_be_graded_by=2,
+                workflow_status_list=["waiting", "done"],
+            )
+            mock_replica.assert_not_called()
+            peer_api.get_waiting_step_details(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                None,
+                must_be_graded_by=2,
+                workflow_status_list=["waiting", "done"],
+                read_replica=True,
+            )
+            peer_api.get_waiting_step_status_counts(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                2,
+                ["waiting", "done"],
+                read_replica=True,
+            )
+        self.assertEqual(mock_replica.call_count, 2)
+
+        with self.assertRaises(ValueError):
+            peer_api.get_waiting_step_details(
+                STUDENT_ITEM['course_id'],
+                STUDENT_ITEM['item_id'],
+                None,
+                must_be_graded_by=2,
+                sort_by='student_id',
+            )
+
+    def test_graded_counts_maintained(self):
+        """
+        The denormalised assessment counts on peer workflows follow the assessments created.
+        """
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer")
+        bob_sub, bob = self._create_student_and_submission("Bob", "Bob's answer")
+        sue_sub, sue = self._create_student_and_submission("Sue", "Sue's answer")
+        for sub, student in ((bob_sub, bob), (sue_sub, sue)):
+            peer_api.get_submission_to_assess(sub['uuid'], 1)
+            peer_api.create_assessment(
+                sub["uuid"],
+                student["student_id"],
+                ASSESSMENT_DICT['options_selected'],
+                ASSESSMENT_DICT['criterion_feedback'],
+                ASSESSMENT_DICT['overall_feedback'],
+                RUBRIC_DICT,
+                REQUIRED_GRADED_BY,
+            )
+
+        workflows = {
+            workflow.student_id: workflow
+            for workflow in PeerWorkflow.objects.filter(course_id=STUDENT_ITEM['course_id'])
+        }
+        self.assertEqual(
+            {student_id: workflow.graded_count for student_id, workflow in workflows.items()},
+            {"Tim": 0, "Bob": 1, "Sue": 1},
+        )
+        self.assertEqual(sum(workflow.graded_by_count for workflow in workflows.values()), 2)
+        self.assertEqual(
+            PeerWorkflow.count_graded([workflow.id for workflow in workflows.values()]),
+            {workflow.id: (workflow.graded_count, workflow.graded_by_count) for workflow in workflows.values()},
+        )
+        self.assertEqual(peer_api.get_graded_by_count(tim_sub['uuid']), workflows["Tim"].graded_by_count)
+        self.assertEqual(workflows["Bob"].num_peers_graded(), 1)
+
     def test_get_bulk_scored_assessments(self):
         # Create three learners and submissions
         submission_and_learner = [self._create_student_and_submission(f"Learner{i}", f"{i} answer") for i in [0, 1, 2]]
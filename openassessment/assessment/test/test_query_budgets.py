@@ -0,0 +1,97 @@
+"""
+Query budgets for the peer assessment and workflow APIs.
+
+A budget failing means a change added queries to one of these paths; the failure lists
+the SQL of every query made. Raise a budget only when the new queries are intended.
+"""
+
+
+from submissions import api as sub_api
+
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.test.constants import ANSWER, OPTIONS_SELECTED_DICT, RUBRIC, STUDENT_ITEM
+from openassessment.test_utils import CacheResetTest, QueryBudgetMixin
+from openassessment.workflow import api as workflow_api
+
+COURSE_SETTINGS = {}
+
+
+class TestPeerQueryBudgets(QueryBudgetMixin, CacheResetTest):
+    """
+    Query budgets for finding, creating and scoring peer assessments.
+    """
+
+    GET_SUBMISSION_TO_ASSESS_QUERIES = 15
+    CREATE_ASSESSMENT_QUERIES = 27
+    UPDATE_FROM_ASSESSMENTS_QUERIES = 45
+    # Scoring marks each assessment which counts towards the grade, once
+    UPDATE_FROM_ASSESSMENTS_QUERIES_PER_GRADER = 1
+
+    @staticmethod
+    def _create_submission(student_id, item_id):
+        """ Create a submission with a peer workflow, returning it with its student item. """
+        student_item = dict(STUDENT_ITEM, student_id=student_id, item_id=item_id)
+        submission = sub_api.create_submission(student_item, ANSWER)
+        peer_api.on_start(submission['uuid'])
+        workflow_api.create_workflow(submission['uuid'], ['peer'])
+        return submission, student_item
+
+    @staticmethod
+    def _assess(scorer_submission, scorer_item, num_required_grades):
+        """ Have the scorer assess the submission they were given. """
+        return peer_api.create_assessment(
+            scorer_submission['uuid'],
+            scorer_item['student_id'],
+            OPTIONS_SELECTED_DICT['most']['options'],
+            {},
+            "",
+            RUBRIC,
+            num_required_grades,
+        )
+
+    def _queries_to_get_submission(self, item_id, num_peers):
+        """ Queries made to pick a submission to assess among `num_peers` waiting ones. """
+        for index in range(num_peers):
+            self._create_submission(f'peer_{index}', item_id)
+        scorer_submission, _ = self._create_submission('scorer', item_id)
+        with self.assertMaxNumQueries(self.GET_SUBMISSION_TO_ASSESS_QUERIES) as queries:
+            peer_api.get_submission_to_assess(scorer_submission['uuid'], 3)
+        return queries.captured_queries
+
+    def test_get_submission_to_assess(self):
+        queries_for_one = self._queries_to_get_submission('few_peers', 1)
+        queries_for_many = self._queries_to_get_submission('many_peers', 20)
+        self.assertQueriesPerItem(queries_for_one, queries_for_many, 19, 0)
+
+    def test_create_assessment(self):
+        self._create_submission('peer', 'create_assessment')
+        scorer_submission, scorer_item = self._create_submission('scorer', 'create_assessment')
+        peer_api.get_submission_to_assess(scorer_submission['uuid'], 1)
+
+        with self.assertMaxNumQueries(self.CREATE_ASSESSMENT_QUERIES):
+            self._assess(scorer_submission, scorer_item, 1)
+
+    def _queries_to_update_workflow(self, item_id, num_graders):
+        """ Queries made to score a submission assessed by `num_graders` peers. """
+        submission, student_item = self._create_submission('learner', item_id)
+        graders = [self._create_submission(f'grader_{index}', item_id) for index in range(num_graders)]
+        for grader_submission, grader_item in graders:
+            peer_api.get_submission_to_assess(grader_submission['uuid'], num_graders)
+            self._assess(grader_submission, grader_item, num_graders)
+
+        # The learner grades a peer in turn, so that the submission can be scored
+        peer_api.get_submission_to_assess(submission['uuid'], num_graders)
+        self._assess(submission, student_item, num_graders)
+
+        requirements = {'peer': {'must_grade': 1, 'must_be_graded_by': num_graders}}
+        with self.assertMaxNumQueries(self.UPDATE_FROM_ASSESSMENTS_QUERIES) as queries:
+            workflow = workflow_api.update_from_assessments(submission['uuid'], requirements, COURSE_SETTINGS)
+        self.assertEqual(workflow['status'], 'done')
+        return queries.captured_queries
+
+    def test_update_from_assessments(self):
+        queries_for_one = self._queries_to_update_workflow('one_grader', 1)
+        queries_for_many = self._queries_to_update_workflow('many_graders', 5)
+        self.assertQueriesPerItem(
+            queries_for_one, queries_for_many, 4, self.UPDATE_FROM_ASSESSMENTS_QUERIES_PER_GRADER
+        )
@@ -3,8 +3,9 @@ Tests for assessment models.
 """
 
 import copy
+from unittest.mock import patch
 
-from openassessment.assessment.models import Criterion, CriterionOption, InvalidRubricSelection, Rubric
+from openassessment.assessment.models import Criterion, CriterionOption, InvalidRubricSelection, Rubric, RubricIndex
 from openassessment.assessment.test.constants import RUBRIC
 from openassessment.test_utils import CacheResetTest
 
@@ -149,6 +150,28 @@ class RubricIndexTest(CacheResetTest):
         with self.assertRaises(InvalidRubricSelection):
             self.rubric.index.find_option_for_points("test criterion 1", 10)
 
+    def test_index_shared_by_content_hash(self):
+        rubric_index = self.rubric.index
+
+        # Another instance of the same rubric reuses the index without querying
+        with self.assertNumQueries(0):
+            self.assertIs(Rubric(pk=self.rubric.pk, content_hash=self.rubric.content_hash).index, rubric_index)
+
+        # ... but a different rubric row with the same hash does not
+        other_rubric = Rubric(pk=self.rubric.pk + 1, content_hash=self.rubric.content_hash)
+        self.assertIsNot(other_rubric.index, rubric_index)
+
+    @patch.object(RubricIndex._cache, 'max_entries', 1)  # pylint: disable=protected-access
+    def test_index_cache_evicts_least_recently_used(self):
+        other_rubric = Rubric.objects.create(content_hash="other rubric")
+        self.rubric.index  # pylint: disable=pointless-statement
+        other_rubric.index  # pylint: disable=pointless-statement
+
+        # The first rubric's index was evicted, so it is loaded again
+        rubric = Rubric.objects.get(pk=self.rubric.pk)
+        with self.assertNumQueries(2):
+            rubric.index  # pylint: disable=pointless-statement
+
 
 class RubricHashTest(CacheResetTest):
     """
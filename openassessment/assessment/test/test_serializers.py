@@ -5,11 +5,15 @@ Tests for assessment serializers.
 import copy
 import json
 import os.path
+from unittest import mock
 
+from django.core.cache import cache
+
+from openassessment.assessment.cache import immutable_cache
 from openassessment.assessment.models import Assessment, AssessmentFeedback, AssessmentPart
 from openassessment.assessment.serializers import (AssessmentFeedbackSerializer, InvalidRubric, full_assessment_dict,
-                                                   rubric_from_dict)
-from openassessment.test_utils import CacheResetTest
+                                                   rubric_from_dict, serialize_assessments)
+from openassessment.test_utils import CacheResetTest, _clear_all_caches
 
 from .constants import RUBRIC
 
@@ -37,6 +41,25 @@ class RubricDeserializationTest(CacheResetTest):
         self.assertEqual(rubric_i.id, rubric_j.id)
         rubric_i.delete()
 
+    def test_rubric_id_cached(self):
+        rubric_data = json_data('data/rubric/project_plan_rubric.json')
+
+        # The ID of a new rubric is cached once it's committed
+        with self.captureOnCommitCallbacks(execute=True):
+            rubric = rubric_from_dict(rubric_data)
+
+        with self.assertNumQueries(0):
+            cached_rubric = rubric_from_dict(rubric_data)
+        self.assertEqual(cached_rubric, rubric)
+        self.assertEqual(cached_rubric.structure_hash, rubric.structure_hash)
+        self.assertEqual(cached_rubric.points_possible, rubric.points_possible)
+
+        # Lookups of existing rubrics are cached too
+        _clear_all_caches()
+        rubric_from_dict(rubric_data)
+        with self.assertNumQueries(0):
+            self.assertEqual(rubric_from_dict(rubric_data), rubric)
+
     def test_rubric_requires_positive_score(self):
         with self.assertRaises(InvalidRubric):
             rubric_from_dict(json_data('data/rubric/no_points.json'))
@@ -153,3 +176,47 @@ class AssessmentSerializerTest(CacheResetTest):
         # Verify that the assessment dict correctly serialized the criterion with no options.
         self.assertIs(serialized['parts'][2]['option'], None)
         self.assertEqual(serialized['parts'][2]['criterion']['name'], "feedback only")
+
+    def test_serialize_assessments_batched(self):
+        rubric = rubric_from_dict(RUBRIC)
+        selected = {
+            "vøȼȺƀᵾłȺɍɏ": "𝓰𝓸𝓸𝓭",
+            "ﻭɼค๓๓คɼ": "єχ¢єℓℓєηт",
+        }
+        for scorer_num in range(5):
+            assessment = Assessment.create(rubric, f"scorer-{scorer_num}", "submission-UUID", "PE")
+            AssessmentPart.create_from_option_names(assessment, selected)
+        assessments = Assessment.objects.filter(submission_uuid="submission-UUID").order_by('id')
+        _clear_all_caches()
+
+        # One query for the assessments, one for all of their parts, two for the rubric
+        with self.assertNumQueries(4):
+            serialized = serialize_assessments(assessments)
+        expected = [full_assessment_dict(assessment) for assessment in assessments]
+        self.assertEqual(self._summarize(serialized), self._summarize(expected))
+
+        # Assessments missing from the in-process cache are fetched from the Django cache with one multi-get
+        immutable_cache.clear_local()
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as mock_get_many:
+            with self.assertNumQueries(1):
+                self.assertEqual(self._summarize(serialize_assessments(assessments)), self._summarize(expected))
+        self.assertEqual(mock_get_many.call_count, 1)
+
+        # After which they are all served in process
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as mock_get_many:
+            serialize_assessments(assessments)
+        mock_get_many.assert_not_called()
+
+    @staticmethod
+    def _summarize(assessment_dicts):
+        """ Serialized assessments refer back to themselves, so compare the fields that matter """
+        return [
+            (
+                assessment_dict['id'],
+                assessment_dict['scorer_id'],
+                assessment_dict['points_earned'],
+                assessment_dict['points_possible'],
+                [(part['criterion']['name'], part['option']['name']) for part in assessment_dict['parts']],
+            )
+            for assessment_dict in assessment_dicts
+        ]
@@ -4,12 +4,17 @@ Tests for staff assessments.
 
 import copy
 from datetime import timedelta
+import threading
+import time
 from unittest import mock
 
 from ddt import data, ddt, unpack
 from freezegun import freeze_time
 
-from django.db import DatabaseError
+from django.core.cache import cache
+from django.db import DatabaseError, OperationalError, connection
+from django.db.models import QuerySet
+from django.test.utils import override_settings
 from django.utils.timezone import now
 
 from submissions import api as sub_api
@@ -19,7 +24,7 @@ from openassessment.assessment.api.peer import create_assessment as peer_assess
 from openassessment.assessment.api.self import create_assessment as self_assess
 from openassessment.assessment.errors import StaffAssessmentInternalError, StaffAssessmentRequestError
 from openassessment.assessment.models import Assessment, StaffWorkflow, TeamStaffWorkflow
-from openassessment.test_utils import CacheResetTest
+from openassessment.test_utils import CacheResetTest, TransactionCacheResetTest
 from openassessment.tests.factories import StaffWorkflowFactory, TeamStaffWorkflowFactory, AssessmentFactory
 from openassessment.workflow import api as workflow_api
 
@@ -496,6 +501,36 @@ class TestStaffAssessment(CacheResetTest):
         submission = staff_api.get_submission_to_assess('test_course_id', 'test_item_id', tim['student_id'])
         self.assertIsNone(submission)
 
+    def test_fetch_next_submissions(self):
+        bob_sub, _ = self._create_student_and_submission("bob", "bob's answer")
+        sally_sub, _ = self._create_student_and_submission("sally", "sally's answer")
+        _, tim = self._create_student_and_submission("Tim", "Tim's answer")
+
+        submissions = staff_api.get_submissions_to_assess(tim['course_id'], tim['item_id'], tim['student_id'], 2)
+        self.assertEqual(submissions, [bob_sub, sally_sub])
+
+        # The same data is returned whether or not the submissions are cached
+        cache.clear()
+        with self.assertNumQueries(4):
+            uncached_submissions = staff_api.get_submissions_to_assess(
+                tim['course_id'], tim['item_id'], tim['student_id'], 2
+            )
+        self.assertEqual(uncached_submissions, submissions)
+
+    def test_fetch_next_submissions_none_available(self):
+        _, tim = self._create_student_and_submission("Tim", "Tim's answer")
+        submissions = staff_api.get_submissions_to_assess('test_course_id', 'test_item_id', tim['student_id'], 3)
+        self.assertEqual(submissions, [])
+
+    def test_fetch_next_submissions_error(self):
+        self._create_student_and_submission("bob", "bob's answer")
+        _, tim = self._create_student_and_submission("Tim", "Tim's answer")
+        cache.clear()
+        with mock.patch('openassessment.assessment.api.staff.Submission.objects.filter') as patched_filter:
+            patched_filter.side_effect = DatabaseError
+            with self.assertRaises(staff_api.StaffAssessmentInternalError):
+                staff_api.get_submissions_to_assess(tim['course_id'], tim['item_id'], tim['student_id'], 2)
+
     def test_cancel_staff_workflow(self):
         tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer")
         workflow_api.cancel_workflow(tim_sub['uuid'], "Test Cancel", "Bob", {}, {})
@@ -671,6 +706,47 @@ class BaseStaffWorkflowModelTestMixin():
             stats
         )
 
+    def test_get_workflow_statistics_single_query(self):
+        self._create_graded()
+        self._create_ungraded()
+        self._create_in_progress()
+
+        with self.assertNumQueries(1):
+            self.model.get_workflow_statistics(self.course_id, self.item_id)
+
+    def test_get_workflow_statistics_cached(self):
+        self._create_ungraded()
+        self._create_ungraded()
+        expected_stats = {'graded': 0, 'ungraded': 2, 'in-progress': 0}
+        self.assertDictEqual(expected_stats, self.model.get_workflow_statistics(self.course_id, self.item_id))
+
+        # Served from the cache
+        with self.assertNumQueries(0):
+            self.assertDictEqual(expected_stats, self.model.get_workflow_statistics(self.course_id, self.item_id))
+
+        # Claiming a workflow invalidates the cached statistics
+        self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
+        self.assertDictEqual(
+            {'graded': 0, 'ungraded': 1, 'in-progress': 1},
+            self.model.get_workflow_statistics(self.course_id, self.item_id)
+        )
+
+        # So does completing one
+        workflow = self.get_workflow_by_identifying_uuid(
+            self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
+        )
+        workflow.close_active_assessment(AssessmentFactory.create(), self.scorer_1_id)
+        self.assertDictEqual(
+            {'graded': 1, 'ungraded': 1, 'in-progress': 0},
+            self.model.get_workflow_statistics(self.course_id, self.item_id)
+        )
+
+    @override_settings(ORA_STAFF_GRADING_STATISTICS_CACHE_TIMEOUT=0)
+    def test_get_workflow_statistics_cache_disabled(self):
+        self.model.get_workflow_statistics(self.course_id, self.item_id)
+        with self.assertNumQueries(1):
+            self.model.get_workflow_statistics(self.course_id, self.item_id)
+
     def _get_and_assert_workflow(self, expected_workflow):
         """
         Call get_submission_for_review for course_id, item_id, and scorer_1_id
@@ -742,12 +818,170 @@ class BaseStaffWorkflowModelTestMixin():
         submission_uuid = self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
         self.assertIsNone(submission_uuid)
 
+    def test_get_submission_for_review_lost_claim(self):
+        """
+        When another scorer claims the candidate workflow first, claim the next available one
+        """
+        first = self._create_ungraded()
+        second = self._create_ungraded()
+
+        # Simulate a scorer that picked `first` as its candidate, but loses the race for it
+        original_update = QuerySet.update
+        claimed_by_other_scorer = []
+
+        def update_after_other_scorer(queryset, **kwargs):
+            if not claimed_by_other_scorer:
+                claimed_by_other_scorer.append(None)
+                claimed_by_other_scorer[0] = self.model.get_submission_for_review(
+                    self.course_id, self.item_id, self.scorer_2_id
+                )
+            return original_update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', autospec=True, side_effect=update_after_other_scorer):
+            submission_uuid = self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
+
+        self.assertEqual(claimed_by_other_scorer, [first.identifying_uuid])
+        self.assertEqual(submission_uuid, second.identifying_uuid)
+        self.assertEqual(self.get_workflow_by_identifying_uuid(first.identifying_uuid).scorer_id, self.scorer_2_id)
+        self.assertEqual(self.get_workflow_by_identifying_uuid(second.identifying_uuid).scorer_id, self.scorer_1_id)
+
+    def test_get_submission_for_review_queries(self):
+        """
+        Claiming a workflow takes a fixed number of queries, however many workflows there are
+        """
+        for _ in range(10):
+            self._create_ungraded()
+
+        # Look for the scorer's own workflow, pick a candidate, claim it
+        with self.assertNumQueries(3):
+            self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
+
+        # Find the scorer's own workflow, extend the lease on it
+        with self.assertNumQueries(2):
+            self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
+
+    def test_get_submissions_for_review(self):
+        """
+        Reserving several submissions includes the scorer's own in-progress workflows, and never
+        anything reserved by another scorer
+        """
+        self._create_graded(scorer_id=self.scorer_1_id)
+        other_in_progress = self._create_in_progress(scorer_id=self.scorer_2_id)
+        own_in_progress = self._create_in_progress(scorer_id=self.scorer_1_id)
+        ungraded = [self._create_ungraded() for _ in range(4)]
+
+        scorer_1_uuids = self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 3)
+        self.assertEqual(
+            scorer_1_uuids,
+            [own_in_progress.identifying_uuid, ungraded[0].identifying_uuid, ungraded[1].identifying_uuid],
+        )
+        for uuid in scorer_1_uuids:
+            workflow = self.get_workflow_by_identifying_uuid(uuid)
+            self.assertEqual(workflow.scorer_id, self.scorer_1_id)
+            self.assertEqual(workflow.grading_started_at, now())
+
+        # The second scorer only gets their own workflow and what is left over
+        scorer_2_uuids = self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_2_id, 10)
+        self.assertEqual(
+            scorer_2_uuids,
+            [other_in_progress.identifying_uuid, ungraded[2].identifying_uuid, ungraded[3].identifying_uuid],
+        )
+
+        # Asking again returns the same reservations
+        self.assertEqual(
+            self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 3),
+            scorer_1_uuids,
+        )
+
+    def test_get_submissions_for_review_no_available(self):
+        self._create_graded(scorer_id=self.scorer_1_id)
+        self._create_in_progress(scorer_id=self.scorer_2_id)
+        self.assertEqual(self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 5), [])
+
+    def test_get_submissions_for_review_lost_claim(self):
+        """
+        When another scorer claims some of the candidate workflows first, claim the next available ones instead
+        """
+        ungraded = [self._create_ungraded() for _ in range(4)]
+
+        # Simulate a scorer that picked the first two workflows as candidates, but loses the race for the first
+        original_update = QuerySet.update
+        claimed_by_other_scorer = []
+
+        def update_after_other_scorer(queryset, **kwargs):
+            if not claimed_by_other_scorer and kwargs.get('scorer_id') == self.scorer_1_id:
+                claimed_by_other_scorer.append(None)
+                claimed_by_other_scorer[0] = self.model.get_submission_for_review(
+                    self.course_id, self.item_id, self.scorer_2_id
+                )
+            return original_update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', autospec=True, side_effect=update_after_other_scorer):
+            submission_uuids = self.model.get_submissions_for_review(
+                self.course_id, self.item_id, self.scorer_1_id, 2
+            )
+
+        self.assertEqual(claimed_by_other_scorer, [ungraded[0].identifying_uuid])
+        self.assertEqual(submission_uuids, [ungraded[1].identifying_uuid, ungraded[2].identifying_uuid])
+        self.assertEqual(
+            self.get_workflow_by_identifying_uuid(ungraded[0].identifying_uuid).scorer_id, self.scorer_2_id
+        )
+        self.assertEqual(self.get_workflow_by_identifying_uuid(ungraded[3].identifying_uuid).scorer_id, '')
+
+    def test_get_submissions_for_review_queries(self):
+        """
+        Reserving several workflows takes a fixed number of queries, however many are reserved
+        """
+        for _ in range(10):
+            self._create_ungraded()
+
+        # Look for the scorer's own workflows, pick candidates, claim them, read back the claims, fetch the uuids
+        with self.assertNumQueries(5):
+            self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 5)
+
+        # Find the scorer's own workflows, extend the lease on them, fetch the uuids
+        with self.assertNumQueries(3):
+            self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 5)
+
+    def test_release_submissions_for_review(self):
+        """
+        Released reservations are immediately available to other scorers, with a single UPDATE
+        """
+        other_in_progress = self._create_in_progress(scorer_id=self.scorer_2_id)
+        graded = self._create_graded(scorer_id=self.scorer_1_id)
+        ungraded = [self._create_ungraded() for _ in range(3)]
+        reserved = self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_1_id, 3)
+
+        with self.assertNumQueries(1):
+            released = self.model.release_submissions_for_review(
+                self.course_id,
+                self.item_id,
+                self.scorer_1_id,
+                reserved[:2] + [other_in_progress.identifying_uuid, graded.identifying_uuid],
+            )
+
+        # Only the scorer's own reservations are released
+        self.assertEqual(released, 2)
+        for uuid in reserved[:2]:
+            workflow = self.get_workflow_by_identifying_uuid(uuid)
+            self.assertEqual(workflow.scorer_id, '')
+            self.assertIsNone(workflow.grading_started_at)
+        self.assertEqual(self.get_workflow_by_identifying_uuid(reserved[2]).scorer_id, self.scorer_1_id)
+        self.assertEqual(
+            self.get_workflow_by_identifying_uuid(other_in_progress.identifying_uuid).scorer_id, self.scorer_2_id
+        )
+        self.assertEqual(self.get_workflow_by_identifying_uuid(graded.identifying_uuid).scorer_id, self.scorer_1_id)
+        self.assertEqual(
+            self.model.get_submissions_for_review(self.course_id, self.item_id, self.scorer_2_id, 3),
+            [other_in_progress.identifying_uuid, ungraded[0].identifying_uuid, ungraded[1].identifying_uuid],
+        )
+
     def test_database_error(self):
         """
         Test error behavior
         """
         self._create_ungraded()
-        with mock.patch.object(self.model, 'save') as mocked_save:
+        with mock.patch.object(QuerySet, 'update') as mocked_save:
             mocked_save.side_effect = DatabaseError
             with self.assertRaises(StaffAssessmentInternalError):
                 self.model.get_submission_for_review(self.course_id, self.item_id, self.scorer_1_id)
@@ -802,3 +1036,118 @@ class TeamStaffWorkflowModelTest(BaseStaffWorkflowModelTestMixin, CacheResetTest
         workflow = self.create_workflow()
         self.assertNotEqual(workflow.submission_uuid, workflow.identifying_uuid)
         self.assertEqual(workflow.team_submission_uuid, workflow.identifying_uuid)
+
+
+@ddt
+class ConcurrentStaffWorkflowClaimTest(TransactionCacheResetTest):
+    """
+    Stress test for staff graders claiming submissions concurrently
+    """
+    course_id = 'edx/TestCourse/CourseRun2'
+    item_id = 'itemitemitemimitem'
+    num_graders = 8
+    claims_per_grader = 5
+
+    def _grade_concurrently(self, model):
+        """
+        Have every grader repeatedly claim a submission and finish grading it, all at the same time.
+
+        Returns:
+            dict of scorer id to the result of each of their claims: a claimed identifying uuid, or None
+        """
+        claims = {}
+        errors = []
+        start = threading.Barrier(self.num_graders)
+
+        def retry_while_locked(func):
+            """
+            The in-memory SQLite test database raises instead of waiting when another
+            connection holds a table lock, where other databases would block. Retry instead.
+            """
+            while True:
+                try:
+                    return func()
+                except (OperationalError, StaffAssessmentInternalError) as ex:
+                    cause = ex if isinstance(ex, OperationalError) else ex.__cause__
+                    if not isinstance(cause, OperationalError) or 'locked' not in str(cause):
+                        raise
+                    time.sleep(0.001)
+
+        def grade(scorer_id):
+            results = claims[scorer_id] = []
+            try:
+                start.wait()
+                for _ in range(self.claims_per_grader):
+                    identifying_uuid = retry_while_locked(
+                        lambda: model.get_submission_for_review(self.course_id, self.item_id, scorer_id)
+                    )
+                    results.append(identifying_uuid)
+                    if identifying_uuid is None:
+                        continue
+                    # Finish grading so that the next call claims a new submission
+                    retry_while_locked(
+                        lambda: StaffWorkflow.objects.filter(
+                            scorer_id=scorer_id, grading_completed_at=None
+                        ).update(grading_completed_at=now())
+                    )
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append(ex)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=grade, args=(f'scorer_{i}',)) for i in range(self.num_graders)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        return claims
+
+    def assert_claimed_at_most_once(self, claims, workflows):
+        """
+        Every claim either got a submission that no other claim got, or None.
+
+        Returns:
+            set of the claimed identifying uuids
+        """
+        claimed = [
+            identifying_uuid
+            for results in claims.values()
+            for identifying_uuid in results
+            if identifying_uuid is not None
+        ]
+        self.assertEqual(len(claimed), len(set(claimed)))
+        self.assertLessEqual(set(claimed), {workflow.identifying_uuid for workflow in workflows})
+        return set(claimed)
+
+    @data(
+        (StaffWorkflow, StaffWorkflowFactory),
+        (TeamStaffWorkflow, TeamStaffWorkflowFactory),
+    )
+    @unpack
+    def test_no_double_claims(self, model, factory):
+        num_workflows = self.num_graders * self.claims_per_grader
+        workflows = factory.create_batch(num_workflows, course_id=self.course_id, item_id=self.item_id)
+
+        claims = self._grade_concurrently(model)
+
+        # Every grader got a submission each time, and every submission was claimed exactly once
+        self.assertEqual(len(claims), self.num_graders)
+        for results in claims.values():
+            self.assertNotIn(None, results)
+        self.assertEqual(len(self.assert_claimed_at_most_once(claims, workflows)), num_workflows)
+
+    @data(
+        (StaffWorkflow, StaffWorkflowFactory),
+        (TeamStaffWorkflow, TeamStaffWorkflowFactory),
+    )
+    @unpack
+    def test_no_double_claims_when_scarce(self, model, factory):
+        # Fewer submissions than graders: the graders who miss out get None rather than a claimed submission
+        workflows = factory.create_batch(self.num_graders // 2, course_id=self.course_id, item_id=self.item_id)
+
+        claims = self._grade_concurrently(model)
+
+        self.assertEqual(len(claims), self.num_graders)
+        self.assert_claimed_at_most_once(claims, workflows)
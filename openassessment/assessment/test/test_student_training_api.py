@@ -105,15 +105,14 @@ class StudentTrainingAssessmentTest(CacheResetTest):
 
         # First training example
         # This will need to create the student training workflow and the first item
-        # NOTE: we *could* cache the rubric model to reduce the number of queries here,
-        # but we're selecting it by content hash, which is indexed and should be plenty fast.
-        with self.assertNumQueries(8):
+        # The rubric's ID is cached by content hash, so the rubric isn't selected again.
+        with self.assertNumQueries(7):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Without assessing the first training example, try to retrieve a training example.
         # This should return the same example as before, so we won't need to create
         # any workflows or workflow items.
-        with self.assertNumQueries(5):
+        with self.assertNumQueries(4):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Assess the current training example
@@ -121,7 +120,7 @@ class StudentTrainingAssessmentTest(CacheResetTest):
 
         # Retrieve the next training example, which requires us to create
         # a new workflow item (but not a new workflow).
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(7):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
     def test_submitter_is_finished_num_queries(self):
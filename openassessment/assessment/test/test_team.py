@@ -210,6 +210,65 @@ class TestTeamApi(CacheResetTest):
         # Then I recieve a submission to assess
         self.assertEqual(team_submission, submission_to_assess)
 
+    def test_get_submissions_to_assess(self):
+        # Given an ungraded team submission to assess
+        team_submission = self._create_test_submission_for_team()
+
+        # When I ask the API for several submissions
+        submissions_to_assess = teams_api.get_submissions_to_assess(
+            'mock-course',
+            'mock-item',
+            self.staff_user_id,
+            3
+        )
+
+        # Then I recieve the available submission
+        self.assertEqual([team_submission], submissions_to_assess)
+
+        # And nothing is available for another staff member
+        self.assertEqual(teams_api.get_submissions_to_assess('mock-course', 'mock-item', 'other-staff', 3), [])
+
+    def test_get_submissions_to_assess_batched(self):
+        # Given several ungraded team submissions to assess
+        team_submissions = [self._create_test_submission_for_team(f'mock-team-{i}') for i in range(3)]
+
+        # When I ask the API for all of them
+        with mock.patch.object(team_submissions_api, 'get_team_submission') as mock_get_team_submission:
+            submissions_to_assess = teams_api.get_submissions_to_assess(
+                'mock-course',
+                'mock-item',
+                self.staff_user_id,
+                3
+            )
+
+        # Then I receive them, fetched together rather than one at a time
+        self.assertEqual(team_submissions, submissions_to_assess)
+        mock_get_team_submission.assert_not_called()
+
+    def test_release_submissions_to_assess(self):
+        # Given team submissions reserved by a staff member
+        team_submissions = [self._create_test_submission_for_team(f'mock-team-{i}') for i in range(2)]
+        team_submission_uuids = [team_submission['team_submission_uuid'] for team_submission in team_submissions]
+        teams_api.get_submissions_to_assess('mock-course', 'mock-item', self.staff_user_id, 2)
+
+        # Another staff member can't release them
+        self.assertEqual(
+            teams_api.release_submissions_to_assess('mock-course', 'mock-item', 'other-staff', team_submission_uuids),
+            0
+        )
+
+        # When the staff member releases one of them
+        released = teams_api.release_submissions_to_assess(
+            'mock-course', 'mock-item', self.staff_user_id, team_submission_uuids[:1]
+        )
+
+        # Then it is available to another staff member straight away
+        self.assertEqual(released, 1)
+        self.assertEqual(
+            teams_api.get_submissions_to_assess('mock-course', 'mock-item', 'other-staff', 2),
+            team_submissions[:1]
+        )
+
     def test_get_grading_statistics(self):
         # Given an open response item
         mock_ora = ('mock-course', 'mock-item')
@@ -285,7 +344,7 @@ class TestTeamApi(CacheResetTest):
         )
         return assessments
 
-    def _create_test_submission_for_team(self):
+    def _create_test_submission_for_team(self, team_id='mock-team-id'):
         """
         Helper to create a team submission.
         Implicitly creates a TeamStaffWorkflow linked to the submission.
@@ -293,13 +352,16 @@ class TestTeamApi(CacheResetTest):
         Returns:
             TeamSubmission
         """
-        # Create a team submission
+        # Create a team submission, with distinct members for each team
+        team_member_ids = self.team_member_ids
+        if team_id != 'mock-team-id':
+            team_member_ids = [f'{member_id}_{team_id}' for member_id in team_member_ids]
         team_submission = team_submissions_api.create_submission_for_team(
             'mock-course',
             'mock-item',
-            'mock-team-id',
+            team_id,
             self.submitting_user_id,
-            self.team_member_ids,
+            team_member_ids,
             '42'
         )
 
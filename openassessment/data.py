@@ -20,7 +20,7 @@ from django.db.models.functions import Coalesce
 from django.utils.translation import gettext as _
 import requests
 
-from submissions.models import Submission
+from submissions.models import StudentItem, Submission
 from submissions import api as sub_api
 from submissions.errors import SubmissionNotFoundError
 from openassessment.assessment.score_type_constants import score_type_to_string
@@ -44,7 +44,7 @@ def _usernames_enabled():
     return settings.FEATURES.get('ENABLE_ORA_USERNAMES_ON_DATA_EXPORT', False)
 
 
-def _use_read_replica(queryset):
+def use_read_replica(queryset):
     """
     If there's a read replica that can be used, return a cursor to that.
     Otherwise, return a cursor to the regular database.
@@ -88,7 +88,7 @@ def map_anonymized_ids_to_usernames(anonymized_ids):
     """
     User = get_user_model()
 
-    users = _use_read_replica(
+    users = use_read_replica(
         User.objects.filter(anonymoususerid__anonymous_user_id__in=anonymized_ids)
         .annotate(anonymous_id=F("anonymoususerid__anonymous_user_id"))
         .values("username", "anonymous_id")
@@ -131,7 +131,7 @@ def map_anonymized_ids_to_user_data(anonymized_ids: Set[str]) -> dict:
     """
     User = get_user_model()
 
-    users = _use_read_replica(
+    users = use_read_replica(
         User.objects.filter(anonymoususerid__anonymous_user_id__in=anonymized_ids)
         .select_related("profile")
         .annotate(anonymous_id=F("anonymoususerid__anonymous_user_id"))
@@ -147,6 +147,34 @@ def map_anonymized_ids_to_user_data(anonymized_ids: Set[str]) -> dict:
     return anonymous_id_to_user_info_mapping
 
 
+def map_username_search_to_anonymized_ids(username_search: str, course_id: str, item_id: str) -> Set[str]:
+    """
+    Find the anonymized user IDs of the learners of an item whose username contains the given text.
+
+    Only users with a student item for the given course and item are searched, so the
+    lookup doesn't scan every user of the platform.
+
+    Args:
+        username_search (str): Case-insensitive text to look for in usernames.
+        course_id (str): The course of the item.
+        item_id (str): The item whose learners to search.
+
+    Returns:
+        Set[str]: Anonymized user ids of every matching learner.
+    """
+    User = get_user_model()
+
+    learner_ids = StudentItem.objects.filter(course_id=course_id, item_id=item_id).values("student_id")
+    anonymous_ids = use_read_replica(
+        User.objects.filter(
+            anonymoususerid__anonymous_user_id__in=learner_ids,
+            username__icontains=username_search,
+        )
+    ).values_list("anonymoususerid__anonymous_user_id", flat=True)
+
+    return {anonymous_id for anonymous_id in anonymous_ids if anonymous_id}
+
+
 class CsvWriter:
     """
     Dump openassessment data to CSV files.
@@ -250,14 +278,14 @@ class CsvWriter:
 
             # Django 1.4 doesn't follow reverse relations when using select_related,
             # so we select AssessmentPart and follow the foreign key to the Assessment.
-            parts = _use_read_replica(
+            parts = use_read_replica(
                 AssessmentPart.objects.select_related('assessment', 'option', 'option__criterion')
                 .filter(assessment__submission_uuid=submission_uuid)
                 .order_by('assessment__pk')
             )
             self._write_assessment_to_csv(parts, rubric_points_cache)
 
-            feedback_query = _use_read_replica(
+            feedback_query = use_read_replica(
                 AssessmentFeedback.objects
                 .filter(submission_uuid=submission_uuid)
                 .prefetch_related('options')
@@ -291,7 +319,7 @@ class CsvWriter:
         """
         num_results = 0
         start = 0
-        total_results = _use_read_replica(
+        total_results = use_read_replica(
             AssessmentWorkflow.objects.filter(course_id=course_id)
         ).count()
 
@@ -301,7 +329,7 @@ class CsvWriter:
             # so if we counted N at the start of the loop,
             # there should be >= N for us to process.
             end = start + self.QUERY_INTERVAL
-            query = _use_read_replica(
+            query = use_read_replica(
                 AssessmentWorkflow.objects
                 .filter(course_id=course_id)
                 .order_by('created')
@@ -482,7 +510,7 @@ class OraAggregateData:
             student_ids.append(student_item["student_id"])
             submission_uuids.append(submission["uuid"])
 
-        scorer_ids = _use_read_replica(
+        scorer_ids = use_read_replica(
             Assessment.objects.filter(submission_uuid__in=submission_uuids).values_list(
                 "scorer_id", flat=True
             )
@@ -669,7 +697,7 @@ class OraAggregateData:
 
         rows = []
         for student_item, submission, score in all_submission_information:
-            assessments = _use_read_replica(
+            assessments = use_read_replica(
                 Assessment.objects.prefetch_related('parts').
                 prefetch_related('rubric').
                 filter(
@@ -929,7 +957,7 @@ class OraAggregateData:
         student_item = submission['student_item']
         row[_('Anonymized Student ID')] = student_item['student_id']
 
-        assessments = _use_read_replica(
+        assessments = use_read_replica(
             Assessment.objects.prefetch_related('parts').
             prefetch_related('rubric').
             filter(
@@ -1069,7 +1097,7 @@ class OraDownloadData:
         User = get_user_model()
         ExternalId = import_external_id()
 
-        users = _use_read_replica(
+        users = use_read_replica(
             User.objects.filter(
                 anonymoususerid__anonymous_user_id__in=student_ids,
             )
@@ -1675,7 +1703,7 @@ def generate_assessment_from_data(submission_uuid: str) -> List[dict]:
     Returns:
         List[dict]: A list containing assessment data dictionaries.
     """
-    assessments = _use_read_replica(
+    assessments = use_read_replica(
         Assessment.objects.filter(submission_uuid=submission_uuid)
     )
     return generate_assessment_data(assessments)
@@ -1699,7 +1727,7 @@ def generate_assessment_to_data(item_id: str, submission_uuid: str) -> List[dict
 
     scorer_id = scorer_submission["student_item"]["student_id"]
 
-    submissions = _use_read_replica(
+    submissions = use_read_replica(
         Submission.objects.filter(student_item__item_id=item_id).values("uuid")
     )
 
@@ -1708,7 +1736,7 @@ def generate_assessment_to_data(item_id: str, submission_uuid: str) -> List[dict
 
     submission_uuids = [sub["uuid"] for sub in submissions]
 
-    assessments_made_by_student = _use_read_replica(
+    assessments_made_by_student = use_read_replica(
         Assessment.objects.filter(scorer_id=scorer_id, submission_uuid__in=submission_uuids)
     )
 
@@ -5,14 +5,16 @@ URLs of existing files, and delete files.
 """
 
 from collections import namedtuple
+from hashlib import sha1
 import json
 import logging
 
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.utils.functional import cached_property
 
 from openassessment.assessment.models.base import SharedFileUpload
-from openassessment.fileupload.exceptions import FileUploadError
+from openassessment.fileupload.exceptions import FileUploadError, FileUploadInternalError
 
 from . import backends
 
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 KEY_SEPARATOR = '/'
 
+# Seconds before a download url expires that it stops being served from the cache
+DOWNLOAD_URL_CACHE_MARGIN = 60
+
 
 def get_upload_url(key, content_type):
     """
@@ -39,6 +44,49 @@ def get_download_url(key):
     return url
 
 
+def get_download_urls(keys):
+    """
+    Returns a dict of download urls for the given file keys, with None for files whose url
+    could not be retrieved.
+
+    Urls are cached until shortly before they expire, and any missing from the cache are
+    signed together, so pages showing the same files to many users only sign them once.
+    """
+    backend = backends.get_backend()
+    cache_timeout = backend.DOWNLOAD_URL_TIMEOUT - DOWNLOAD_URL_CACHE_MARGIN
+    cache_keys = {key: _download_url_cache_key(backend, key) for key in keys}
+    cached_urls = cache.get_many(list(cache_keys.values())) if cache_timeout > 0 else {}
+
+    urls = {}
+    signed_urls = {}
+    for key, cache_key in cache_keys.items():
+        url = cached_urls.get(cache_key)
+        if url is None:
+            try:
+                url = backend.get_download_url(key)
+            except FileUploadInternalError as exc:
+                logger.exception("FileUploadError: Download url for file key %s failed with error %s", key, exc)
+                url = None
+            if url:
+                signed_urls[cache_key] = url
+            else:
+                logger.warning('FileUploadError: Could not retrieve URL for key %s', key)
+        urls[key] = url
+
+    if signed_urls and cache_timeout > 0:
+        cache.set_many(signed_urls, cache_timeout)
+    return urls
+
+
+def _download_url_cache_key(backend, key):
+    """
+    Cache key of the download url for a file key. File keys contain user and course ids,
+    so they are hashed to keep the cache key short and free of unsafe characters.
+    """
+    digest = sha1(f"{type(backend).__module__}.{key}".encode('utf-8')).hexdigest()
+    return f"openassessment.fileupload.download_url.{digest}"
+
+
 def remove_file(key):
     """
     Remove file from the storage
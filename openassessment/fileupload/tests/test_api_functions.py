@@ -6,9 +6,11 @@ import json
 
 from unittest import mock
 import pytest
+from django.core.cache import cache
 
 from openassessment.assessment.models.base import SharedFileUpload
 from openassessment.fileupload import api
+from openassessment.fileupload.exceptions import FileUploadInternalError
 
 
 DEFAULT_COURSE_ID = 'a-fun-course'
@@ -348,3 +350,43 @@ def test_team_files_metadata(mock_get_download_url, shared_file_upload_fixture,
         mock.call(key_beta),
         mock.call(key_delta),
     ])
+
+
+@pytest.fixture
+def mock_backend():
+    """ Test fixture that returns a stand-in for the file upload backend, with an empty cache. """
+    cache.clear()
+    backend = mock.Mock(DOWNLOAD_URL_TIMEOUT=1000)
+    backend.get_download_url.side_effect = lambda key: f'https://files.example.com/{key}?signature=abc'
+    with mock.patch('openassessment.fileupload.api.backends.get_backend', return_value=backend):
+        yield backend
+    cache.clear()
+
+
+def test_get_download_urls_cached(mock_backend):
+    assert api.get_download_urls(['foo', 'bar']) == {
+        'foo': 'https://files.example.com/foo?signature=abc',
+        'bar': 'https://files.example.com/bar?signature=abc',
+    }
+    assert api.get_download_urls(['bar', 'baz']) == {
+        'bar': 'https://files.example.com/bar?signature=abc',
+        'baz': 'https://files.example.com/baz?signature=abc',
+    }
+
+    # Each url is only signed once
+    mock_backend.get_download_url.assert_has_calls([mock.call('foo'), mock.call('bar'), mock.call('baz')])
+    assert mock_backend.get_download_url.call_count == 3
+
+
+def test_get_download_urls_not_cached_past_expiry(mock_backend):
+    mock_backend.DOWNLOAD_URL_TIMEOUT = api.DOWNLOAD_URL_CACHE_MARGIN
+    api.get_download_urls(['foo'])
+    api.get_download_urls(['foo'])
+    assert mock_backend.get_download_url.call_count == 2
+
+
+def test_get_download_urls_failures_not_cached(mock_backend):
+    mock_backend.get_download_url.side_effect = [FileUploadInternalError('oops'), '', 'https://files.example.com/foo']
+    assert api.get_download_urls(['foo']) == {'foo': None}
+    assert api.get_download_urls(['foo']) == {'foo': ''}
+    assert api.get_download_urls(['foo']) == {'foo': 'https://files.example.com/foo'}
@@ -0,0 +1,153 @@
+"""
+Benchmark loading and exporting ORA block definitions, as course import, publish and export do
+"""
+import copy
+from types import SimpleNamespace
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.translation import gettext
+
+from openassessment.xblock.utils.data_conversion import create_rubric_dict
+from openassessment.xblock.utils.defaults import (
+    DEFAULT_ASSESSMENT_MODULES,
+    DEFAULT_PROMPT,
+    DEFAULT_RUBRIC_CRITERIA,
+    DEFAULT_RUBRIC_FEEDBACK_PROMPT,
+    DEFAULT_RUBRIC_FEEDBACK_TEXT,
+)
+from openassessment.xblock.utils.validation import validate_definition
+from openassessment.xblock.utils.xml import clear_definitions_cache, parse_from_xml_str, serialize_content
+
+
+class Command(BaseCommand):
+    """
+    Time serializing, parsing and validating the definitions of a course's ORA blocks,
+    with and without the cache of parsed and serialized definitions.
+
+    Blocks have their own titles and prompts, and share a few rubrics, as blocks created
+    from templates or reused rubrics do. Validation writes rubrics, so the benchmark runs
+    in a transaction which is rolled back.
+
+    Example usage:
+        ./manage.py cms benchmark_ora_xml --blocks 300 --rubrics 10
+    """
+
+    help = 'Benchmark parsing, validating and serializing ORA block definitions'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--blocks',
+            dest='blocks',
+            type=int,
+            default=300,
+            help='Number of ORA blocks in the course',
+        )
+
+        parser.add_argument(
+            '--rubrics',
+            dest='rubrics',
+            type=int,
+            default=10,
+            help='Number of distinct rubrics shared by the blocks',
+        )
+
+    def handle(self, *args, **options):
+        if options['blocks'] < 1 or options['rubrics'] < 1:
+            raise CommandError("blocks and rubrics must be positive integers")
+
+        blocks = [self._block(index, index % options['rubrics']) for index in range(options['blocks'])]
+
+        with transaction.atomic():
+            serialized = self._compare('export', blocks, lambda block: serialize_content(block))
+            self._compare('import', list(zip(blocks, serialized)), self._load)
+            transaction.set_rollback(True)
+
+    def _compare(self, name, items, func):
+        """
+        Time `func` over every item without the cache, then with an empty and a warm cache.
+
+        Returns:
+            list of the results of `func` for each item
+        """
+        start = time.perf_counter()
+        for item in items:
+            clear_definitions_cache()
+            func(item)
+        uncached = time.perf_counter() - start
+
+        clear_definitions_cache()
+        start = time.perf_counter()
+        results = [func(item) for item in items]
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        warm = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{name} of {len(items)} blocks: {uncached:.3f}s uncached, "
+            f"{cold:.3f}s with an empty cache ({uncached / cold:.1f}x), "
+            f"{warm:.3f}s with a warm cache ({uncached / warm:.1f}x)"
+        )
+        return results
+
+    @staticmethod
+    def _load(item):
+        """
+        Parse and validate a block definition, as OpenAssessmentBlock.parse_xml does.
+        """
+        block, xml = item
+        config = parse_from_xml_str(xml)
+        validate_definition(
+            block,
+            gettext,
+            create_rubric_dict(config['prompts'], config['rubric_criteria']),
+            config['rubric_assessments'],
+            submission_start=config['submission_start'],
+            submission_due=config['submission_due'],
+            leaderboard_show=config['leaderboard_show'],
+        )
+        return config
+
+    @staticmethod
+    def _block(index, rubric_index):
+        """
+        Stand-in for an OpenAssessmentBlock with the default definition.
+        """
+        criteria = copy.deepcopy(DEFAULT_RUBRIC_CRITERIA)
+        for criterion in criteria:
+            criterion['prompt'] = f"{criterion['prompt']} ({rubric_index})"
+        return SimpleNamespace(
+            title=f"Open Response Assessment {index}",
+            prompts=[{'description': f"{DEFAULT_PROMPT} ({index})"}],
+            prompts_type='text',
+            rubric_criteria=criteria,
+            rubric_feedback_prompt=DEFAULT_RUBRIC_FEEDBACK_PROMPT,
+            rubric_feedback_default_text=DEFAULT_RUBRIC_FEEDBACK_TEXT,
+            rubric_assessments=copy.deepcopy(DEFAULT_ASSESSMENT_MODULES),
+            submission_start=None,
+            submission_due=None,
+            start=None,
+            due=None,
+            leaderboard_show=0,
+            text_response='required',
+            text_response_editor='text',
+            file_upload_response=None,
+            file_upload_type=None,
+            white_listed_file_types=None,
+            white_listed_file_types_string=None,
+            allow_multiple_files=True,
+            allow_latex=False,
+            allow_learner_resubmissions=False,
+            resubmissions_grace_period='',
+            group_access={},
+            teams_enabled=False,
+            selected_teamset_id='',
+            show_rubric_during_response=False,
+        )
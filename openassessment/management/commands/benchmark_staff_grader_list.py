@@ -0,0 +1,143 @@
+"""
+Benchmark building the rows of the staff grader submission list
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import time
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openassessment.staffgrader.serializers.submission_list import (
+    SubmissionListRowBuilder,
+    SubmissionListSerializer,
+    TeamSubmissionListRowBuilder,
+    TeamSubmissionListSerializer,
+)
+
+
+class Command(BaseCommand):
+    """
+    Time building the rows of the staff grader submission list with the DRF serializers
+    and with the row builders which replace them.
+
+    Rows are built from stand-ins for annotated staff workflows and a matching serializer
+    context, so the benchmark doesn't need any submissions in the database. Every other row
+    is graded, and every third one is locked.
+
+    Example usage:
+        ./manage.py lms benchmark_staff_grader_list --rows 1000 --teams
+    """
+
+    help = 'Benchmark building the rows of the staff grader submission list'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--rows',
+            dest='rows',
+            type=int,
+            default=1000,
+            help='Number of rows in the submission list',
+        )
+
+        parser.add_argument(
+            '--repeat',
+            dest='repeat',
+            type=int,
+            default=3,
+            help='Number of runs, the fastest of which is reported',
+        )
+
+        parser.add_argument(
+            '--teams',
+            dest='teams',
+            action='store_true',
+            help='Build the rows of a team assignment',
+        )
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['repeat'] < 1:
+            raise CommandError("rows and repeat must be positive integers")
+
+        workflows, context = self._rows_and_context(options['rows'], options['teams'])
+        if options['teams']:
+            serializer, row_builder = TeamSubmissionListSerializer, TeamSubmissionListRowBuilder
+        else:
+            serializer, row_builder = SubmissionListSerializer, SubmissionListRowBuilder
+
+        def serialize():
+            return [serializer(workflow, context=context).data for workflow in workflows]
+
+        def build_rows():
+            build_row = row_builder(context)
+            return [build_row(workflow) for workflow in workflows]
+
+        serializer_time = self._best_time(serialize, options['repeat'])
+        row_builder_time = self._best_time(build_rows, options['repeat'])
+        self.stdout.write(
+            f"{len(workflows)} rows: {serializer_time * 1000:.1f}ms with {serializer.__name__}, "
+            f"{row_builder_time * 1000:.1f}ms with {row_builder.__name__} "
+            f"({serializer_time / row_builder_time:.1f}x)"
+        )
+
+    @staticmethod
+    def _best_time(func, repeat):
+        """
+        Fastest of `repeat` runs of `func`, in seconds.
+        """
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    @staticmethod
+    def _rows_and_context(num_rows, is_team_assignment):
+        """
+        Stand-ins for annotated staff workflows, and the serializer context for them.
+        """
+        created_at = datetime.now(timezone.utc)
+        workflows = []
+        context = {
+            'anonymous_id_to_username': {},
+            'anonymous_id_to_email': {},
+            'anonymous_id_to_fullname': {},
+            'submission_uuid_to_assessment': {},
+        }
+        if is_team_assignment:
+            context.update({'team_submission_uuid_to_team_id': {}, 'team_id_to_team_name': {}})
+        else:
+            context['submission_uuid_to_student_id'] = {}
+
+        for i in range(num_rows):
+            uuid = str(uuid4())
+            graded = i % 2 == 0
+            workflows.append(SimpleNamespace(
+                submission_uuid=uuid if not is_team_assignment else str(uuid4()),
+                team_submission_uuid=uuid if is_team_assignment else None,
+                identifying_uuid=uuid,
+                created_at=created_at + timedelta(minutes=i),
+                grading_completed_at=created_at + timedelta(days=1) if graded else None,
+                grading_status='graded' if graded else 'ungraded',
+                lock_status='locked' if i % 3 == 0 else 'unlocked',
+                scorer_id=f'staff_{i % 4}' if graded else '',
+            ))
+            context['anonymous_id_to_username'][f'staff_{i % 4}'] = f'staff_username_{i % 4}'
+            if graded:
+                context['submission_uuid_to_assessment'][uuid] = SimpleNamespace(
+                    points_earned=i % 10,
+                    points_possible=10,
+                )
+            if is_team_assignment:
+                context['team_submission_uuid_to_team_id'][uuid] = f'team_{i}'
+                context['team_id_to_team_name'][f'team_{i}'] = f'Team name {i}'
+            else:
+                context['submission_uuid_to_student_id'][uuid] = f'student_{i}'
+                context['anonymous_id_to_username'][f'student_{i}'] = f'username_{i}'
+                context['anonymous_id_to_email'][f'student_{i}'] = f'email_{i}'
+                context['anonymous_id_to_fullname'][f'student_{i}'] = f'fullname_{i}'
+        return workflows, context
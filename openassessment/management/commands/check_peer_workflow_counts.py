@@ -0,0 +1,108 @@
+"""
+Check the denormalised peer workflow assessment counts against the workflow items
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openassessment.assessment.models import PeerWorkflow
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Compare PeerWorkflow.graded_count and graded_by_count with the counts
+    recomputed from peer workflow items, and optionally repair them.
+
+    Example usage:
+        ./manage.py lms check_peer_workflow_counts --course_id "course-v1:edX+DemoX+Demo_Course" --fix
+    """
+
+    help = 'Check the denormalised peer workflow assessment counts, and optionally fix them'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--course_id',
+            dest='course_id',
+            help='Optional course id',
+        )
+
+        parser.add_argument(
+            '--item_id',
+            dest='item_id',
+            help='Optional ORA block id',
+        )
+
+        parser.add_argument(
+            '--batch_size',
+            dest='batch_size',
+            type=int,
+            default=1000,
+            help='Number of workflows to check per batch',
+        )
+
+        parser.add_argument(
+            '--fix',
+            dest='fix',
+            action='store_true',
+            help='Overwrite inconsistent counts with the recomputed values',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("batch_size must be a positive integer")
+
+        workflows = PeerWorkflow.objects.all()
+        if options.get('course_id'):
+            workflows = workflows.filter(course_id=options['course_id'])
+        if options.get('item_id'):
+            workflows = workflows.filter(item_id=options['item_id'])
+
+        checked = 0
+        inconsistent = 0
+        last_id = 0
+        while True:
+            batch = list(
+                workflows.filter(id__gt=last_id).order_by('id').only(
+                    'id', 'submission_uuid', 'graded_count', 'graded_by_count'
+                )[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            checked += len(batch)
+
+            expected_counts = PeerWorkflow.count_graded([workflow.id for workflow in batch])
+            to_fix = []
+            for workflow in batch:
+                expected_graded, expected_graded_by = expected_counts[workflow.id]
+                if (workflow.graded_count, workflow.graded_by_count) == (expected_graded, expected_graded_by):
+                    continue
+
+                inconsistent += 1
+                log.warning(
+                    "Peer workflow %s for submission %s has graded_count=%s, graded_by_count=%s; expected %s, %s",
+                    workflow.id,
+                    workflow.submission_uuid,
+                    workflow.graded_count,
+                    workflow.graded_by_count,
+                    expected_graded,
+                    expected_graded_by,
+                )
+                workflow.graded_count = expected_graded
+                workflow.graded_by_count = expected_graded_by
+                to_fix.append(workflow)
+
+            if options['fix'] and to_fix:
+                PeerWorkflow.objects.bulk_update(to_fix, ['graded_count', 'graded_by_count'])
+
+        log.info(
+            "Checked %s peer workflows, %s inconsistent%s",
+            checked,
+            inconsistent,
+            " (fixed)" if options['fix'] and inconsistent else "",
+        )
@@ -17,7 +17,7 @@ from openassessment.assessment.api import staff as staff_api
 from openassessment.runtime_imports.functions import anonymous_id_for_user, modulestore
 from openassessment.workflow import api as workflow_api
 from openassessment.xblock.utils.data_conversion import create_rubric_dict
-from openassessment.staffgrader.models import SubmissionGradingLock
+from openassessment.staffgrader.lock_stores import get_lock_store
 
 log = logging.getLogger('create_oa_submissions_from_file')
 
@@ -313,7 +313,7 @@ class Command(BaseCommand):
                         submission['uuid'],
                         submission_config['lockOwner']
                     )
-                    SubmissionGradingLock.claim_submission_lock(
+                    get_lock_store().claim_submission_lock(
                         submission['uuid'],
                         self.username_to_anonymous_user_id[submission_config['lockOwner']]
                     )
@@ -0,0 +1,55 @@
+"""tests for the management command to check denormalised peer workflow counts"""
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+
+from openassessment.assessment.models import PeerWorkflow, PeerWorkflowItem
+from openassessment.test_utils import CacheResetTest
+from openassessment.tests.factories import AssessmentFactory
+
+
+class CheckPeerWorkflowCountsTest(CacheResetTest):
+
+    def setUp(self):
+        super().setUp()
+        self.author = PeerWorkflow.objects.create(
+            student_id='author', item_id='item', course_id='course', submission_uuid='author-uuid'
+        )
+        self.scorer = PeerWorkflow.objects.create(
+            student_id='scorer', item_id='item', course_id='course', submission_uuid='scorer-uuid'
+        )
+        PeerWorkflowItem.objects.create(
+            scorer=self.scorer,
+            author=self.author,
+            submission_uuid=self.author.submission_uuid,
+            assessment=AssessmentFactory(submission_uuid=self.author.submission_uuid),
+        )
+        # An item that was handed out but never assessed doesn't count
+        PeerWorkflowItem.objects.create(
+            scorer=self.author,
+            author=self.scorer,
+            submission_uuid=self.scorer.submission_uuid,
+        )
+
+    def _counts(self):
+        return {
+            workflow.student_id: (workflow.graded_count, workflow.graded_by_count)
+            for workflow in PeerWorkflow.objects.all()
+        }
+
+    def test_check_only(self):
+        call_command('check_peer_workflow_counts')
+        self.assertEqual(self._counts(), {'author': (0, 0), 'scorer': (0, 0)})
+
+    def test_fix(self):
+        call_command('check_peer_workflow_counts', fix=True, batch_size=1)
+        self.assertEqual(self._counts(), {'author': (0, 1), 'scorer': (1, 0)})
+
+    def test_fix_scoped(self):
+        call_command('check_peer_workflow_counts', fix=True, item_id='other-item')
+        self.assertEqual(self._counts(), {'author': (0, 0), 'scorer': (0, 0)})
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(CommandError):
+            call_command('check_peer_workflow_counts', batch_size=0)
@@ -0,0 +1,21 @@
+""" Submission grading lock stores. """
+
+
+from django.conf import settings
+
+from . import cache, database
+
+
+def get_lock_store():
+    # .. setting_name: ORA_SUBMISSION_LOCK_STORE
+    # .. setting_default: 'database'
+    # .. setting_description: Where Enhanced Staff Grader keeps submission grading locks.
+    #     The supported values are: 'database' (the SubmissionGradingLock table) and 'cache'
+    #     (the Django cache named by ORA_SUBMISSION_LOCK_CACHE, which defaults to 'default').
+    store_setting = getattr(settings, "ORA_SUBMISSION_LOCK_STORE", "database")
+    if store_setting == "database":
+        return database.LockStore()
+    elif store_setting == "cache":
+        return cache.LockStore(getattr(settings, "ORA_SUBMISSION_LOCK_CACHE", "default"))
+    else:
+        raise ValueError("Invalid ORA_SUBMISSION_LOCK_STORE setting value: %s" % store_setting)
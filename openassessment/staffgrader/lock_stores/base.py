@@ -0,0 +1,75 @@
+""" Interface for submission grading lock stores. """
+
+
+import abc
+
+
+class BaseLockStore(abc.ABC):
+    """
+    Stores the grading locks that give a staff member exclusive access to grade a submission.
+
+    Locks are SubmissionGradingLock instances, which may or may not be saved to the database
+    depending on the store. A lock is active for SubmissionGradingLock.TIMEOUT after it was claimed.
+    """
+
+    # Whether lock_owner_expression() is evaluated by the database, as part of the query it annotates.
+    # When it isn't, annotating a queryset looks up the lock of every row: callers should only annotate with it to
+    # filter or sort on lock status, and otherwise look up the locks of the rows they return with
+    # get_active_lock_owners().
+    LOCK_OWNER_EXPRESSION_IN_QUERY = True
+
+    @abc.abstractmethod
+    def get_submission_lock(self, submission_uuid):
+        """
+        Get info about a submission grading lock
+
+        Returns: SubmissionGradingLock or None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim_submission_lock(self, submission_uuid, user_id):
+        """
+        Try to claim a submission grading lock.
+        The lock owner may reclaim their own lock, which restarts its timeout.
+
+        Returns: SubmissionGradingLock
+
+        Raises: SubmissionLockContestedError if another user has an active lock
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear_submission_lock(self, submission_uuid, user_id):
+        """
+        Clear an existing lock. Locks can only be cleared by the lock owner
+
+        Returns: None
+
+        Raises: SubmissionLockContestedError if the lock is owned by another user
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def batch_clear_submission_locks(self, submission_uuids, user_id):
+        """
+        For a list of submission locks to try to clear, clear those that we own.
+
+        Returns: Number of submission locks cleared
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_active_lock_owners(self, submission_uuids):
+        """
+        Returns: dict mapping each of the given submission uuids that has an active lock to the lock owner's id
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def lock_owner_expression(self, queryset, submission_uuid_field):
+        """
+        Build an expression for annotating each row of a queryset with the owner id of the active lock on the
+        submission in its submission_uuid_field, or None if it is unlocked.
+        """
+        raise NotImplementedError
@@ -0,0 +1,200 @@
+""" Submission grading locks stored in a Django cache. """
+
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.db.models import Case, CharField, Value, When
+from django.utils.timezone import now
+
+from openassessment.staffgrader.errors.submission_lock import SubmissionLockContestedError
+from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+
+from .base import BaseLockStore
+
+
+class LockStore(BaseLockStore):
+    """
+    Stores locks as cache entries holding their owner and expiry.
+
+    Claims use the atomic cache.add(), so when two users race for an unlocked submission only one of them
+    gets it. Django's cache API has no compare-and-swap, so any other change to a lock entry (its owner
+    renewing it, anyone taking it over once it has expired, or its owner clearing it) is made while holding
+    a short-lived mutex entry for the submission, claimed with add() too, after checking the lock entry
+    is still the one the change is meant for. A renewal racing another change succeeds as long as its
+    owner still holds the lock.
+
+    A lock entry is kept ENTRY_GRACE_PERIOD longer than the lock is active, so it doesn't disappear between
+    that check and the change. Past this grace period, the entry expires and the submission can be claimed
+    with add() again.
+
+    Locks aren't evaluated by the database, so lock_owner_expression() looks up the locks of every row of
+    the queryset it annotates: callers should only use it when they filter or sort on lock status.
+
+    The cache must be shared between processes (e.g. memcached or redis) for locks to be visible to every
+    staff member.
+    """
+
+    KEY_PREFIX = "staffgrader.submission_lock"
+    MUTEX_KEY_PREFIX = "staffgrader.submission_lock_mutex"
+
+    LOCK_OWNER_EXPRESSION_IN_QUERY = False
+
+    # Seconds a lock entry outlives the lock
+    ENTRY_GRACE_PERIOD = 60
+
+    # Seconds a change to a lock entry may hold the submission's mutex for
+    MUTEX_TIMEOUT = 5
+
+    def __init__(self, cache_alias="default"):
+        self.cache = caches[cache_alias]
+
+    @classmethod
+    def _cache_key(cls, submission_uuid):
+        return f"{cls.KEY_PREFIX}.{submission_uuid}"
+
+    @classmethod
+    def _mutex_key(cls, submission_uuid):
+        return f"{cls.MUTEX_KEY_PREFIX}.{submission_uuid}"
+
+    @classmethod
+    def _entry_timeout(cls):
+        return int(SubmissionGradingLock.TIMEOUT.total_seconds()) + cls.ENTRY_GRACE_PERIOD
+
+    @staticmethod
+    def _new_lock(user_id):
+        created_at = now()
+        return {
+            "owner_id": user_id,
+            "created_at": created_at,
+            "expires_at": created_at + SubmissionGradingLock.TIMEOUT,
+        }
+
+    @staticmethod
+    def _is_active(cached_lock):
+        return now() < cached_lock["expires_at"]
+
+    @staticmethod
+    def _to_lock(submission_uuid, cached_lock):
+        """ Build an unsaved SubmissionGradingLock from a cached lock entry """
+        return SubmissionGradingLock(
+            submission_uuid=submission_uuid,
+            owner_id=cached_lock["owner_id"],
+            created_at=cached_lock["created_at"],
+        )
+
+    @contextmanager
+    def _mutex(self, submission_uuid):
+        """
+        Hold the mutex for changing the lock entry of a submission.
+
+        Raises: SubmissionLockContestedError if the lock entry is being changed by someone else
+        """
+        mutex_key = self._mutex_key(submission_uuid)
+        token = uuid4().hex
+        if not self.cache.add(mutex_key, token, self.MUTEX_TIMEOUT):
+            raise SubmissionLockContestedError
+        try:
+            yield
+        finally:
+            # Unless we held it past its timeout, and someone else holds it now
+            if self.cache.get(mutex_key) == token:
+                self.cache.delete(mutex_key)
+
+    def get_submission_lock(self, submission_uuid):
+        cached_lock = self.cache.get(self._cache_key(submission_uuid))
+        if cached_lock is None:
+            return None
+        return self._to_lock(submission_uuid, cached_lock)
+
+    def claim_submission_lock(self, submission_uuid, user_id):
+        cache_key = self._cache_key(submission_uuid)
+        new_lock = self._new_lock(user_id)
+        if self.cache.add(cache_key, new_lock, self._entry_timeout()):
+            return self._to_lock(submission_uuid, new_lock)
+
+        # The submission has a lock entry, which only its owner may renew until it expires
+        try:
+            with self._mutex(submission_uuid):
+                current_lock = self.cache.get(cache_key)
+                if current_lock is None:
+                    # The entry expired in the meantime, so it is up for grabs again
+                    if not self.cache.add(cache_key, new_lock, self._entry_timeout()):
+                        raise SubmissionLockContestedError
+                elif current_lock["owner_id"] != user_id and self._is_active(current_lock):
+                    raise SubmissionLockContestedError
+                else:
+                    self.cache.set(cache_key, new_lock, self._entry_timeout())
+        except SubmissionLockContestedError:
+            # Racing another change to the entry, such as a concurrent renewal by the same user:
+            # a lock the user still holds counts as renewed
+            current_lock = self.cache.get(cache_key)
+            if current_lock is None or current_lock["owner_id"] != user_id or not self._is_active(current_lock):
+                raise
+            return self._to_lock(submission_uuid, current_lock)
+        return self._to_lock(submission_uuid, new_lock)
+
+    def clear_submission_lock(self, submission_uuid, user_id):
+        cache_key = self._cache_key(submission_uuid)
+        if self.cache.get(cache_key) is None:
+            return
+
+        with self._mutex(submission_uuid):
+            current_lock = self.cache.get(cache_key)
+            if current_lock is None:
+                return
+
+            # Only the owner can clear the lock
+            if current_lock["owner_id"] != user_id:
+                raise SubmissionLockContestedError
+
+            self.cache.delete(cache_key)
+
+    def batch_clear_submission_locks(self, submission_uuids, user_id):
+        key_to_submission_uuid = {
+            self._cache_key(submission_uuid): submission_uuid for submission_uuid in submission_uuids
+        }
+        cached_locks = self.cache.get_many(list(key_to_submission_uuid))
+
+        cleared = 0
+        for cache_key, cached_lock in cached_locks.items():
+            if cached_lock["owner_id"] != user_id:
+                continue
+            try:
+                self.clear_submission_lock(key_to_submission_uuid[cache_key], user_id)
+            except SubmissionLockContestedError:
+                # Taken over in the meantime
+                continue
+            cleared += 1
+        return cleared
+
+    def get_active_lock_owners(self, submission_uuids):
+        key_to_submission_uuid = {
+            self._cache_key(submission_uuid): submission_uuid for submission_uuid in submission_uuids
+        }
+        cached_locks = self.cache.get_many(list(key_to_submission_uuid))
+
+        lock_owners = {}
+        for cache_key, cached_lock in cached_locks.items():
+            if self._is_active(cached_lock):
+                lock_owners[key_to_submission_uuid[cache_key]] = cached_lock["owner_id"]
+        return lock_owners
+
+    def lock_owner_expression(self, queryset, submission_uuid_field):
+        """
+        Looks up the locks for every submission in the queryset with a single get_many(), and maps the
+        (few) locked submissions to their owners in SQL so lock status can still be filtered and sorted on.
+        This reads the submission uuid of every row, so it is only meant for filtering and sorting.
+        """
+        submission_uuids = queryset.order_by().values_list(submission_uuid_field, flat=True)
+        lock_owners = self.get_active_lock_owners(list(submission_uuids))
+
+        return Case(
+            *[
+                When(**{submission_uuid_field: submission_uuid}, then=Value(owner_id))
+                for submission_uuid, owner_id in lock_owners.items()
+            ],
+            default=Value(None),
+            output_field=CharField(),
+        )
@@ -0,0 +1,44 @@
+""" Submission grading locks stored in the database. """
+
+
+from django.db.models import OuterRef, Subquery
+
+from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+
+from .base import BaseLockStore
+
+
+class LockStore(BaseLockStore):
+    """
+    Stores locks in the SubmissionGradingLock table.
+    """
+
+    def get_submission_lock(self, submission_uuid):
+        return SubmissionGradingLock.get_submission_lock(submission_uuid)
+
+    def claim_submission_lock(self, submission_uuid, user_id):
+        return SubmissionGradingLock.claim_submission_lock(submission_uuid, user_id)
+
+    def clear_submission_lock(self, submission_uuid, user_id):
+        return SubmissionGradingLock.clear_submission_lock(submission_uuid, user_id)
+
+    def batch_clear_submission_locks(self, submission_uuids, user_id):
+        return SubmissionGradingLock.batch_clear_submission_locks(submission_uuids, user_id)
+
+    def get_active_lock_owners(self, submission_uuids):
+        return dict(
+            SubmissionGradingLock.currently_active().filter(
+                submission_uuid__in=submission_uuids
+            ).values_list('submission_uuid', 'owner_id')
+        )
+
+    def lock_owner_expression(self, queryset, submission_uuid_field):
+        """
+        A correlated subquery on the newest active lock, so the annotation costs no extra queries
+        """
+        newest_lock = SubmissionGradingLock.currently_active().filter(
+            submission_uuid=OuterRef(submission_uuid_field)
+        ).order_by(
+            '-created_at'
+        )
+        return Subquery(newest_lock.values('owner_id'))
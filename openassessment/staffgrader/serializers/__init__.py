@@ -1,7 +1,12 @@
 """ Serializers for the staff_grader app """
 
 from openassessment.staffgrader.serializers.submission_list import (
-    MissingContextException, SubmissionListScoreSerializer, SubmissionListSerializer, TeamSubmissionListSerializer
+    MissingContextException,
+    SubmissionListRowBuilder,
+    SubmissionListScoreSerializer,
+    SubmissionListSerializer,
+    TeamSubmissionListRowBuilder,
+    TeamSubmissionListSerializer,
 )
 from openassessment.staffgrader.serializers.submission_lock import SubmissionLockSerializer
 from openassessment.staffgrader.serializers.assessments import (
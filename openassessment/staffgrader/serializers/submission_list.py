@@ -212,3 +212,144 @@ class TeamSubmissionListSerializer(SubmissionListSerializer):
         return self._get_team_name_from_context(
             self._get_team_id_from_context(workflow.identifying_uuid)
         )
+
+
+class SubmissionListRowBuilder:
+    """
+    Builds the same rows as SubmissionListSerializer, using plain dict construction.
+
+    A DRF serializer instance per workflow re-runs field binding, context verification and method-field dispatch
+    for every row, which dominates the cost of large submission lists. The builder verifies the context and looks
+    up the context maps once, then builds each row directly from the annotated workflow.
+
+    Usage:
+        build_row = SubmissionListRowBuilder(context)
+        rows = [build_row(workflow) for workflow in staff_workflows]
+    """
+
+    REQUIRED_CONTEXT_KEYS = [
+        SubmissionListSerializer.CONTEXT_ANON_ID_TO_USERNAME,
+        SubmissionListSerializer.CONTEXT_SUB_TO_ASSESSMENT,
+        SubmissionListSerializer.CONTEXT_SUB_TO_ANON_ID,
+        SubmissionListSerializer.CONTEXT_ANON_ID_TO_EMAIL,
+        SubmissionListSerializer.CONTEXT_ANON_ID_TO_FULLNAME,
+    ]
+
+    def __init__(self, context):
+        missing_context = set(self.REQUIRED_CONTEXT_KEYS) - set(context.keys())
+        if missing_context:
+            raise ValueError(f"Missing required context {' ,'.join(missing_context)}")
+
+        self.anonymous_id_to_username = context[SubmissionListSerializer.CONTEXT_ANON_ID_TO_USERNAME]
+        self.anonymous_id_to_email = context[SubmissionListSerializer.CONTEXT_ANON_ID_TO_EMAIL]
+        self.anonymous_id_to_fullname = context[SubmissionListSerializer.CONTEXT_ANON_ID_TO_FULLNAME]
+        self.submission_uuid_to_assessment = context[SubmissionListSerializer.CONTEXT_SUB_TO_ASSESSMENT]
+        # Only one of these is required, depending on whether this is a team assignment
+        self.submission_uuid_to_student_id = context.get(SubmissionListSerializer.CONTEXT_SUB_TO_ANON_ID)
+        self.team_submission_uuid_to_team_id = context.get(TeamSubmissionListSerializer.CONTEXT_SUB_TO_TEAM_ID)
+        self.team_id_to_team_name = context.get(TeamSubmissionListSerializer.CONTEXT_TEAM_ID_TO_TEAM_NAME)
+
+    def __call__(self, workflow):
+        """
+        Returns: dict for the given annotated workflow, equal to SubmissionListSerializer(workflow).data
+
+        Raises:
+            MissingContextException if the context is missing data for the workflow
+        """
+        scorer_id = workflow.scorer_id
+        if scorer_id:
+            graded_by = self._get_username(scorer_id)
+        else:
+            graded_by = None
+
+        username, email, fullname = self._get_learner_data(workflow)
+
+        assessment = self.submission_uuid_to_assessment.get(workflow.identifying_uuid)
+        if assessment:
+            score = {
+                'pointsEarned': int(assessment.points_earned),
+                'pointsPossible': int(assessment.points_possible),
+            }
+        else:
+            score = {}
+
+        return {
+            'submissionUuid': _str_or_none(self._get_submission_uuid(workflow)),
+            'dateSubmitted': _str_or_none(workflow.created_at),
+            'dateGraded': str(workflow.grading_completed_at),
+            'gradingStatus': _str_or_none(workflow.grading_status),
+            'lockStatus': _str_or_none(workflow.lock_status),
+            'gradedBy': graded_by,
+            'username': username,
+            'teamName': self._get_team_name(workflow),
+            'score': score,
+            'email': email,
+            'fullname': fullname,
+        }
+
+    def _get_username(self, anonymous_user_id):
+        try:
+            return self.anonymous_id_to_username[anonymous_user_id]
+        except KeyError as e:
+            raise MissingContextException(f"Username not found for anonymous user id {anonymous_user_id}") from e
+
+    def _get_submission_uuid(self, workflow):
+        return workflow.submission_uuid
+
+    def _get_learner_data(self, workflow):
+        """
+        Returns: (username, email, fullname) of the learner who made the submission
+        """
+        try:
+            anonymous_user_id = self.submission_uuid_to_student_id[workflow.identifying_uuid]
+        except KeyError as e:
+            raise MissingContextException(
+                f"No submitter anonymous user id found for submission uuid {workflow.identifying_uuid}"
+            ) from e
+
+        username = self._get_username(anonymous_user_id)
+        try:
+            email = self.anonymous_id_to_email[anonymous_user_id]
+        except KeyError as e:
+            raise MissingContextException(f"Email not found for anonymous user id {anonymous_user_id}") from e
+        try:
+            fullname = self.anonymous_id_to_fullname[anonymous_user_id]
+        except KeyError as e:
+            raise MissingContextException(f"fullname not found for anonymous user id {anonymous_user_id}") from e
+        return username, email, fullname
+
+    def _get_team_name(self, workflow):  # pylint: disable=unused-argument
+        # For individual submissions, this is intentionally empty
+        return None
+
+
+class TeamSubmissionListRowBuilder(SubmissionListRowBuilder):
+    """
+    Builds the same rows as TeamSubmissionListSerializer, using plain dict construction.
+    """
+
+    REQUIRED_CONTEXT_KEYS = TeamSubmissionListSerializer.REQUIRED_CONTEXT_KEYS
+
+    def _get_submission_uuid(self, workflow):
+        return workflow.team_submission_uuid
+
+    def _get_learner_data(self, workflow):
+        # For team submissions, this is intentionally empty
+        return None, None, None
+
+    def _get_team_name(self, workflow):
+        try:
+            team_id = self.team_submission_uuid_to_team_id[workflow.identifying_uuid]
+        except KeyError as e:
+            raise MissingContextException(
+                f"No submitter anonymous user id found for team submission uuid {workflow.identifying_uuid}"
+            ) from e
+        try:
+            return self.team_id_to_team_name[team_id]
+        except KeyError as e:
+            raise MissingContextException(f"Team name not found for team id {team_id}") from e
+
+
+def _str_or_none(value):
+    """ Matches DRF's CharField output, which passes None through rather than stringifying it """
+    return None if value is None else str(value)
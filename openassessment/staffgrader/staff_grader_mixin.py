@@ -1,18 +1,25 @@
 """
 API endpoints for enhanced staff grader
 """
+from datetime import datetime, timezone
 from functools import wraps
 from typing import List
+import base64
+import json
 import logging
 
-from django.db.models import Case, OuterRef, Prefetch, Subquery, Value, When
+from django.db.models import Case, Prefetch, Q, Value, When
 from django.db.models.fields import CharField
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, make_aware
 from xblock.core import XBlock
 from xblock.exceptions import JsonHandlerError
 
 from submissions.api import get_student_ids_by_submission_uuid, get_submission
+from submissions.models import Submission
 from submissions.errors import SubmissionInternalError, SubmissionNotFoundError, SubmissionRequestError, SubmissionError
 from submissions.team_api import get_team_ids_by_team_submission_uuid, get_team_submission
+from openassessment.assessment.api import staff as staff_api, teams as team_staff_api
 from openassessment.assessment.errors.staff import StaffAssessmentError
 from openassessment.assessment.models.base import Assessment, AssessmentPart
 from openassessment.assessment.models.staff import StaffWorkflow, TeamStaffWorkflow
@@ -20,18 +27,19 @@ from openassessment.data import (
     OraSubmissionAnswerFactory,
     VersionNotFoundException,
     map_anonymized_ids_to_user_data,
+    map_username_search_to_anonymized_ids,
     generate_assessment_from_data,
     generate_assessment_to_data
 )
 from openassessment.staffgrader.errors.submission_lock import SubmissionLockContestedError
-from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+from openassessment.staffgrader.lock_stores import get_lock_store
 from openassessment.staffgrader.serializers import (
     AssessmentSerializer,
     MissingContextException,
     SubmissionDetailFileSerilaizer,
-    SubmissionListSerializer,
+    SubmissionListRowBuilder,
     SubmissionLockSerializer,
-    TeamSubmissionListSerializer,
+    TeamSubmissionListRowBuilder,
 )
 from openassessment.xblock.staff_area_mixin import require_course_staff
 from openassessment.xblock.apis.assessments.staff_assessment_api import do_staff_assessment, do_team_staff_assessment
@@ -81,6 +89,22 @@ class StaffGraderMixin:
     grading is in progress.
     """
 
+    # Largest number of workflows returned by a single page of list_staff_workflows
+    LIST_STAFF_WORKFLOWS_MAX_PAGE_SIZE = 500
+
+    LIST_STAFF_WORKFLOWS_GRADING_STATUSES = ('graded', 'ungraded')
+    LIST_STAFF_WORKFLOWS_LOCK_STATUSES = ('in-progress', 'locked', 'unlocked')
+
+    # Supported sort_by values for list_staff_workflows, mapped to the (annotated) field they order by
+    LIST_STAFF_WORKFLOWS_SORT_FIELDS = {
+        'date_submitted': 'created_at',
+        'grading_status': 'grading_status',
+        'lock_status': 'lock_status',
+    }
+
+    # Largest number of submissions that claim_next_submissions reserves at once
+    CLAIM_NEXT_SUBMISSIONS_MAX_COUNT = 25
+
     @XBlock.json_handler
     @require_course_staff("STUDENT_GRADE")
     @require_submission_uuid(validate=False)
@@ -94,7 +118,7 @@ class StaffGraderMixin:
         anonymous_user_id = self.get_anonymous_user_id_from_xmodule_runtime()
         context = {'user_id': anonymous_user_id}
 
-        submission_lock = SubmissionGradingLock.get_submission_lock(submission_uuid) or {}
+        submission_lock = get_lock_store().get_submission_lock(submission_uuid) or {}
         return SubmissionLockSerializer(submission_lock, context=context).data
 
     @XBlock.json_handler
@@ -114,7 +138,7 @@ class StaffGraderMixin:
         context = {'user_id': anonymous_user_id}
 
         try:
-            submission_lock = SubmissionGradingLock.claim_submission_lock(submission_uuid, anonymous_user_id)
+            submission_lock = get_lock_store().claim_submission_lock(submission_uuid, anonymous_user_id)
             return SubmissionLockSerializer(submission_lock, context=context).data
         except SubmissionLockContestedError as err:
             raise JsonHandlerError(403, err.get_error_code()) from err
@@ -136,7 +160,7 @@ class StaffGraderMixin:
         context = {'user_id': anonymous_user_id}
 
         try:
-            SubmissionGradingLock.clear_submission_lock(submission_uuid, anonymous_user_id)
+            get_lock_store().clear_submission_lock(submission_uuid, anonymous_user_id)
             return SubmissionLockSerializer({}, context=context).data
         except SubmissionLockContestedError as err:
             raise JsonHandlerError(403, err.get_error_code()) from err
@@ -162,7 +186,7 @@ class StaffGraderMixin:
             raise JsonHandlerError(500, "Failed to get anonymous user ID")
 
         try:
-            SubmissionGradingLock.batch_clear_submission_locks(
+            get_lock_store().batch_clear_submission_locks(
                 submission_uuids, anonymous_user_id
             )
         except Exception as err:
@@ -174,33 +198,284 @@ class StaffGraderMixin:
         """
         Returns data for the base "list" view, showing a summary of all graded / gradable items in the given assignment
 
+        Optional filters (see _filter_staff_workflows): grading_status, lock_status, username,
+        submitted_after, submitted_before.
+
+        Optional ordering: sort_by (one of LIST_STAFF_WORKFLOWS_SORT_FIELDS) and sort_order ("asc" / "desc").
+
+        When "page_size" or "cursor" is provided, only a single page of workflows is returned, and user data
+        and assessments are only looked up for that page. Pass the returned "next_cursor" back in to
+        fetch the following page; it is null on the last page.
+
         Example Data Shape:
         {
             submission_uuid:
         }
+
+        Example Paginated Data Shape:
+        {
+            "submissions": {
+                submission_uuid:
+            },
+            "next_cursor": "WyJkYXRlX3N1Ym1pdHRlZCIsIC..."
+        }
         """
         # Calculate this once so we don't have to re-query each time
         is_team_assignment = self.is_team_assignment()
 
-        # Fetch staff workflows, annotated with grading_status and lock_status
-        staff_workflows = self._bulk_fetch_annotated_staff_workflows(is_team_assignment=is_team_assignment)
+        # Fetch staff workflows, annotated with grading_status and, when the lock store can or the request
+        # filters or sorts on it, lock_status
+        lock_store = get_lock_store()
+        annotate_locks = self._annotate_locks_in_query(lock_store, data)
+        staff_workflows = self._bulk_fetch_annotated_staff_workflows(
+            is_team_assignment=is_team_assignment, annotate_locks=annotate_locks
+        )
+        staff_workflows = self._filter_staff_workflows(staff_workflows, data, is_team_assignment=is_team_assignment)
 
-        # Lookup additional info like usernames and assessments and determine serializer type
-        serializer = TeamSubmissionListSerializer if is_team_assignment else SubmissionListSerializer
+        if 'page_size' in data or 'cursor' in data:
+            staff_workflows, next_cursor = self._get_staff_workflows_page(staff_workflows, data)
+            if not annotate_locks:
+                staff_workflows = self._set_lock_statuses(staff_workflows, lock_store)
+            return {
+                'submissions': self._serialize_staff_workflows(staff_workflows, is_team_assignment),
+                'next_cursor': next_cursor,
+            }
+
+        if 'sort_by' in data or 'sort_order' in data:
+            sort_by, descending = self._parse_staff_workflows_sort(data)
+            staff_workflows = staff_workflows.order_by(*self._staff_workflows_ordering(sort_by, descending))
+        if not annotate_locks:
+            staff_workflows = self._set_lock_statuses(staff_workflows, lock_store)
+
+        return self._serialize_staff_workflows(staff_workflows, is_team_assignment)
+
+    @XBlock.json_handler
+    @require_course_staff("STUDENT_GRADE")
+    def count_staff_workflows(self, data, suffix=''):  # pylint: disable=unused-argument
+        """
+        Returns the number of staff workflows that list_staff_workflows would list for the same filters,
+        without fetching any user data or assessments.
+
+        Example Data Shape:
+        {
+            "count": 42
+        }
+        """
+        is_team_assignment = self.is_team_assignment()
+        staff_workflows = self._bulk_fetch_annotated_staff_workflows(
+            is_team_assignment=is_team_assignment,
+            annotate_locks=self._annotate_locks_in_query(get_lock_store(), data),
+        )
+        staff_workflows = self._filter_staff_workflows(staff_workflows, data, is_team_assignment=is_team_assignment)
+        return {'count': staff_workflows.count()}
+
+    @staticmethod
+    def _annotate_locks_in_query(lock_store, data):
+        """
+        Returns: whether to annotate staff workflows with their lock status in the query, rather than looking up
+        the locks of the workflows returned once they are selected. Stores that can't look locks up in SQL
+        annotate every workflow of the item, so this is only worth it to filter or sort on lock status.
+        """
+        if lock_store.LOCK_OWNER_EXPRESSION_IN_QUERY:
+            return True
+        return bool(data.get('lock_status')) or data.get('sort_by') == 'lock_status'
+
+    def _set_lock_statuses(self, staff_workflows, lock_store):
+        """
+        Set current_lock_user and lock_status, as _bulk_fetch_annotated_staff_workflows annotates them, on
+        staff workflows fetched without them, with a single lookup of their locks.
+
+        Returns: list of the staff workflows
+        """
+        staff_workflows = list(staff_workflows)
+        lock_owners = lock_store.get_active_lock_owners(
+            [staff_workflow.identifying_uuid for staff_workflow in staff_workflows]
+        )
+        student_id = self.get_student_item_dict()['student_id']
+        for staff_workflow in staff_workflows:
+            staff_workflow.current_lock_user = lock_owners.get(staff_workflow.identifying_uuid)
+            if staff_workflow.current_lock_user is None:
+                staff_workflow.lock_status = "unlocked"
+            elif staff_workflow.current_lock_user == student_id:
+                staff_workflow.lock_status = "in-progress"
+            else:
+                staff_workflow.lock_status = "locked"
+        return staff_workflows
+
+    def _serialize_staff_workflows(self, staff_workflows, is_team_assignment):
+        """
+        Serialize the given staff workflows for the list view, keyed by identifying uuid
+        """
+        # Lookup additional info like usernames and assessments and determine row builder type
+        row_builder = TeamSubmissionListRowBuilder if is_team_assignment else SubmissionListRowBuilder
         serializer_context = self._get_list_workflows_serializer_context(
             staff_workflows, is_team_assignment=is_team_assignment
         )
+        build_row = row_builder(serializer_context)
 
         # Serialize workflows with the context, and return the dict of submissions
         result = {}
         for staff_workflow in staff_workflows:
             try:
-                serialized_workflow = serializer(staff_workflow, context=serializer_context).data
-                result[staff_workflow.identifying_uuid] = serialized_workflow
+                result[staff_workflow.identifying_uuid] = build_row(staff_workflow)
             except MissingContextException as e:
                 log.exception("Failed to serialize workflow %d: %s", staff_workflow.id, str(e), exc_info=True)
         return result
 
+    def _filter_staff_workflows(self, staff_workflows, data, is_team_assignment=False):
+        """
+        Apply the optional list filters from the request data to annotated staff workflows.
+
+        Supported filters:
+         - grading_status: "graded" or "ungraded"
+         - lock_status: "in-progress", "locked" or "unlocked"
+         - username: only individual submissions by learners whose username contains this text
+         - submitted_after / submitted_before: ISO 8601 datetimes bounding the submission date
+
+        Raises:
+        - 400 if a filter value is invalid
+        """
+        grading_status = data.get('grading_status')
+        if grading_status:
+            if grading_status not in self.LIST_STAFF_WORKFLOWS_GRADING_STATUSES:
+                raise JsonHandlerError(400, f"Invalid grading_status {grading_status}")
+            staff_workflows = staff_workflows.filter(grading_status=grading_status)
+
+        lock_status = data.get('lock_status')
+        if lock_status:
+            if lock_status not in self.LIST_STAFF_WORKFLOWS_LOCK_STATUSES:
+                raise JsonHandlerError(400, f"Invalid lock_status {lock_status}")
+            staff_workflows = staff_workflows.filter(lock_status=lock_status)
+
+        for param, lookup in (('submitted_after', 'created_at__gte'), ('submitted_before', 'created_at__lt')):
+            if data.get(param):
+                staff_workflows = staff_workflows.filter(**{lookup: self._parse_filter_datetime(param, data[param])})
+
+        username = data.get('username')
+        if username:
+            if is_team_assignment:
+                raise JsonHandlerError(400, "Filtering by username is not supported for team assignments")
+            student_item_dict = self.get_student_item_dict()
+            anonymous_ids = map_username_search_to_anonymized_ids(
+                username, student_item_dict['course_id'], student_item_dict['item_id']
+            )
+            submission_uuids = Submission.objects.filter(
+                student_item__course_id=student_item_dict['course_id'],
+                student_item__item_id=student_item_dict['item_id'],
+                student_item__student_id__in=anonymous_ids,
+            ).values_list('uuid', flat=True)
+            # Submission.uuid is a UUIDField, while StaffWorkflow.submission_uuid is a CharField
+            staff_workflows = staff_workflows.filter(
+                submission_uuid__in=[str(submission_uuid) for submission_uuid in submission_uuids]
+            )
+
+        return staff_workflows
+
+    @staticmethod
+    def _parse_filter_datetime(param, value):
+        """
+        Parse an ISO 8601 datetime filter value, treating naive datetimes as UTC
+        """
+        try:
+            parsed = parse_datetime(str(value))
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise JsonHandlerError(400, f"Invalid {param} {value}")
+        if is_naive(parsed):
+            parsed = make_aware(parsed, timezone.utc)
+        return parsed
+
+    def _parse_staff_workflows_sort(self, data):
+        """
+        Returns: (sort_by, descending) for the list view, defaulting to oldest submissions first
+
+        Raises:
+        - 400 for an unsupported sort_by or sort_order
+        """
+        sort_by = data.get('sort_by') or 'date_submitted'
+        if sort_by not in self.LIST_STAFF_WORKFLOWS_SORT_FIELDS:
+            raise JsonHandlerError(400, f"Invalid sort_by {sort_by}")
+
+        sort_order = data.get('sort_order') or 'asc'
+        if sort_order not in ('asc', 'desc'):
+            raise JsonHandlerError(400, f"Invalid sort_order {sort_order}")
+
+        return sort_by, sort_order == 'desc'
+
+    def _staff_workflows_ordering(self, sort_by, descending):
+        """
+        Returns: order_by() arguments for sort_by, using the primary key to break ties
+        """
+        prefix = '-' if descending else ''
+        return f'{prefix}{self.LIST_STAFF_WORKFLOWS_SORT_FIELDS[sort_by]}', f'{prefix}pk'
+
+    def _get_staff_workflows_page(self, staff_workflows, data):
+        """
+        Select a single page of staff workflows using keyset pagination.
+
+        The cursor records the sort value and primary key of the last workflow on the previous page, so each page
+        is a single indexed query no matter how deep into the list it is.
+
+        Returns: (list of workflows on the page, cursor for the next page or None)
+
+        Raises:
+        - 400 for an invalid page_size or cursor
+        """
+        try:
+            page_size = int(data.get('page_size', self.LIST_STAFF_WORKFLOWS_MAX_PAGE_SIZE))
+        except (TypeError, ValueError) as err:
+            raise JsonHandlerError(400, f"Invalid page_size {data.get('page_size')}") from err
+        if page_size < 1:
+            raise JsonHandlerError(400, f"Invalid page_size {page_size}")
+        page_size = min(page_size, self.LIST_STAFF_WORKFLOWS_MAX_PAGE_SIZE)
+
+        sort_by, descending = self._parse_staff_workflows_sort(data)
+        sort_field = self.LIST_STAFF_WORKFLOWS_SORT_FIELDS[sort_by]
+
+        if data.get('cursor'):
+            sort_value, last_pk = self._decode_staff_workflows_cursor(data['cursor'], sort_by)
+            lookup = 'lt' if descending else 'gt'
+            past_sort_value = Q(**{f'{sort_field}__{lookup}': sort_value})
+            past_pk = Q(**{sort_field: sort_value, f'pk__{lookup}': last_pk})
+            staff_workflows = staff_workflows.filter(past_sort_value | past_pk)
+
+        # Fetch one extra row to find out whether there is another page
+        page = list(staff_workflows.order_by(*self._staff_workflows_ordering(sort_by, descending))[:page_size + 1])
+        next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            next_cursor = self._encode_staff_workflows_cursor(page[-1], sort_by)
+        return page, next_cursor
+
+    def _encode_staff_workflows_cursor(self, staff_workflow, sort_by):
+        """
+        Returns: an opaque cursor pointing just past the given workflow in the sort_by ordering
+        """
+        sort_value = getattr(staff_workflow, self.LIST_STAFF_WORKFLOWS_SORT_FIELDS[sort_by])
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        cursor = json.dumps([sort_by, sort_value, staff_workflow.pk])
+        return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('ascii')
+
+    def _decode_staff_workflows_cursor(self, cursor, sort_by):
+        """
+        Returns: (sort value, primary key) stored in a cursor created by _encode_staff_workflows_cursor
+
+        Raises:
+        - 400 if the cursor is malformed or was created for a different sort_by
+        """
+        try:
+            cursor_sort_by, sort_value, last_pk = json.loads(base64.urlsafe_b64decode(str(cursor)))
+            if sort_by == 'date_submitted':
+                sort_value = datetime.fromisoformat(sort_value)
+            last_pk = int(last_pk)
+        except (TypeError, ValueError) as err:
+            raise JsonHandlerError(400, "Invalid cursor") from err
+        if cursor_sort_by != sort_by:
+            raise JsonHandlerError(400, "Cursor does not match sort_by")
+        return sort_value, last_pk
+
     @XBlock.json_handler
     @require_course_staff("STUDENT_GRADE")
     def list_assessments_to(self, data: dict, suffix="") -> List[dict]:  # pylint: disable=unused-argument
@@ -293,13 +568,14 @@ class StaffGraderMixin:
 
         return context
 
-    def _bulk_fetch_annotated_staff_workflows(self, is_team_assignment=False):
+    def _bulk_fetch_annotated_staff_workflows(self, is_team_assignment=False, annotate_locks=True):
         """
         Returns: QuerySet of StaffWorkflows, filtered by the current course and item, with the following annotations:
-         - current_lock_user: The "owner_id" of the most recent active (created less than TIME_LIMIT ago) lock
          - grading_status: one of
                               * "graded"   - the StaffWorkflow has an associated Assessment
                               * "ungraded" - the StaffWorkflow has no asociated Assessment
+        and, when annotate_locks is True:
+         - current_lock_user: The "owner_id" of the most recent active (created less than TIME_LIMIT ago) lock
         - lock_status: one of
                               * "in-progress" - current_lock_user is the current user's anonymous id.
                                                 The current user has an active lock on this submission.
@@ -308,8 +584,6 @@ class StaffGraderMixin:
                               * "unlocked"    - current_lock_user is null
                                                 There is no active lock on this submission.
         """
-        # Create an unevaluated QuerySet of "active" SubmissionLock objects that refer to the same submission as the
-        # "current" workflow
         student_item_dict = self.get_student_item_dict()
 
         # Return TeamStaffWorkflows for teams, StaffWorkflows for individual
@@ -320,23 +594,24 @@ class StaffGraderMixin:
             workflow_type = StaffWorkflow
             identifying_uuid = 'submission_uuid'
 
-        newest_lock = SubmissionGradingLock.currently_active().filter(
-            submission_uuid=OuterRef(identifying_uuid)
-        ).order_by(
-            '-created_at'
-        )
-
         staff_workflows = workflow_type.objects.filter(
             course_id=student_item_dict['course_id'],
             item_id=student_item_dict['item_id'],
             cancelled_at=None,
-        ).annotate(
-            current_lock_user=Subquery(newest_lock.values('owner_id')),
         ).annotate(
             grading_status=Case(
                 When(assessment__isnull=False, then=Value("graded", output_field=CharField())),
                 default=Value("ungraded", output_field=CharField())
             ),
+        )
+        if not annotate_locks:
+            return staff_workflows
+
+        # Annotate the owner of the active lock on each workflow's submission. With the database lock store this is
+        # a correlated subquery on SubmissionGradingLock, other stores look the locks up in bulk.
+        return staff_workflows.annotate(
+            current_lock_user=get_lock_store().lock_owner_expression(staff_workflows, identifying_uuid),
+        ).annotate(
             lock_status=Case(
                 When(
                     current_lock_user=student_item_dict['student_id'],
@@ -349,7 +624,6 @@ class StaffGraderMixin:
                 default=Value("unlocked", output_field=CharField())
             )
         )
-        return staff_workflows
 
     def bulk_deep_fetch_assessments(self, staff_workflows):
         """
@@ -407,9 +681,21 @@ class StaffGraderMixin:
                 submission = get_team_submission(submission_uuid)
             else:
                 submission = get_submission(submission_uuid)
-            answer = OraSubmissionAnswerFactory.parse_submission_raw_answer(submission.get('answer'))
         except SubmissionError as err:
             raise JsonHandlerError(404, str(err)) from err
+
+        return self._serialize_submission_response(submission)
+
+    @staticmethod
+    def _serialize_submission_response(submission):
+        """
+        Returns: dict of the text responses and uploaded files (with download urls) for a serialized submission
+
+        Raises:
+        - 500 if the submission answer is in an unknown format
+        """
+        try:
+            answer = OraSubmissionAnswerFactory.parse_submission_raw_answer(submission.get('answer'))
         except VersionNotFoundException as err:
             raise JsonHandlerError(500, str(err)) from err
 
@@ -421,6 +707,104 @@ class StaffGraderMixin:
             'text': answer.get_text_responses()
         }
 
+    @XBlock.json_handler
+    @require_course_staff("STUDENT_GRADE")
+    def claim_next_submissions(self, data, suffix=''):  # pylint: disable=unused-argument
+        """
+        Reserve the next submissions for the current user to grade, and return everything needed to grade them
+        in a single response, so the grading UI can prefetch them.
+
+        data: {
+            'count': (int) number of submissions to reserve [defaults to 1, at most CLAIM_NEXT_SUBMISSIONS_MAX_COUNT]
+        }
+
+        Returns: {
+            'submissions': list, oldest first, of {
+                'submission_uuid': <(team) submission uuid>
+                'response': <submission info, as returned by get_submission_info>
+                'assessment': <existing assessment, as returned by get_assessment_info>
+                'lock_status': 'in-progress'
+            }
+        }
+
+        Each submission is also locked for the current user. Submissions that another user has locked in
+        the meantime are left out, so fewer than `count` submissions may be returned.
+
+        Raises:
+        - 400 for an invalid count
+        - 500 for errors reserving or fetching submissions
+        """
+        try:
+            count = int(data.get('count', 1))
+        except (TypeError, ValueError) as err:
+            raise JsonHandlerError(400, f"Invalid count {data.get('count')}") from err
+        if count < 1:
+            raise JsonHandlerError(400, f"Invalid count {count}")
+        count = min(count, self.CLAIM_NEXT_SUBMISSIONS_MAX_COUNT)
+
+        anonymous_user_id = self.get_anonymous_user_id_from_xmodule_runtime()
+        if not anonymous_user_id:
+            raise JsonHandlerError(500, "Failed to get anonymous user ID")
+
+        student_item_dict = self.get_student_item_dict()
+        is_team_assignment = self.is_team_assignment()
+        if is_team_assignment:
+            api, workflow_type, workflow_uuid_field = team_staff_api, TeamStaffWorkflow, 'team_submission_uuid'
+            identifying_uuid = 'team_submission_uuid'
+        else:
+            api, workflow_type, workflow_uuid_field = staff_api, StaffWorkflow, 'submission_uuid'
+            identifying_uuid = 'uuid'
+
+        try:
+            submissions = api.get_submissions_to_assess(
+                student_item_dict['course_id'], student_item_dict['item_id'], anonymous_user_id, count
+            )
+        except StaffAssessmentError as err:
+            raise JsonHandlerError(500, str(err)) from err
+
+        # Lock the reserved submissions, skipping any that someone else has started grading in the ESG
+        lock_store = get_lock_store()
+        locked_submissions, skipped_uuids = [], []
+        for submission in submissions:
+            try:
+                lock_store.claim_submission_lock(str(submission[identifying_uuid]), anonymous_user_id)
+                locked_submissions.append(submission)
+            except SubmissionLockContestedError:
+                log.info("Skipping reserved submission %s, locked by another user", submission[identifying_uuid])
+                skipped_uuids.append(str(submission[identifying_uuid]))
+
+        # Give the skipped submissions back, rather than keep them reserved until the reservation times out
+        if skipped_uuids:
+            try:
+                api.release_submissions_to_assess(
+                    student_item_dict['course_id'], student_item_dict['item_id'], anonymous_user_id, skipped_uuids
+                )
+            except StaffAssessmentError as err:
+                raise JsonHandlerError(500, str(err)) from err
+
+        submission_uuids = [str(submission[identifying_uuid]) for submission in locked_submissions]
+        workflows = workflow_type.objects.filter(
+            course_id=student_item_dict['course_id'],
+            item_id=student_item_dict['item_id'],
+            **{f'{workflow_uuid_field}__in': submission_uuids},
+        )
+        assessments = self.bulk_deep_fetch_assessments(workflows)
+
+        return {
+            'submissions': [
+                {
+                    'submission_uuid': submission_uuid,
+                    'response': self._serialize_submission_response(submission),
+                    'assessment': (
+                        AssessmentSerializer(assessments[submission_uuid]).data
+                        if submission_uuid in assessments else {}
+                    ),
+                    'lock_status': 'in-progress',
+                }
+                for submission_uuid, submission in zip(submission_uuids, locked_submissions)
+            ]
+        }
+
     @XBlock.json_handler
     @require_course_staff("STUDENT_GRADE")
     @require_submission_uuid(validate=True)
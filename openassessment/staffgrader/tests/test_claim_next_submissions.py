@@ -0,0 +1,131 @@
+""" Tests for the claim_next_submissions endpoint """
+from mock import Mock, patch
+
+from openassessment.assessment.errors.staff import StaffAssessmentInternalError
+from openassessment.staffgrader.lock_stores import get_lock_store
+from openassessment.xblock.test.base import scenario
+from openassessment.staffgrader.tests.test_base import StaffGraderMixinTestBase
+
+
+class ClaimNextSubmissionsTests(StaffGraderMixinTestBase):
+    """ Tests for the claim_next_submissions handler endpoint """
+
+    handler_name = 'claim_next_submissions'
+
+    @staticmethod
+    def _answer(text):
+        return {
+            'parts': [{'text': text}],
+            'file_keys': [f'key-{text}'],
+            'files_descriptions': [f'description-{text}'],
+            'files_names': [f'filename-{text}'],
+            'files_sizes': [100],
+        }
+
+    def _expected_response(self, text):
+        return {
+            'files': [{
+                'download_url': f'www.file_url.com/key-{text}',
+                'description': f'description-{text}',
+                'name': f'filename-{text}',
+                'size': 100,
+            }],
+            'text': [text],
+        }
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_no_access(self, xblock):
+        xblock.xmodule_runtime = Mock(user_is_staff=False)
+        response = self.request(xblock, {'count': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('You do not have permission to access ORA staff grading.', response.body.decode('UTF-8'))
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_invalid_count(self, xblock):
+        self.set_staff_user(xblock, 'Bob')
+        for count in (0, 'lots'):
+            response = self.request(xblock, {'count': count})
+            self.assertEqual(response.status_code, 400)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_claim_next_submissions(self, xblock):
+        """ The next submissions are reserved and locked, and returned with their responses and assessments """
+        submissions = [
+            self._create_student_and_submission(f'student-{i}', self._answer(f'answer-{i}'))[0]
+            for i in range(4)
+        ]
+
+        self.set_staff_user(xblock, 'Bob')
+        with self._mock_get_download_url():
+            response = self.request(xblock, {'count': 3})
+
+        response_body = self.assert_status_code_and_parse_json(response, 200)
+        self.assertEqual(
+            response_body,
+            {
+                'submissions': [
+                    {
+                        'submission_uuid': submissions[i]['uuid'],
+                        'response': self._expected_response(f'answer-{i}'),
+                        'assessment': {},
+                        'lock_status': 'in-progress',
+                    }
+                    for i in range(3)
+                ]
+            }
+        )
+        lock_owners = get_lock_store().get_active_lock_owners([submission['uuid'] for submission in submissions])
+        self.assertEqual(lock_owners, {submissions[i]['uuid']: 'Bob' for i in range(3)})
+
+        # Another staff member gets what is left
+        self.set_staff_user(xblock, 'Alice')
+        with self._mock_get_download_url():
+            response_body = self.assert_status_code_and_parse_json(self.request(xblock, {'count': 3}), 200)
+        self.assertEqual(
+            [submission['submission_uuid'] for submission in response_body['submissions']],
+            [submissions[3]['uuid']],
+        )
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_skip_locked_submissions(self, xblock):
+        """ Submissions that another user has locked in the staff grader are left out """
+        submissions = [
+            self._create_student_and_submission(f'student-{i}', self._answer(f'answer-{i}'))[0]
+            for i in range(2)
+        ]
+        get_lock_store().claim_submission_lock(submissions[0]['uuid'], 'Alice')
+
+        self.set_staff_user(xblock, 'Bob')
+        with self._mock_get_download_url():
+            response_body = self.assert_status_code_and_parse_json(self.request(xblock, {'count': 2}), 200)
+
+        self.assertEqual(
+            [submission['submission_uuid'] for submission in response_body['submissions']],
+            [submissions[1]['uuid']],
+        )
+
+        # The skipped submission isn't kept reserved, so the user grading it can reserve it
+        self.set_staff_user(xblock, 'Alice')
+        with self._mock_get_download_url():
+            response_body = self.assert_status_code_and_parse_json(self.request(xblock, {'count': 2}), 200)
+
+        self.assertEqual(
+            [submission['submission_uuid'] for submission in response_body['submissions']],
+            [submissions[0]['uuid']],
+        )
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_nothing_to_claim(self, xblock):
+        self.set_staff_user(xblock, 'Bob')
+        response = self.request(xblock, {'count': 5})
+        self.assert_response(response, 200, {'submissions': []})
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
+    def test_api_error(self, xblock):
+        self.set_staff_user(xblock, 'Bob')
+        with patch(
+            'openassessment.staffgrader.staff_grader_mixin.staff_api.get_submissions_to_assess',
+            side_effect=StaffAssessmentInternalError('oh no'),
+        ):
+            response = self.request(xblock, {'count': 5})
+        self.assert_response(response, 500, {'error': 'oh no'})
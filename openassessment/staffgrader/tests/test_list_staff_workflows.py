@@ -7,12 +7,15 @@ import json
 import random
 
 import ddt
+from django.test.utils import override_settings
 from freezegun import freeze_time
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 from submissions import api as sub_api
 
 from openassessment.assessment.models.base import Assessment
+from openassessment.staffgrader.lock_stores import cache as cache_lock_store, get_lock_store
 from openassessment.staffgrader.models import SubmissionGradingLock
+from openassessment.test_utils import QueryBudgetMixin
 from openassessment.tests.factories import (
     AssessmentFactory,
     AssessmentPartFactory,
@@ -303,7 +306,7 @@ class TestStaffWorkflowListViewBase(XBlockHandlerTestCase):
         The target student's submission will be locked by the target staff.
         """
         for submission_index, staff_index in lock_config:
-            SubmissionGradingLock.claim_submission_lock(
+            get_lock_store().claim_submission_lock(
                 self.students[submission_index].submission['uuid'],
                 self.course_staff[staff_index].student_id
             )
@@ -365,6 +368,29 @@ class StaffWorkflowListViewIntegrationTests(TestStaffWorkflowListViewBase):
 
         self.assertDictEqual(response, expected)
 
+    @freeze_time(TEST_START_DATE)
+    @override_settings(ORA_SUBMISSION_LOCK_STORE='cache')
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_locked_cache_lock_store(self, xblock):
+        """ Lock status is read from the cache lock store when it is configured """
+        self.setup_active_locks([(0, 2), (2, 0)])
+
+        self.set_staff_user(xblock)
+        with self._mock_map_anonymized_ids_to_user_data():
+            response = self.request(xblock, 'list_staff_workflows', json.dumps({}), response_format='json')
+            count = self.request(
+                xblock, 'count_staff_workflows', json.dumps({'lock_status': 'locked'}), response_format='json'
+            )['count']
+
+        self.assertFalse(SubmissionGradingLock.objects.exists())
+        expected = {}
+        self.add_expected_response_dict(expected, self.students[0], locked_by=self.course_staff[2])
+        self.add_expected_response_dict(expected, self.students[1])
+        self.add_expected_response_dict(expected, self.students[2], locked_by=self.course_staff[0])
+        self.add_expected_response_dict(expected, self.students[3])
+        self.assertDictEqual(response, expected)
+        self.assertEqual(count, 1)
+
     @scenario('data/simple_self_staff_scenario.xml', user_id='Bob')
     def test_not_staff(self, xblock):
         response = self.request(xblock, 'list_staff_workflows', '{}')
@@ -374,6 +400,198 @@ class StaffWorkflowListViewIntegrationTests(TestStaffWorkflowListViewBase):
         )
 
 
+@ddt.ddt
+class StaffWorkflowListViewPaginationTests(TestStaffWorkflowListViewBase):
+    """
+    Tests for the pagination, filtering, and sorting options of list_staff_workflows, and for count_staff_workflows
+    """
+
+    def list_staff_workflows(self, xblock, **data):
+        """ Call list_staff_workflows as course staff with the given request data """
+        self.set_staff_user(xblock)
+        with self._mock_map_anonymized_ids_to_user_data():
+            return self.request(xblock, 'list_staff_workflows', json.dumps(data), response_format='json')
+
+    def count_staff_workflows(self, xblock, **data):
+        """ Call count_staff_workflows as course staff with the given request data """
+        self.set_staff_user(xblock)
+        return self.request(xblock, 'count_staff_workflows', json.dumps(data), response_format='json')['count']
+
+    def submission_uuids_in_pk_order(self, reverse=False):
+        """ All submission uuids for the test students, ordered by workflow primary key """
+        return [
+            self.students[index].submission['uuid']
+            for index in (range(3, -1, -1) if reverse else range(4))
+        ]
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_paginate(self, xblock):
+        """ Following next_cursor walks through every workflow exactly once """
+        first_page = self.list_staff_workflows(xblock, page_size=3)
+        self.assertEqual(len(first_page['submissions']), 3)
+        self.assertIsNotNone(first_page['next_cursor'])
+
+        second_page = self.list_staff_workflows(xblock, page_size=3, cursor=first_page['next_cursor'])
+        self.assertEqual(len(second_page['submissions']), 1)
+        self.assertIsNone(second_page['next_cursor'])
+
+        expected = {}
+        for student in self.students:
+            self.add_expected_response_dict(expected, student)
+        self.assertDictEqual({**first_page['submissions'], **second_page['submissions']}, expected)
+        self.assertEqual(
+            list(first_page['submissions']) + list(second_page['submissions']),
+            self.submission_uuids_in_pk_order(),
+        )
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_paginate_descending(self, xblock):
+        """ Pages can be walked newest first """
+        first_page = self.list_staff_workflows(xblock, page_size=2, sort_order='desc')
+        second_page = self.list_staff_workflows(
+            xblock, page_size=2, sort_order='desc', cursor=first_page['next_cursor']
+        )
+        self.assertIsNone(second_page['next_cursor'])
+        self.assertEqual(
+            list(first_page['submissions']) + list(second_page['submissions']),
+            self.submission_uuids_in_pk_order(reverse=True),
+        )
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_page_only_looks_up_page_users(self, xblock):
+        """ User data is only requested for the learners on the current page """
+        self.set_staff_user(xblock)
+        with self._mock_map_anonymized_ids_to_user_data() as mock_map_user_data:
+            self.request(xblock, 'list_staff_workflows', json.dumps({'page_size': 1}), response_format='json')
+        mock_map_user_data.assert_called_once_with({self.students[0].student_id})
+
+    @override_settings(ORA_SUBMISSION_LOCK_STORE='cache')
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_page_only_looks_up_page_locks(self, xblock):
+        """ Locks the database can't look up are only looked up for the workflows on the current page """
+        self.setup_active_locks([(0, 1), (3, 1)])
+        with patch.object(
+            cache_lock_store.LockStore,
+            'get_active_lock_owners',
+            autospec=True,
+            side_effect=cache_lock_store.LockStore.get_active_lock_owners,
+        ) as mock_get_lock_owners:
+            page = self.list_staff_workflows(xblock, page_size=2)
+
+        mock_get_lock_owners.assert_called_once_with(ANY, self.submission_uuids_in_pk_order()[:2])
+        expected = {}
+        self.add_expected_response_dict(expected, self.students[0], locked_by=self.course_staff[1])
+        self.add_expected_response_dict(expected, self.students[1])
+        self.assertDictEqual(page['submissions'], expected)
+
+    @freeze_time(TEST_START_DATE)
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_sort_by_grading_status(self, xblock):
+        """ Sorting by grading status puts graded submissions first, and pages keep that order """
+        self.setup_completed_assessments(xblock, [(1, 0, "Two"), (3, 1, "One")])
+
+        first_page = self.list_staff_workflows(xblock, page_size=3, sort_by='grading_status')
+        second_page = self.list_staff_workflows(
+            xblock, page_size=3, sort_by='grading_status', cursor=first_page['next_cursor']
+        )
+        uuids = list(first_page['submissions']) + list(second_page['submissions'])
+        self.assertEqual(uuids, [self.students[index].submission['uuid'] for index in (1, 3, 0, 2)])
+
+        # Unpaginated requests are sorted the same way
+        self.assertEqual(list(self.list_staff_workflows(xblock, sort_by='grading_status')), uuids)
+
+    @freeze_time(TEST_START_DATE)
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_filter_grading_status(self, xblock):
+        """ Filter by grading status, with and without pagination """
+        self.setup_completed_assessments(xblock, [(0, 0, "Three")])
+
+        expected = {}
+        self.add_expected_response_dict(expected, self.students[0], graded_by=self.course_staff[0], expected_score=6)
+        self.assertDictEqual(self.list_staff_workflows(xblock, grading_status='graded'), expected)
+        self.assertDictEqual(
+            self.list_staff_workflows(xblock, grading_status='graded', page_size=10),
+            {'submissions': expected, 'next_cursor': None},
+        )
+        self.assertEqual(self.count_staff_workflows(xblock, grading_status='graded'), 1)
+        self.assertEqual(self.count_staff_workflows(xblock, grading_status='ungraded'), 3)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_filter_lock_status(self, xblock):
+        """ Filter by lock status, relative to the requesting user """
+        self.setup_active_locks([(0, 0), (1, 1), (2, 1)])
+
+        expected = {}
+        self.add_expected_response_dict(expected, self.students[1], locked_by=self.course_staff[1])
+        self.add_expected_response_dict(expected, self.students[2], locked_by=self.course_staff[1])
+        self.assertDictEqual(self.list_staff_workflows(xblock, lock_status='locked'), expected)
+        self.assertEqual(self.count_staff_workflows(xblock, lock_status='in-progress'), 1)
+        self.assertEqual(self.count_staff_workflows(xblock, lock_status='unlocked'), 1)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_filter_username(self, xblock):
+        """ Filter by username, resolved to the matching learners' submissions """
+        with patch(
+            'openassessment.staffgrader.staff_grader_mixin.map_username_search_to_anonymized_ids',
+            return_value={self.students[2].student_id, self.course_staff[0].student_id},
+        ) as mock_username_search:
+            response = self.list_staff_workflows(xblock, username='learner_2')
+            count = self.count_staff_workflows(xblock, username='learner_2')
+
+        student_item = xblock.get_student_item_dict()
+        mock_username_search.assert_called_with('learner_2', student_item['course_id'], student_item['item_id'])
+        expected = {}
+        self.add_expected_response_dict(expected, self.students[2])
+        self.assertDictEqual(response, expected)
+        self.assertEqual(count, 1)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_filter_submitted_date(self, xblock):
+        """ Filter by submission date """
+        self.assertEqual(self.count_staff_workflows(xblock, submitted_after=SUBMITTED_DATE.isoformat()), 4)
+        self.assertEqual(self.count_staff_workflows(xblock, submitted_before=SUBMITTED_DATE.isoformat()), 0)
+        self.assertEqual(self.count_staff_workflows(xblock, submitted_after=TEST_START_DATE.isoformat()), 0)
+        self.assertEqual(self.count_staff_workflows(xblock, submitted_before='2020-03-03T00:00:00'), 4)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_count(self, xblock):
+        """ The count endpoint does a single query """
+        self.assertEqual(self.count_staff_workflows(xblock), 4)
+        self.set_staff_user(xblock)
+        with self.assertNumQueries(1):
+            self.request(xblock, 'count_staff_workflows', json.dumps({}), response_format='json')
+
+    @ddt.data(
+        {'grading_status': 'done'},
+        {'lock_status': 'mine'},
+        {'submitted_after': 'yesterday'},
+        {'sort_by': 'username'},
+        {'sort_order': 'sideways'},
+        {'page_size': 0},
+        {'page_size': 'ten'},
+        {'cursor': 'not-a-cursor'},
+    )
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_invalid_params(self, xblock, data):
+        self.set_staff_user(xblock)
+        with self._mock_map_anonymized_ids_to_user_data():
+            response = self.request(xblock, 'list_staff_workflows', json.dumps(data), response_format='response')
+        self.assertEqual(response.status_code, 400)
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_cursor_sort_mismatch(self, xblock):
+        """ A cursor can only be used with the sort it was created for """
+        cursor = self.list_staff_workflows(xblock, page_size=1)['next_cursor']
+        self.set_staff_user(xblock)
+        response = self.request(
+            xblock,
+            'list_staff_workflows',
+            json.dumps({'page_size': 1, 'cursor': cursor, 'sort_by': 'lock_status'}),
+            response_format='response',
+        )
+        self.assertEqual(response.status_code, 400)
+
+
 @ddt.ddt
 class StaffWorkflowListViewTeamTests(TestStaffWorkflowListViewBase):
     """
@@ -667,3 +885,49 @@ class StaffWorkflowListViewUnitTests(TestStaffWorkflowListViewBase):
         }
 
         self.assertDictEqual(context, expected_context)
+
+
+class StaffWorkflowListViewQueryBudgetTests(QueryBudgetMixin, TestStaffWorkflowListViewBase):
+    """
+    The number of queries made to list staff workflows does not depend on the number of workflows.
+    Raise the budget only when the new queries are intended.
+    """
+
+    LIST_STAFF_WORKFLOWS_QUERIES = 10
+
+    def _list_staff_workflows_queries(self, xblock):
+        """ List staff workflows, returning the queries made and the number of workflows listed """
+        self.set_staff_user(xblock)
+        with patch(
+            'openassessment.staffgrader.staff_grader_mixin.get_student_ids_by_submission_uuid',
+            side_effect=lambda course_id, submission_uuids: {uuid: f'student_{uuid}' for uuid in submission_uuids},
+        ):
+            with patch(
+                'openassessment.staffgrader.staff_grader_mixin.map_anonymized_ids_to_user_data',
+                side_effect=lambda anonymous_ids: {
+                    anonymous_id: {'username': anonymous_id, 'email': anonymous_id, 'fullname': anonymous_id}
+                    for anonymous_id in anonymous_ids
+                },
+            ):
+                with self.assertMaxNumQueries(self.LIST_STAFF_WORKFLOWS_QUERIES) as queries:
+                    response = self.request(xblock, 'list_staff_workflows', json.dumps({}), response_format='json')
+        return queries.captured_queries, len(response)
+
+    def _add_staff_workflows(self, count):
+        StaffWorkflowFactory.create_batch(count, course_id=STUDENT_ITEM['course_id'], item_id=STUDENT_ITEM['item_id'])
+
+    @scenario('data/simple_self_staff_scenario.xml', user_id=STAFF_ID)
+    def test_list_staff_workflows_query_budget(self, xblock):
+        # Some of the submissions are graded, so that assessments are looked up too
+        self.setup_completed_assessments(xblock, [(0, 0, "Three"), (1, 1, "Two")])
+        self.setup_active_locks([(2, 1)])
+
+        self._add_staff_workflows(10 - len(self.students))
+        queries_for_few, listed = self._list_staff_workflows_queries(xblock)
+        self.assertEqual(listed, 10)
+
+        self._add_staff_workflows(990)
+        queries_for_many, listed = self._list_staff_workflows_queries(xblock)
+        self.assertEqual(listed, 1000)
+
+        self.assertQueriesPerItem(queries_for_few, queries_for_many, 990, 0)
@@ -0,0 +1,235 @@
+"""
+Tests for submission grading lock stores
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import ddt
+from django.test.utils import override_settings
+from freezegun import freeze_time
+from mock import patch
+
+from openassessment.staffgrader.errors.submission_lock import SubmissionLockContestedError
+from openassessment.staffgrader.lock_stores import cache, database, get_lock_store
+from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+from openassessment.test_utils import CacheResetTest
+
+
+START_TIME = datetime(2021, 7, 21, 2, 56, tzinfo=timezone.utc)
+EXPIRED_TIME = START_TIME + SubmissionGradingLock.TIMEOUT + timedelta(minutes=1)
+# The lock has expired, but its cache entry is still there
+GRACE_TIME = START_TIME + SubmissionGradingLock.TIMEOUT + timedelta(seconds=cache.LockStore.ENTRY_GRACE_PERIOD // 2)
+
+
+@ddt.ddt
+class TestLockStores(CacheResetTest):
+    """ Behaviour shared by every lock store """
+
+    user_id = "foo"
+    other_user_id = "bar"
+
+    def setUp(self):
+        super().setUp()
+        self.submission_uuid = str(uuid4())
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_claim_and_get(self, store_class):
+        store = store_class()
+        assert store.get_submission_lock(self.submission_uuid) is None
+
+        with freeze_time(START_TIME):
+            new_lock = store.claim_submission_lock(self.submission_uuid, self.user_id)
+            current_lock = store.get_submission_lock(self.submission_uuid)
+
+        assert new_lock.owner_id == self.user_id
+        assert (current_lock.submission_uuid, current_lock.owner_id) == (self.submission_uuid, self.user_id)
+        assert current_lock.created_at == START_TIME
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_claim_contested(self, store_class):
+        store = store_class()
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(self.submission_uuid, self.user_id)
+            with self.assertRaises(SubmissionLockContestedError):
+                store.claim_submission_lock(self.submission_uuid, self.other_user_id)
+            assert store.get_submission_lock(self.submission_uuid).owner_id == self.user_id
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_reclaim(self, store_class):
+        # The owner can reclaim their lock, which restarts the timeout
+        store = store_class()
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(self.submission_uuid, self.user_id)
+        with freeze_time(START_TIME + timedelta(minutes=5)):
+            store.claim_submission_lock(self.submission_uuid, self.user_id)
+            current_lock = store.get_submission_lock(self.submission_uuid)
+        assert current_lock.created_at == START_TIME + timedelta(minutes=5)
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_claim_expired(self, store_class):
+        store = store_class()
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(self.submission_uuid, self.user_id)
+        with freeze_time(EXPIRED_TIME):
+            assert store.get_active_lock_owners([self.submission_uuid]) == {}
+            new_lock = store.claim_submission_lock(self.submission_uuid, self.other_user_id)
+            assert new_lock.owner_id == self.other_user_id
+            assert store.get_active_lock_owners([self.submission_uuid]) == {self.submission_uuid: self.other_user_id}
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_clear(self, store_class):
+        store = store_class()
+        store.claim_submission_lock(self.submission_uuid, self.user_id)
+
+        # Only the owner can clear a lock
+        with self.assertRaises(SubmissionLockContestedError):
+            store.clear_submission_lock(self.submission_uuid, self.other_user_id)
+        assert store.get_submission_lock(self.submission_uuid) is not None
+
+        store.clear_submission_lock(self.submission_uuid, self.user_id)
+        assert store.get_submission_lock(self.submission_uuid) is None
+
+        # Clearing a lock that doesn't exist does nothing
+        store.clear_submission_lock(self.submission_uuid, self.user_id)
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_batch_clear(self, store_class):
+        store = store_class()
+        my_uuids = [str(uuid4()) for _ in range(3)]
+        other_uuid = str(uuid4())
+        for submission_uuid in my_uuids:
+            store.claim_submission_lock(submission_uuid, self.user_id)
+        store.claim_submission_lock(other_uuid, self.other_user_id)
+
+        cleared = store.batch_clear_submission_locks(my_uuids[:2] + [other_uuid, str(uuid4())], self.user_id)
+
+        assert cleared == 2
+        assert store.get_active_lock_owners(my_uuids + [other_uuid]) == {
+            my_uuids[2]: self.user_id,
+            other_uuid: self.other_user_id,
+        }
+
+    @ddt.data(database.LockStore, cache.LockStore)
+    def test_get_active_lock_owners(self, store_class):
+        store = store_class()
+        submission_uuids = [str(uuid4()) for _ in range(4)]
+        store.claim_submission_lock(submission_uuids[0], self.user_id)
+        store.claim_submission_lock(submission_uuids[2], self.other_user_id)
+
+        assert store.get_active_lock_owners(submission_uuids) == {
+            submission_uuids[0]: self.user_id,
+            submission_uuids[2]: self.other_user_id,
+        }
+        assert store.get_active_lock_owners([]) == {}
+
+
+class TestCacheLockStore(CacheResetTest):
+    """ Cache lock store specifics """
+
+    def test_locks_are_not_saved_to_database(self):
+        store = cache.LockStore()
+        store.claim_submission_lock(str(uuid4()), "foo")
+        assert not SubmissionGradingLock.objects.exists()
+
+    def test_get_active_lock_owners_single_cache_call(self):
+        store = cache.LockStore()
+        submission_uuids = [str(uuid4()) for _ in range(10)]
+        store.claim_submission_lock(submission_uuids[3], "foo")
+
+        with patch.object(store.cache, 'get_many', wraps=store.cache.get_many) as mock_get_many:
+            with self.assertNumQueries(0):
+                assert store.get_active_lock_owners(submission_uuids) == {submission_uuids[3]: "foo"}
+        mock_get_many.assert_called_once()
+
+    def test_take_over_expired_entry(self):
+        store = cache.LockStore()
+        submission_uuid = str(uuid4())
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(submission_uuid, "foo")
+
+        with freeze_time(GRACE_TIME):
+            assert store.claim_submission_lock(submission_uuid, "bar").owner_id == "bar"
+
+            # The lock taken over is as good as a fresh one: neither a racing claim nor its previous owner
+            # can replace or clear it
+            with self.assertRaises(SubmissionLockContestedError):
+                store.claim_submission_lock(submission_uuid, "baz")
+            with self.assertRaises(SubmissionLockContestedError):
+                store.clear_submission_lock(submission_uuid, "foo")
+            assert store.get_active_lock_owners([submission_uuid]) == {submission_uuid: "bar"}
+
+    def test_changes_wait_for_mutex(self):
+        store = cache.LockStore()
+        submission_uuid = str(uuid4())
+        mutex_key = store._mutex_key(submission_uuid)  # pylint: disable=protected-access
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(submission_uuid, "foo")
+
+        with freeze_time(GRACE_TIME):
+            # Someone else is changing the lock entry: it is left alone
+            store.cache.add(mutex_key, "someone else", store.MUTEX_TIMEOUT)
+            with self.assertRaises(SubmissionLockContestedError):
+                store.claim_submission_lock(submission_uuid, "bar")
+            with self.assertRaises(SubmissionLockContestedError):
+                store.clear_submission_lock(submission_uuid, "foo")
+            assert store.batch_clear_submission_locks([submission_uuid], "foo") == 0
+            assert store.get_submission_lock(submission_uuid).owner_id == "foo"
+
+            # ...until they are done
+            store.cache.delete(mutex_key)
+            store.clear_submission_lock(submission_uuid, "foo")
+            assert store.get_submission_lock(submission_uuid) is None
+
+    def test_renew_while_mutex_held(self):
+        store = cache.LockStore()
+        submission_uuid = str(uuid4())
+        mutex_key = store._mutex_key(submission_uuid)  # pylint: disable=protected-access
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(submission_uuid, "foo")
+
+        with freeze_time(START_TIME + timedelta(minutes=5)):
+            # The owner renews their lock while the entry is being changed, e.g. by another renewal of theirs
+            store.cache.add(mutex_key, "someone else", store.MUTEX_TIMEOUT)
+            assert store.claim_submission_lock(submission_uuid, "foo").owner_id == "foo"
+            with self.assertRaises(SubmissionLockContestedError):
+                store.claim_submission_lock(submission_uuid, "bar")
+            assert store.get_active_lock_owners([submission_uuid]) == {submission_uuid: "foo"}
+
+    def test_clear_taken_over_lock(self):
+        store = cache.LockStore()
+        submission_uuid = str(uuid4())
+        cache_key = store._cache_key(submission_uuid)  # pylint: disable=protected-access
+        with freeze_time(START_TIME):
+            store.claim_submission_lock(submission_uuid, "foo")
+
+        # The lock is taken over between its owner reading it and clearing it
+        get_cached = store.cache.get
+
+        def take_over_after_get(key, *args, **kwargs):
+            cached = get_cached(key, *args, **kwargs)
+            if key == cache_key and cached and cached["owner_id"] == "foo":
+                new_lock = store._new_lock("bar")  # pylint: disable=protected-access
+                store.cache.set(key, new_lock, store._entry_timeout())  # pylint: disable=protected-access
+            return cached
+
+        with freeze_time(GRACE_TIME):
+            with patch.object(store.cache, 'get', side_effect=take_over_after_get):
+                with self.assertRaises(SubmissionLockContestedError):
+                    store.clear_submission_lock(submission_uuid, "foo")
+            assert store.get_active_lock_owners([submission_uuid]) == {submission_uuid: "bar"}
+
+
+class TestGetLockStore(CacheResetTest):
+    """ Tests for selecting the lock store from settings """
+
+    def test_default(self):
+        assert isinstance(get_lock_store(), database.LockStore)
+
+    @override_settings(ORA_SUBMISSION_LOCK_STORE="cache")
+    def test_cache(self):
+        assert isinstance(get_lock_store(), cache.LockStore)
+
+    @override_settings(ORA_SUBMISSION_LOCK_STORE="carrier-pigeon")
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            get_lock_store()
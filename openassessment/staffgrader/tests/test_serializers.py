@@ -3,6 +3,7 @@ Tests for serializers used in staff grading
 """
 from contextlib import contextmanager, ExitStack
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import OrderedDict
 from uuid import uuid4
 
@@ -12,7 +13,12 @@ from freezegun import freeze_time
 from mock import Mock, patch
 
 from openassessment.staffgrader.serializers.submission_list import (
-    MissingContextException, SubmissionListSerializer, SubmissionListScoreSerializer, TeamSubmissionListSerializer
+    MissingContextException,
+    SubmissionListRowBuilder,
+    SubmissionListSerializer,
+    SubmissionListScoreSerializer,
+    TeamSubmissionListRowBuilder,
+    TeamSubmissionListSerializer,
 )
 from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
 from openassessment.staffgrader.serializers.submission_lock import SubmissionLockSerializer
@@ -676,3 +682,98 @@ class TestTeamSubmissionListSerializer(BaseSerializerTest):
         ]
 
         self.assertEqual(data, expected_data)
+
+
+def _build_list_rows_and_context(num_rows, is_team_assignment=False):
+    """
+    Build annotated workflow stand-ins and a matching serializer context for the submission list.
+    Every other workflow is graded, and every third one is locked.
+    """
+    workflows = []
+    context = {
+        'anonymous_id_to_username': {},
+        'anonymous_id_to_email': {},
+        'anonymous_id_to_fullname': {},
+        'submission_uuid_to_assessment': {},
+    }
+    if is_team_assignment:
+        context.update({'team_submission_uuid_to_team_id': {}, 'team_id_to_team_name': {}})
+    else:
+        context['submission_uuid_to_student_id'] = {}
+
+    for i in range(num_rows):
+        uuid = str(uuid4())
+        graded = i % 2 == 0
+        workflow = SimpleNamespace(
+            submission_uuid=uuid if not is_team_assignment else str(uuid4()),
+            team_submission_uuid=uuid if is_team_assignment else None,
+            identifying_uuid=uuid,
+            created_at=TEST_TIME + timedelta(minutes=i),
+            grading_completed_at=TEST_TIME + timedelta(days=1) if graded else None,
+            grading_status='graded' if graded else 'ungraded',
+            lock_status='locked' if i % 3 == 0 else 'unlocked',
+            scorer_id=f'staff_{i % 4}' if graded else '',
+        )
+        workflows.append(workflow)
+        context['anonymous_id_to_username'][f'staff_{i % 4}'] = f'staff_username_{i % 4}'
+        if graded:
+            context['submission_uuid_to_assessment'][uuid] = Mock(points_earned=i % 10, points_possible=10)
+        if is_team_assignment:
+            context['team_submission_uuid_to_team_id'][uuid] = f'team_{i}'
+            context['team_id_to_team_name'][f'team_{i}'] = f'Team name {i}'
+        else:
+            context['submission_uuid_to_student_id'][uuid] = f'student_{i}'
+            context['anonymous_id_to_username'][f'student_{i}'] = f'username_{i}'
+            context['anonymous_id_to_email'][f'student_{i}'] = f'email_{i}'
+            context['anonymous_id_to_fullname'][f'student_{i}'] = f'fullname_{i}'
+    return workflows, context
+
+
+@ddt.ddt
+class TestSubmissionListRowBuilder(BaseSerializerTest):
+    """ Parity tests between the submission list row builders and the DRF serializers they replace """
+
+    @ddt.data(
+        (SubmissionListRowBuilder, SubmissionListSerializer, False),
+        (TeamSubmissionListRowBuilder, TeamSubmissionListSerializer, True),
+    )
+    @ddt.unpack
+    def test_parity(self, row_builder, serializer, is_team_assignment):
+        workflows, context = _build_list_rows_and_context(12, is_team_assignment=is_team_assignment)
+        build_row = row_builder(context)
+        for workflow in workflows:
+            expected = serializer(workflow, context=context).data
+            actual = build_row(workflow)
+            self.assertEqual(actual, expected)
+            self.assertEqual(list(actual), list(expected))
+
+    @ddt.data(
+        (SubmissionListRowBuilder, SubmissionListSerializer, False, 'anonymous_id_to_username', 'staff_0'),
+        (SubmissionListRowBuilder, SubmissionListSerializer, False, 'anonymous_id_to_username', 'student_0'),
+        (SubmissionListRowBuilder, SubmissionListSerializer, False, 'anonymous_id_to_email', 'student_0'),
+        (SubmissionListRowBuilder, SubmissionListSerializer, False, 'anonymous_id_to_fullname', 'student_0'),
+        (SubmissionListRowBuilder, SubmissionListSerializer, False, 'submission_uuid_to_student_id', None),
+        (TeamSubmissionListRowBuilder, TeamSubmissionListSerializer, True, 'team_submission_uuid_to_team_id', None),
+        (TeamSubmissionListRowBuilder, TeamSubmissionListSerializer, True, 'team_id_to_team_name', 'team_0'),
+    )
+    @ddt.unpack
+    def test_missing_row_context(self, row_builder, serializer, is_team_assignment, context_key, missing_key):
+        """ Missing data for a row raises MissingContextException, as the serializers do """
+        workflows, context = _build_list_rows_and_context(1, is_team_assignment=is_team_assignment)
+        context[context_key].pop(missing_key or workflows[0].identifying_uuid)
+
+        with self.assertRaises(MissingContextException):
+            serializer(workflows[0], context=context).data  # pylint: disable=expression-not-assigned
+        with self.assertRaises(MissingContextException):
+            row_builder(context)(workflows[0])
+
+    @ddt.data(
+        (SubmissionListRowBuilder, False),
+        (TeamSubmissionListRowBuilder, True),
+    )
+    @ddt.unpack
+    def test_missing_required_context(self, row_builder, is_team_assignment):
+        _, context = _build_list_rows_and_context(1, is_team_assignment=is_team_assignment)
+        for key in row_builder.REQUIRED_CONTEXT_KEYS:
+            with self.assertRaises(ValueError):
+                row_builder({k: v for k, v in context.items() if k != key})
@@ -20,7 +20,7 @@ from openassessment.xblock.test.base import (
 )
 
 
-@freeze_time("1969-07-20T22:56:00-04:00")
+@freeze_time("2019-07-20T22:56:00-04:00")
 class TestStaffGraderMixin(XBlockHandlerTestCase):
     """ Tests for interacting with submission grading/locking """
     test_submission_uuid = str(uuid4())
@@ -28,7 +28,7 @@ class TestStaffGraderMixin(XBlockHandlerTestCase):
     test_team_submission_uuid = str(uuid4())
     test_other_submission_uuid = str(uuid4())
 
-    test_timestamp = "1969-07-20T22:56:00-04:00"
+    test_timestamp = "2019-07-20T22:56:00-04:00"
 
     test_course_id = "course_id"
 
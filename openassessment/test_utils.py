@@ -3,13 +3,24 @@ Test utilities
 """
 
 
+from contextlib import contextmanager
+
 from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
 from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from openassessment.assessment.cache import immutable_cache
+from openassessment.assessment.models.base import RubricIndex
+from openassessment.xblock.utils.xml import clear_definitions_cache
 
 
 def _clear_all_caches():
     """Clear the default cache and any custom caches."""
     cache.clear()
+    immutable_cache.clear_local()
+    RubricIndex.clear_cache()
+    clear_definitions_cache()
 
 
 class CacheResetTest(TestCase):
@@ -36,3 +47,59 @@ class TransactionCacheResetTest(TransactionTestCase):
     def tearDown(self):
         super().tearDown()
         _clear_all_caches()
+
+
+def _format_queries(queries):
+    """Number the SQL of captured queries, one per line."""
+    return "\n".join(f"{index}. {query['sql']}" for index, query in enumerate(queries, start=1))
+
+
+class QueryBudgetMixin:
+    """
+    Assertions on the number of database queries made by ORA hot paths.
+
+    Unlike assertNumQueries, a budget is a maximum, and exceeding it fails with the SQL of
+    every query made, so that the query which was added stands out.
+    """
+
+    @contextmanager
+    def assertMaxNumQueries(self, budget, using=DEFAULT_DB_ALIAS):  # pylint: disable=invalid-name
+        """
+        Fail if the body makes more than `budget` queries. Yields the captured queries.
+        """
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        if len(context) > budget:
+            self.fail(
+                f"{len(context)} queries exceed the budget of {budget}:\n"
+                f"{_format_queries(context.captured_queries)}"
+            )
+
+    def count_queries(self, func, *args, using=DEFAULT_DB_ALIAS, **kwargs):
+        """
+        Call `func` and return the list of queries it made.
+        """
+        with CaptureQueriesContext(connections[using]) as context:
+            func(*args, **kwargs)
+        return context.captured_queries
+
+    def assertQueriesPerItem(  # pylint: disable=invalid-name
+        self, queries_for_one, queries_for_many, extra_items, budget
+    ):
+        """
+        Fail if handling `extra_items` more items made more than `budget` queries per extra item.
+        A budget of 0 asserts that the number of queries does not depend on the number of items.
+
+        Args:
+            queries_for_one (list): Queries made for the smaller set of items, from `count_queries`.
+            queries_for_many (list): Queries made for the larger set of items.
+            extra_items (int): How many more items the larger set has.
+            budget (int): The number of queries allowed for each extra item.
+        """
+        allowed = len(queries_for_one) + budget * extra_items
+        if len(queries_for_many) > allowed:
+            self.fail(
+                f"{len(queries_for_many)} queries for {extra_items} more items, "
+                f"compared to {len(queries_for_one)}, exceed the budget of {budget} per item:\n"
+                f"{_format_queries(queries_for_many)}"
+            )
@@ -24,6 +24,7 @@ from openassessment.data import (
     CsvWriter, OraAggregateData, OraDownloadData, SubmissionFileUpload, OraSubmissionAnswerFactory,
     VersionNotFoundException, ZippedListSubmissionAnswer, OraSubmissionAnswer, ZIPPED_LIST_SUBMISSION_VERSIONS,
     TextOnlySubmissionAnswer, FileMissingException, map_anonymized_ids_to_usernames, map_anonymized_ids_to_user_data,
+    map_username_search_to_anonymized_ids,
     generate_assessment_to_data, generate_assessment_from_data, generate_assessment_data, parts_summary,
 )
 from openassessment.test_utils import TransactionCacheResetTest
@@ -470,6 +471,26 @@ class TestOraAggregateData(TransactionCacheResetTest):
 
         self.assertEqual(mapping, USER_DATA_MAPPING)
 
+    def test_map_username_search_to_anonymized_ids(self):
+        sub_api.create_submission(STUDENT_ITEM, ANSWER)
+        sub_api.create_submission(PRE_FILE_SIZE_STUDENT_ITEM, ANSWER)
+        sub_api.create_submission(dict(STUDENT_ITEM, student_id=SCORER_ID, item_id="other_item"), ANSWER)
+
+        with patch('openassessment.data.get_user_model') as get_user_model_mock:
+            users = get_user_model_mock.return_value.objects.filter
+            users.return_value.values_list.return_value = [STUDENT_ID, None]
+            anonymous_ids = map_username_search_to_anonymized_ids("Student", COURSE_ID, ITEM_ID)
+
+        self.assertEqual(anonymous_ids, {STUDENT_ID})
+
+        # Only the learners of the item are searched
+        search = users.call_args.kwargs
+        self.assertEqual(search['username__icontains'], "Student")
+        self.assertCountEqual(
+            search['anonymoususerid__anonymous_user_id__in'].values_list('student_id', flat=True),
+            [STUDENT_ID, PRE_FILE_SIZE_STUDENT_ID],
+        )
+
     def test_map_students_and_scorers_ids_to_usernames(self):
         test_submission_information = [
             (
@@ -0,0 +1,156 @@
+"""
+Query budgets for the ORA data collectors used by reports and data downloads.
+
+A budget failing means a change added queries to one of these paths; the failure lists
+the SQL of every query made. Raise a budget only when the new queries are intended.
+"""
+
+
+from unittest.mock import Mock, patch
+
+from submissions import api as sub_api
+
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.test.constants import OPTIONS_SELECTED_DICT, RUBRIC, STUDENT_ITEM
+from openassessment.data import OraAggregateData
+from openassessment.test_utils import CacheResetTest, QueryBudgetMixin
+from openassessment.workflow import api as workflow_api
+
+# A text-only answer, in the format the data downloads read responses in
+ANSWER = {'parts': [{'text': 'ẗëṡẗ äṅṡẅëṛ'}]}
+STEP_REQUIREMENTS = {'peer': {'must_grade': 1, 'must_be_graded_by': 1}}
+COURSE_SETTINGS = {}
+
+
+@patch('openassessment.data.OraAggregateData._map_block_usage_keys_to_display_names', Mock(return_value={}))
+class TestOraAggregateDataQueryBudgets(QueryBudgetMixin, CacheResetTest):
+    """
+    Query budgets for each OraAggregateData collector, as a fixed number of queries
+    plus a number of queries for each row or assessment reported.
+    """
+
+    # Budgets are the queries measured for the 2 learners of `_assert_collector_budget`, plus a slack
+    # of 2, and the queries measured per extra row, plus a slack of 1.
+
+    # Submissions and peer workflow items: 2, plus 11 for each of the 2 rows
+    COLLECT_ORA2_DATA_QUERIES = 26
+    # Assessments, their prefetched parts and rubric, the ordered parts with the criterion and option
+    # of each of the 2 parts, assessment feedback, feedback options and score annotations: 11
+    COLLECT_ORA2_DATA_QUERIES_PER_ROW = 12
+    # Workflows: 1, plus 9 for each of the 2 rows
+    COLLECT_ORA2_SUMMARY_QUERIES = 21
+    # The staff step and the workflow steps twice, the peer workflow twice, the submission, its score
+    # and the score annotations: 9
+    COLLECT_ORA2_SUMMARY_QUERIES_PER_ROW = 10
+    COLLECT_ORA2_RESPONSES_QUERIES = 2
+    # Assessments with their parts and rubric, the learner's student item, score summary, score,
+    # submission and score annotations, the assessment feedback, and 6 for the single assessment: 15
+    GENERATE_ASSESSMENT_DATA_QUERIES = 17
+    # The ordered parts with the criterion and option of each of the 2 parts, and feedback options: 6
+    GENERATE_ASSESSMENT_DATA_QUERIES_PER_ASSESSMENT = 7
+
+    @staticmethod
+    def _create_learners(course_id, num_learners):
+        """
+        Create learners who each submit a response and assess one of their peers.
+
+        Returns:
+            list of submission dicts
+        """
+        learners = []
+        for index in range(num_learners):
+            student_item = dict(STUDENT_ITEM, student_id=f'learner_{index}', course_id=course_id)
+            submission = sub_api.create_submission(student_item, ANSWER)
+            peer_api.on_start(submission['uuid'])
+            workflow_api.create_workflow(submission['uuid'], ['peer'])
+            learners.append((submission, student_item))
+
+        for submission, student_item in learners:
+            if peer_api.get_submission_to_assess(submission['uuid'], 1):
+                peer_api.create_assessment(
+                    submission['uuid'],
+                    student_item['student_id'],
+                    OPTIONS_SELECTED_DICT['most']['options'],
+                    {},
+                    "",
+                    RUBRIC,
+                    1,
+                )
+        for submission, _ in learners:
+            workflow_api.update_from_assessments(submission['uuid'], STEP_REQUIREMENTS, COURSE_SETTINGS)
+        return [submission for submission, _ in learners]
+
+    def _assert_collector_budget(self, collector, budget, budget_per_row):
+        """
+        Assert the budgets of a collector called with a course id, for courses of 2 and 6 learners.
+        """
+        self._create_learners('few_learners', 2)
+        self._create_learners('many_learners', 6)
+        with self.assertMaxNumQueries(budget) as queries_for_few:
+            collector('few_learners')
+        queries_for_many = self.count_queries(collector, 'many_learners')
+        self.assertQueriesPerItem(queries_for_few.captured_queries, queries_for_many, 4, budget_per_row)
+
+    def test_collect_ora2_data(self):
+        self._assert_collector_budget(
+            OraAggregateData.collect_ora2_data,
+            self.COLLECT_ORA2_DATA_QUERIES,
+            self.COLLECT_ORA2_DATA_QUERIES_PER_ROW,
+        )
+
+    def test_collect_ora2_summary(self):
+        self._assert_collector_budget(
+            OraAggregateData.collect_ora2_summary,
+            self.COLLECT_ORA2_SUMMARY_QUERIES,
+            self.COLLECT_ORA2_SUMMARY_QUERIES_PER_ROW,
+        )
+
+    def test_collect_ora2_responses(self):
+        # One aggregate query, however many learners there are
+        self._assert_collector_budget(
+            OraAggregateData.collect_ora2_responses,
+            self.COLLECT_ORA2_RESPONSES_QUERIES,
+            0,
+        )
+
+    def test_generate_assessment_data(self):
+        submissions = self._create_learners('generate_assessment_data', 4)
+        # Over-grade the course, so that some of its submissions have several assessments
+        for index in range(3):
+            student_item = dict(STUDENT_ITEM, student_id=f'grader_{index}', course_id='generate_assessment_data')
+            grader_submission = sub_api.create_submission(student_item, ANSWER)
+            peer_api.on_start(grader_submission['uuid'])
+            workflow_api.create_workflow(grader_submission['uuid'], ['peer'])
+            peer_api.get_submission_to_assess(grader_submission['uuid'], 10)
+            peer_api.create_assessment(
+                grader_submission['uuid'],
+                student_item['student_id'],
+                OPTIONS_SELECTED_DICT['few']['options'],
+                {},
+                "",
+                RUBRIC,
+                10,
+            )
+            submissions.append(grader_submission)
+
+        def generate(submission_uuid):
+            return list(OraAggregateData.generate_assessment_data('block_id', submission_uuid))
+
+        # A learner assessed by a single peer, compared to one assessed by several
+        single_assessment_uuid = self._create_learners('one_assessment', 2)[0]['uuid']
+        with self.assertMaxNumQueries(self.GENERATE_ASSESSMENT_DATA_QUERIES) as queries_for_one:
+            rows_for_one = generate(single_assessment_uuid)
+        most_assessed_uuid = max(
+            (submission['uuid'] for submission in submissions),
+            key=lambda submission_uuid: len(generate(submission_uuid)),
+        )
+        queries_for_many = self.count_queries(generate, most_assessed_uuid)
+        extra_assessments = len(generate(most_assessed_uuid)) - len(rows_for_one)
+
+        self.assertGreater(extra_assessments, 0)
+        self.assertQueriesPerItem(
+            queries_for_one.captured_queries,
+            queries_for_many,
+            extra_assessments,
+            self.GENERATE_ASSESSMENT_DATA_QUERIES_PER_ASSESSMENT,
+        )
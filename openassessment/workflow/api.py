@@ -178,6 +178,42 @@ def get_workflow_for_submission(submission_uuid, assessment_requirements, course
     return update_from_assessments(submission_uuid, assessment_requirements, course_settings)
 
 
+def read_workflow_for_submission(submission_uuid, assessment_requirements, course_settings):
+    """Returns Assessment Workflow information, updating it only if it may be out of date.
+
+    Like `get_workflow_for_submission()`, but meant for read-only views such as
+    page renders. Anything that changes a workflow's inputs (a submission, an
+    assessment, a signal or an explicit refresh) updates the workflow as it
+    happens, so the stored status and step details are returned as they are
+    while the workflow is known to be up to date with these requirements and
+    course settings. Otherwise, the workflow is updated first.
+
+    Args:
+        submission_uuid (str): Identifier for the submission the
+            `AssessmentWorkflow` was created to track.
+        assessment_requirements (dict): The current requirements of each assessment step,
+            as for `get_workflow_for_submission()`.
+        course_settings (dict): Any course-level settings that may impact the workflow.
+
+    Returns:
+        dict: Assessment workflow information, as for `get_workflow_for_submission()`.
+
+    Raises:
+        AssessmentWorkflowRequestError: If the `workflow_uuid` passed in is not
+            a string type.
+        AssessmentWorkflowNotFoundError: No assessment workflow matching the
+            requested UUID exists.
+        AssessmentWorkflowInternalError: Unexpected internal error, such as the
+            submissions app not being available or a database configuation
+            problem.
+
+    """
+    workflow = _get_workflow_model(submission_uuid)
+    if workflow.is_up_to_date(assessment_requirements, course_settings):
+        return _serialized_with_details(workflow)
+    return _update_workflow(workflow, assessment_requirements, course_settings)
+
+
 def update_from_assessments(
     submission_uuid,
     assessment_requirements,
@@ -273,7 +309,14 @@ def update_from_assessments(
 
     """
     workflow = _get_workflow_model(submission_uuid)
+    return _update_workflow(workflow, assessment_requirements, course_settings, override_submitter_requirements)
+
 
+def _update_workflow(workflow, assessment_requirements, course_settings, override_submitter_requirements=False):
+    """
+    Update a workflow from its assessments and return its serialized version with status details.
+    See `update_from_assessments()`.
+    """
     try:
         workflow.update_from_assessments(
             assessment_requirements,
@@ -282,7 +325,7 @@ def update_from_assessments(
         )
         logger.info(
             "Updated workflow for submission UUID %s with requirements %s and course setttings %s",
-            submission_uuid,
+            workflow.submission_uuid,
             assessment_requirements,
             course_settings
         )
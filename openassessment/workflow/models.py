@@ -11,11 +11,14 @@ need to then generate a matching migration for it using:
 """
 
 
+from hashlib import sha1
 import importlib
+import json
 import logging
 from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import DatabaseError, models, transaction
 from django.dispatch import receiver
 from django.utils.timezone import now
@@ -24,9 +27,12 @@ from model_utils import Choices
 from model_utils.models import StatusModel, TimeStampedModel
 
 from submissions import api as sub_api, team_api as sub_team_api
+from submissions.models import score_reset, score_set
 from openassessment.assessment.errors.base import AssessmentError
 from openassessment.assessment.signals import assessment_complete_signal
-from openassessment.xblock.utils.notifications import send_grade_assigned_notification
+from openassessment.xblock.apis.data_loader import load_in_scope
+from openassessment.xblock.utils.leaderboard import bump_leaderboard_version
+from openassessment.xblock.utils.notifications import queue_grade_assigned_notification
 
 from .errors import AssessmentApiLoadError, AssessmentWorkflowError, AssessmentWorkflowInternalError
 
@@ -94,6 +100,14 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
 
     STAFF_ANNOTATION_TYPE = "staff_defined"
 
+    # After a workflow has been updated with a set of requirements, it is
+    # considered up to date for those requirements for this many seconds.
+    # Anything that changes a workflow's inputs should update the workflow itself;
+    # the timeout bounds how stale a workflow can get if that didn't happen, and
+    # catches changes that only depend on time passing (e.g. flexible peer grading).
+    # Overridden by the ORA2_WORKFLOW_FRESHNESS_TIMEOUT setting, see `freshness_timeout()`.
+    DEFAULT_FRESHNESS_TIMEOUT = 300
+
     submission_uuid = models.CharField(max_length=36, db_index=True, unique=True)
     uuid = models.UUIDField(db_index=True, unique=True, default=uuid4)
 
@@ -241,8 +255,17 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
             }
             if step.name == 'peer':
                 # the number passed here is arbitrary and ignored
-                _, peers_graded_count = step.api().has_finished_required_evaluating(self.submission_uuid, 1)
-                graded_by_count = step.api().get_graded_by_count(self.submission_uuid)
+                _, peers_graded_count = load_in_scope(
+                    ("peer_has_finished", self.submission_uuid, 1),
+                    step.api().has_finished_required_evaluating,
+                    self.submission_uuid,
+                    1,
+                )
+                graded_by_count = load_in_scope(
+                    ("peer_graded_by_count", self.submission_uuid),
+                    step.api().get_graded_by_count,
+                    self.submission_uuid,
+                )
                 status_dict[step.name]['peers_graded_count'] = peers_graded_count
                 status_dict[step.name]['graded_by_count'] = graded_by_count
         return status_dict
@@ -279,7 +302,13 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
                         step_requirements = None
                     else:
                         step_requirements = assessment_requirements.get(assessment_step_name, {})
-                    score = get_score_func(self.identifying_uuid, step_requirements, course_settings)
+                    score = load_in_scope(
+                        (f"{assessment_step_name}_score", self.identifying_uuid),
+                        get_score_func,
+                        self.identifying_uuid,
+                        step_requirements,
+                        course_settings,
+                    )
                     if not score and assessment_step.is_staff_step():
                         if step_requirements and step_requirements.get('required', False):
                             break  # A staff score was not found, and one is required. Return None
@@ -288,6 +317,44 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
 
         return score
 
+    def is_up_to_date(self, assessment_requirements, course_settings):
+        """
+        Check whether the stored status and steps of this workflow are known to
+        reflect the given requirements and course settings, so that
+        `update_from_assessments()` doesn't need to run before they're read.
+
+        This is true for a short time after the workflow was last updated with
+        the same requirements and course settings (see `freshness_timeout()`),
+        and always true for cancelled workflows, which never change.
+
+        Args:
+            assessment_requirements (dict): The current requirements of each assessment step.
+            course_settings (dict): The current course-level settings.
+
+        Returns:
+            bool
+        """
+        if self.status == self.STATUS.cancelled:
+            return True
+        return cache.get(self._freshness_cache_key()) == self._requirements_fingerprint(
+            assessment_requirements, course_settings
+        )
+
+    @classmethod
+    def freshness_timeout(cls):
+        """
+        The number of seconds a workflow stays up to date after an update, see `is_up_to_date()`.
+        """
+        return getattr(settings, 'ORA2_WORKFLOW_FRESHNESS_TIMEOUT', cls.DEFAULT_FRESHNESS_TIMEOUT)
+
+    def _freshness_cache_key(self):
+        return f"workflow.up_to_date.{self.submission_uuid}"
+
+    @staticmethod
+    def _requirements_fingerprint(assessment_requirements, course_settings):
+        canonical_form = json.dumps([assessment_requirements, course_settings], sort_keys=True, default=str)
+        return sha1(canonical_form.encode('utf-8')).hexdigest()
+
     def update_from_assessments(
         self,
         assessment_requirements,
@@ -296,6 +363,37 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
     ):
         """Query assessment APIs and change our status if appropriate.
 
+        See `_update_from_assessments()` for details. Once the update is
+        committed, the workflow is considered up to date for these requirements
+        and course settings (see `is_up_to_date()`); an update made with any
+        other requirements replaces that.
+
+        Args:
+            assessment_requirements (dict): Dictionary passed to the assessment API.
+            course_settings (dict): Any course-level settings that may impact the
+                workflow update process.
+            override_submitter_requirements (bool): If True, the presence of a new
+                staff score will cause all of the submitter's requirements to be
+                fulfilled, moving the workflow to DONE and exposing their grade.
+        """
+        # Forget that the workflow was up to date first, in case this update fails
+        cache_key = self._freshness_cache_key()
+        cache.delete(cache_key)
+
+        self._update_from_assessments(assessment_requirements, course_settings, override_submitter_requirements)
+
+        fingerprint = self._requirements_fingerprint(assessment_requirements, course_settings)
+        timeout = self.freshness_timeout()
+        transaction.on_commit(lambda: cache.set(cache_key, fingerprint, timeout))
+
+    def _update_from_assessments(
+        self,
+        assessment_requirements,
+        course_settings,
+        override_submitter_requirements=False
+    ):
+        """Query assessment APIs and change our status if appropriate.
+
         If the status is done, we do nothing. Once something is done, we never
         move back to any other status.
 
@@ -381,8 +479,8 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
                     score = self.get_score(assessment_requirements, course_settings, step_for_name)
                     submission_dict = sub_api.get_submission_and_student(self.submission_uuid)
                     if submission_dict['student_item']['student_id']:
-                        send_grade_assigned_notification(self.item_id,
-                                                         submission_dict['student_item']['student_id'], score)
+                        queue_grade_assigned_notification(self.item_id,
+                                                          submission_dict['student_item']['student_id'], score)
                     return
 
         if self.status == self.STATUS.done:
@@ -453,7 +551,9 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
                 new_status = self.STATUS.done
                 submission_dict = sub_api.get_submission_and_student(self.submission_uuid)
                 if submission_dict['student_item']['student_id']:
-                    send_grade_assigned_notification(self.item_id, submission_dict['student_item']['student_id'], score)
+                    queue_grade_assigned_notification(
+                        self.item_id, submission_dict['student_item']['student_id'], score
+                    )
 
         # Finally save our changes if the status has changed
         if self.status != new_status:
@@ -1083,3 +1183,29 @@ class AssessmentWorkflowCancellation(models.Model):
         """
         workflow_cancellations = cls.objects.filter(workflow__submission_uuid=submission_uuid).order_by("-created_at")
         return workflow_cancellations[0] if workflow_cancellations.exists() else None
+
+
+@receiver(score_set)
+@receiver(score_reset)
+def invalidate_leaderboard(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Register a receiver for scores being set or reset by the submissions API,
+    so that leaderboards including the item are rebuilt.
+
+    Args:
+        sender (object): Not used
+
+    Keyword Arguments:
+        course_id (str): The course of the scored item.
+        item_id (str): The scored item.
+
+    Returns:
+        None
+
+    """
+    course_id = kwargs.get('course_id')
+    item_id = kwargs.get('item_id')
+    if course_id and item_id:
+        # Bumping before the score is committed would let a concurrent render cache the old scores
+        # under the new version
+        transaction.on_commit(lambda: bump_leaderboard_version(course_id, item_id))
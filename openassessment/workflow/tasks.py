@@ -72,3 +72,20 @@ def update_workflow_for_submission_task(self, submission_uuid, assessment_requir
     """
     from openassessment.workflow.workflow_batch_update_api import update_workflow_for_submission
     return update_workflow_for_submission(submission_uuid, assessment_requirements, course_settings)
+
+
+@shared_task(bind=True,
+             acks_late=True,
+             autoretry_for=(Exception,),
+             max_retries=3,
+             retry_backoff=True,
+             retry_backoff_max=300,
+             retry_jitter=True)
+@set_code_owner_attribute
+# pylint: disable=unused-argument
+def flush_draft_task(self, student_item):
+    """
+    Async task wrapper
+    """
+    from openassessment.xblock.utils.draft_store import flush_draft
+    return flush_draft(student_item)
@@ -2,6 +2,7 @@
 from unittest.mock import patch
 
 import ddt
+from django.core.cache import cache
 from django.db import DatabaseError
 from django.test.utils import override_settings
 from pytest import raises
@@ -301,6 +302,72 @@ class TestAssessmentWorkflowApi(CacheResetTest):
         # This call will throw exceptions if the workflow is in an invalid state
         workflow_api.update_from_assessments(submission["uuid"], {}, {})
 
+    def test_read_workflow_for_submission(self):
+        submission = sub_api.create_submission(ITEM_1, ANSWER_1)
+        workflow_api.create_workflow(submission["uuid"], ["self"])
+        requirements = {"self": {"required": True}}
+
+        def read_workflow(assessment_requirements):
+            """ Read the workflow, and return it with whether it had to be updated """
+            with patch.object(
+                AssessmentWorkflow,
+                '_update_from_assessments',
+                autospec=True,
+                side_effect=AssessmentWorkflow._update_from_assessments,  # pylint: disable=protected-access
+            ) as mock_update:
+                with self.captureOnCommitCallbacks(execute=True):
+                    workflow = workflow_api.read_workflow_for_submission(
+                        submission["uuid"], assessment_requirements, {}
+                    )
+            return workflow, mock_update.called
+
+        # The workflow was started without requirements, so it's updated when first read with them
+        workflow, updated = read_workflow(requirements)
+        self.assertTrue(updated)
+        self.assertEqual(workflow["status"], "self")
+
+        # After which the stored workflow is returned as is
+        workflow_from_read, updated = read_workflow(requirements)
+        self.assertFalse(updated)
+        self.assertEqual(workflow_from_read, workflow)
+
+        # ...until the requirements change
+        __, updated = read_workflow({"self": {"required": False}})
+        self.assertTrue(updated)
+        __, updated = read_workflow(requirements)
+        self.assertTrue(updated)
+
+        # ...or the workflow is updated without requirements (e.g. from a signal)
+        with self.captureOnCommitCallbacks(execute=True):
+            workflow_api.update_from_assessments(submission["uuid"], None, {})
+        __, updated = read_workflow(requirements)
+        self.assertTrue(updated)
+
+        # ...or it has been too long since the last update
+        cache.clear()
+        __, updated = read_workflow(requirements)
+        self.assertTrue(updated)
+
+    @override_settings(ORA2_WORKFLOW_FRESHNESS_TIMEOUT=42)
+    def test_freshness_timeout_setting(self):
+        submission = sub_api.create_submission(ITEM_1, ANSWER_1)
+        workflow_api.create_workflow(submission["uuid"], ["self"])
+
+        with patch('openassessment.workflow.models.cache.set') as mock_cache_set:
+            with self.captureOnCommitCallbacks(execute=True):
+                workflow_api.update_from_assessments(submission["uuid"], {}, {})
+        self.assertEqual(mock_cache_set.call_args[0][2], 42)
+
+    def test_read_workflow_update_not_committed(self):
+        submission = sub_api.create_submission(ITEM_1, ANSWER_1)
+        workflow_api.create_workflow(submission["uuid"], ["self"])
+
+        # Until an update is committed, reading the workflow always updates it
+        workflow_api.update_from_assessments(submission["uuid"], {}, {})
+        with patch.object(AssessmentWorkflow, 'update_from_assessments') as mock_update:
+            workflow_api.read_workflow_for_submission(submission["uuid"], {}, {})
+        mock_update.assert_called_once_with({}, {}, False)
+
     def test_get_status_counts(self):
         # Initially, the counts should all be zero
         counts = workflow_api.get_status_counts(
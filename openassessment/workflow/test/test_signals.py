@@ -65,3 +65,21 @@ class UpdateWorkflowSignalTest(CacheResetTest):
         # The receiver should catch and log the error
         mock_call.side_effect = error("OH NO!")
         assessment_complete_signal.send(sender=None, submission_uuid=self.submission_uuid)
+
+
+class InvalidateLeaderboardSignalTest(CacheResetTest):
+    """
+    Test for invalidating leaderboards when a score is set.
+    """
+    STUDENT_ITEM = UpdateWorkflowSignalTest.STUDENT_ITEM
+
+    @mock.patch('openassessment.workflow.models.bump_leaderboard_version')
+    def test_bumped_on_commit(self, mock_bump):
+        submission = sub_api.create_submission(self.STUDENT_ITEM, "test answer")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            sub_api.set_score(submission['uuid'], 1, 2)
+            # The version isn't bumped until the score is committed
+            mock_bump.assert_not_called()
+
+        mock_bump.assert_called_once_with(self.STUDENT_ITEM['course_id'], self.STUDENT_ITEM['item_id'])
@@ -38,7 +38,9 @@ class PeerAssessmentAPI(StepDataAPI):
 
     @property
     def assessments(self):
-        return peer_api.get_assessments(self.submission_uuid)
+        return self._block.data_loader.load(
+            ("peer_assessments", self.submission_uuid), peer_api.get_assessments, self.submission_uuid
+        )
 
     @property
     def scored_assessments(self):
@@ -71,7 +73,9 @@ class PeerAssessmentAPI(StepDataAPI):
         Return number of peer assessments this submission has received
         or None if submission not found.
         """
-        return peer_api.get_graded_by_count(self.submission_uuid)
+        return self._block.data_loader.load(
+            ("peer_graded_by_count", self.submission_uuid), peer_api.get_graded_by_count, self.submission_uuid
+        )
 
     @property
     def waiting_for_submissions_to_assess(self):
@@ -86,8 +90,11 @@ class PeerAssessmentAPI(StepDataAPI):
 
     @property
     def has_finished(self):
-        finished, count = peer_api.has_finished_required_evaluating(
-            self.submission_uuid, self.assessment["must_grade"]
+        finished, count = self._block.data_loader.load(
+            ("peer_has_finished", self.submission_uuid, self.assessment["must_grade"]),
+            peer_api.has_finished_required_evaluating,
+            self.submission_uuid,
+            self.assessment["must_grade"],
         )
         return finished, count
 
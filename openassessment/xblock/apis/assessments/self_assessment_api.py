@@ -36,7 +36,10 @@ class SelfAssessmentAPI(StepDataAPI):
 
     @property
     def assessment(self):
-        return self_api.get_assessment(self.workflow_data.workflow.get("submission_uuid"))
+        submission_uuid = self.workflow_data.workflow.get("submission_uuid")
+        return self._block.data_loader.load(
+            ("self_assessment", submission_uuid), self_api.get_assessment, submission_uuid
+        )
 
     @property
     def submission_uuid(self):
@@ -45,7 +48,9 @@ class SelfAssessmentAPI(StepDataAPI):
     @property
     def submission(self):
         if self.submission_uuid:
-            return submission_api.get_submission(self.submission_uuid)
+            return self._block.data_loader.load(
+                ("submission", self.submission_uuid), submission_api.get_submission, self.submission_uuid
+            )
         return None
 
     @property
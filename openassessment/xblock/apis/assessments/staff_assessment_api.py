@@ -44,7 +44,10 @@ class StaffAssessmentAPI(StepDataAPI):
 
     @property
     def assessment(self):
-        return staff_api.get_assessment(self.workflow_data.workflow.get("submission_uuid"))
+        submission_uuid = self.workflow_data.workflow.get("submission_uuid")
+        return self._block.data_loader.load(
+            ("staff_assessment", submission_uuid), staff_api.get_assessment, submission_uuid
+        )
 
     @staticmethod
     def staff_assessment_exists(submission_uuid):
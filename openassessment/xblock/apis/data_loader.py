@@ -0,0 +1,138 @@
+"""
+Memoisation of learner data lookups for the ORA XBlock APIs.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import wraps
+import logging
+import threading
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+# The loader whose scope is open on this thread, see `load_in_scope`
+_active = threading.local()
+
+
+class ORADataLoader:
+    """
+    Remembers the result of each learner data lookup (submissions, workflows, assessments,
+    scores, cancellations, file descriptors) made through the step APIs, so that serializing a
+    page reads each record once however many APIs and serializers ask for it.
+
+    Lookups are only remembered inside a `scope()`, which covers a single page render
+    (see `loads_learner_data`). Outside of a scope, `load` simply calls through, so handlers
+    and tests which reuse a block across writes never see stale data.
+
+    The block also clears the loader whenever it writes learner data, see
+    `WorkflowMixin.update_workflow_status`.
+
+    While a scope is open, the workflow and assessment APIs load values through the loader
+    too (see `load_in_scope`), so that updating the learner's workflow during a render
+    shares its lookups with the page.
+
+    Values are copied on the way out, so callers may modify them.
+
+    `computed` counts how many times each kind of value (the first item of its key) was
+    computed during the current or most recent scope, and is logged when the scope exits.
+    `hits` and `misses` count the lookups served from and added to the memo over the
+    lifetime of the loader.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._depth = 0
+        self._previous_loader = None
+        self.computed = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self):
+        return self._depth > 0
+
+    @contextmanager
+    def scope(self, name=None):
+        """
+        Remember lookups until the outermost scope exits.
+
+        Args:
+            name (str): Name of the view or handler opening the scope, for logging.
+        """
+        if not self._depth:
+            self.computed = Counter()
+            self._previous_loader = getattr(_active, 'loader', None)
+            _active.loader = self
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                _active.loader = self._previous_loader
+                self.clear()
+                logger.debug("ORA learner data computed by %s: %s", name, dict(self.computed))
+
+    def load(self, key, func, *args, **kwargs):
+        """
+        Return the value loaded under `key`, calling `func(*args, **kwargs)` to load it
+        the first time it is requested in the current scope.
+
+        Args:
+            key (tuple): Hashable identifier of the value, e.g. `("self_assessment", submission_uuid)`.
+            func (callable): Function that loads the value.
+
+        Returns:
+            A copy of the loaded value.
+        """
+        if not self.active:
+            return func(*args, **kwargs)
+        if key in self._values:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.computed[key[0]] += 1
+            self._values[key] = func(*args, **kwargs)
+        return deepcopy(self._values[key])
+
+    def clear(self):
+        """
+        Forget every loaded value, e.g. after the learner data has changed.
+        """
+        self._values.clear()
+
+
+def load_in_scope(key, func, *args, **kwargs):
+    """
+    Load a value through the `ORADataLoader` whose scope is open on this thread, or
+    call `func(*args, **kwargs)` when there is none. See `ORADataLoader.load`.
+
+    Keys are shared with the block's own lookups, e.g. `("peer_score", submission_uuid)`.
+    """
+    loader = getattr(_active, 'loader', None)
+    if loader is None:
+        return func(*args, **kwargs)
+    return loader.load(key, func, *args, **kwargs)
+
+
+def loads_learner_data(func):
+    """
+    Decorator for block views and handlers, sharing learner data lookups made while they run.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.data_loader.scope(func.__name__):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+def memoised_in_scope(func):
+    """
+    Decorator for block methods computed from block fields and course settings, such as
+    `is_closed`, so that they are computed once per view or handler for each set of arguments.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return self.data_loader.load(key, func, self, *args, **kwargs)
+    return wrapper
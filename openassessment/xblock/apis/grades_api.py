@@ -67,7 +67,9 @@ class GradesAPI:
         }
         """
         submission_uuid = self._get_submission_uuid()
-        assessment = self_api.get_assessment(submission_uuid)
+        assessment = self._block.data_loader.load(
+            ("self_assessment", submission_uuid), self_api.get_assessment, submission_uuid
+        )
 
         if assessment is not None:
             return {
@@ -97,8 +99,8 @@ class GradesAPI:
 
         course_settings = self._block.get_course_workflow_settings()
 
-        peer_score = peer_api.get_score(
-            submission_uuid, peer_requirements, course_settings
+        peer_score = self._block.data_loader.load(
+            ("peer_score", submission_uuid), peer_api.get_score, submission_uuid, peer_requirements, course_settings
         )
 
         if peer_score is not None:
@@ -120,7 +122,9 @@ class GradesAPI:
         }
         """
         submission_uuid = self._get_submission_uuid()
-        assessment = staff_api.get_latest_staff_assessment(submission_uuid)
+        assessment = self._block.data_loader.load(
+            ("latest_staff_assessment", submission_uuid), staff_api.get_latest_staff_assessment, submission_uuid
+        )
 
         if assessment is not None:
             return {
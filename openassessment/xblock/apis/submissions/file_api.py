@@ -43,11 +43,29 @@ class FileAPI:
         * None when file uploads not enabled.
         """
         if self.file_upload_type:
-            file_urls = self.file_manager.file_descriptors(team_id=self.team_id, include_deleted=True)
-            team_file_urls = self.file_manager.team_file_descriptors(team_id=self.team_id)
+            file_urls = self.file_descriptors(team_id=self.team_id)
+            team_file_urls = self.team_file_descriptors(team_id=self.team_id)
             return {"file_urls": file_urls, "team_file_urls": team_file_urls}
         return None
 
+    def file_descriptors(self, team_id=None):
+        """
+        Get descriptors for the files uploaded by the user, including deleted ones.
+        Download URLs are only signed once per request.
+        """
+        return self._block.data_loader.load(
+            ("file_descriptors", team_id), self.file_manager.file_descriptors, team_id=team_id, include_deleted=True
+        )
+
+    def team_file_descriptors(self, team_id=None):
+        """
+        Get descriptors for the files uploaded by the user's team.
+        Download URLs are only signed once per request.
+        """
+        return self._block.data_loader.load(
+            ("team_file_descriptors", team_id), self.file_manager.team_file_descriptors, team_id=team_id
+        )
+
     # TODO - Determine if we can combine this and uploaded_files
     def get_uploads_for_submission(self):
         """Get a list of uploads for a submission"""
@@ -276,7 +276,9 @@ def save_submission_draft(student_submission_data, block_config_data, block_subm
         raise SubmissionValidationException(msg)
     try:
         block_submission_data.saved_response = json.dumps(prepare_submission_for_serialization(student_submission_data))
-        block_submission_data.has_saved = True
+        # Drafts are stored apart from user state, which is only written to the first time
+        if not block_submission_data.has_saved:
+            block_submission_data.has_saved = True
 
         # Emit analytics event...
         block_config_data.publish_event(
@@ -287,6 +289,44 @@ def save_submission_draft(student_submission_data, block_config_data, block_subm
         raise DraftSaveException from e
 
 
+def update_submission_draft(text_response_updates, block_config_data, block_submission_data):
+    """
+    Save changes to some of the current student's draft responses, keeping their other ones.
+
+    Args:
+        text_response_updates (dict): The new response to each changed prompt, keyed by the
+            index of the prompt, as an int or a string.
+
+    Raises:
+        SubmissionValidationException: When a prompt index or response is invalid.
+        DraftSaveException: When the draft could not be saved.
+    """
+    if not isinstance(text_response_updates, dict):
+        raise SubmissionValidationException(block_config_data.translate("The submission format is invalid."))
+
+    num_prompts = len(block_config_data.prompts)
+    answer = block_submission_data.saved_response['answer']
+    parts = []
+    if isinstance(answer, dict):
+        # Drafts saved before ORAs had several prompts are a single text
+        parts = answer.get('parts', [{'text': answer.get('text', '')}])
+    text_responses = [part.get('text', '') for part in parts[:num_prompts]]
+    text_responses += [''] * (num_prompts - len(text_responses))
+
+    for prompt_index, text_response in text_response_updates.items():
+        try:
+            prompt_index = int(prompt_index)
+        except (TypeError, ValueError) as e:
+            raise SubmissionValidationException(
+                block_config_data.translate("The submission format is invalid.")
+            ) from e
+        if not 0 <= prompt_index < num_prompts:
+            raise SubmissionValidationException(block_config_data.translate("The submission format is invalid."))
+        text_responses[prompt_index] = text_response
+
+    save_submission_draft(text_responses, block_config_data, block_submission_data)
+
+
 def append_file_data(file_data, block_config, submission_info):
     """
     Appends a list of file data to the current block state
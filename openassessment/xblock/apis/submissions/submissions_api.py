@@ -13,6 +13,7 @@ from openassessment.xblock.utils.data_conversion import (
     create_submission_dict,
     update_saved_response_format,
 )
+from openassessment.xblock.utils.draft_store import get_draft, save_draft
 from openassessment.xblock.utils.resolve_dates import DISTANT_FUTURE
 from openassessment.xblock.apis.step_data_api import StepDataAPI
 from openassessment.xblock.apis.submissions.file_api import FileAPI
@@ -43,9 +44,17 @@ class SubmissionAPI(StepDataAPI):
     @property
     def cancellation_info(self):
         if self.config_data.is_team_assignment():
-            return self.workflow_data.get_team_workflow_cancellation_info(self.team_submission_uuid)
+            return self._block.data_loader.load(
+                ("team_workflow_cancellation", self.team_submission_uuid),
+                self.workflow_data.get_team_workflow_cancellation_info,
+                self.team_submission_uuid,
+            )
         else:
-            return self.workflow_data.get_workflow_cancellation_info(self.submission_uuid)
+            return self._block.data_loader.load(
+                ("workflow_cancellation", self.submission_uuid),
+                self.workflow_data.get_workflow_cancellation_info,
+                self.submission_uuid,
+            )
 
     def _safe_get_cancellation_info_field(self, field):
         cancellation_info = self.cancellation_info
@@ -114,14 +123,32 @@ class SubmissionAPI(StepDataAPI):
     def has_saved(self, value):
         self._block.has_saved = value
 
+    @property
+    def _draft_student_item(self):
+        """
+        The student item drafts are stored for, or None when there is no learner to store them for,
+        in which case drafts are kept in the `saved_response` field.
+        """
+        student_item = self._block.get_student_item_dict()
+        return student_item if student_item['student_id'] else None
+
     @property
     def saved_response(self):
         """Return a saved response for a student / team when they haven't submitted"""
-        return update_saved_response_format(self.config_data.saved_response)
+        student_item = self._draft_student_item
+        draft = get_draft(student_item) if student_item else None
+        if draft is None:
+            # Saved before drafts were stored apart from user state, or without a learner
+            draft = self.config_data.saved_response
+        return update_saved_response_format(draft)
 
     @saved_response.setter
     def saved_response(self, value):
-        self._block.saved_response = value
+        student_item = self._draft_student_item
+        if student_item:
+            save_draft(student_item, value)
+        else:
+            self._block.saved_response = value
 
     @property
     def student_submission(self):
@@ -162,7 +189,7 @@ class SubmissionAPI(StepDataAPI):
             openassessment.data.VersionNotFoundException: If the submission did not match any known
                                                           ORA answer version
         """
-        submission = get_submission(submission_uuid)
+        submission = self._block.data_loader.load(("submission", submission_uuid), get_submission, submission_uuid)
         return OraSubmissionAnswerFactory.parse_submission_raw_answer(submission.get('answer'))
 
     # Team Info
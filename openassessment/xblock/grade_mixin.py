@@ -12,6 +12,7 @@ from django.utils.translation import gettext as _
 from openassessment.assessment.api.peer import get_peer_grading_strategy, PeerGradingStrategy
 
 from openassessment.assessment.errors import PeerAssessmentError, SelfAssessmentError
+from openassessment.xblock.apis.data_loader import loads_learner_data
 
 from .utils.data_conversion import create_submission_dict
 
@@ -28,6 +29,7 @@ class GradeMixin:
     """
 
     @XBlock.handler
+    @loads_learner_data
     def render_grade(self, data, suffix=''):  # pylint: disable=unused-argument
         """
         Render the grade step.
@@ -106,8 +108,12 @@ class GradeMixin:
         peer_assessments = []
         has_submitted_feedback = False
 
+        # Lookups share their keys with the step APIs, so that the grades computed
+        # for the workflow earlier in the request are not read again.
         if "peer-assessment" in assessment_steps:
-            peer_api.get_score(
+            self.data_loader.load(
+                ("peer_score", submission_uuid),
+                peer_api.get_score,
                 submission_uuid,
                 self.workflow_requirements()["peer"],
                 self.get_course_workflow_settings()
@@ -115,21 +121,29 @@ class GradeMixin:
             feedback = peer_api.get_assessment_feedback(submission_uuid)
             peer_assessments = [
                 self._assessment_grade_context(peer_assessment)
-                for peer_assessment in peer_api.get_assessments(submission_uuid)
+                for peer_assessment in self.data_loader.load(
+                    ("peer_assessments", submission_uuid), peer_api.get_assessments, submission_uuid
+                )
             ]
             has_submitted_feedback = feedback is not None
 
         if "self-assessment" in assessment_steps:
             self_assessment = self._assessment_grade_context(
-                self_api.get_assessment(submission_uuid)
+                self.data_loader.load(
+                    ("self_assessment", submission_uuid), self_api.get_assessment, submission_uuid
+                )
             )
 
-        raw_staff_assessment = staff_api.get_latest_staff_assessment(submission_uuid)
+        raw_staff_assessment = self.data_loader.load(
+            ("latest_staff_assessment", submission_uuid), staff_api.get_latest_staff_assessment, submission_uuid
+        )
         if raw_staff_assessment:
             staff_assessment = self._assessment_grade_context(raw_staff_assessment)
 
         feedback_text = feedback.get('feedback', '') if feedback else ''
-        student_submission = sub_api.get_submission(submission_uuid)
+        student_submission = self.data_loader.load(
+            ("submission", submission_uuid), sub_api.get_submission, submission_uuid
+        )
 
         # We retrieve the score from the workflow, which in turn retrieves
         # the score for our current submission UUID.
@@ -298,14 +312,16 @@ class GradeMixin:
 
         max_scores = peer_api.get_rubric_max_scores(submission_uuid)
         median_scores = None
+        peer_median_scores = None
         assessment_steps = self.assessment_steps
+        if "peer-assessment" in assessment_steps:
+            # Computed once here rather than for each criterion
+            peer_median_scores = self._peer_median_scores(submission_uuid)
+
         if staff_assessment:
             median_scores = staff_api.get_assessment_scores_by_criteria(submission_uuid)
-        elif "peer-assessment" in assessment_steps:
-            median_scores = peer_api.get_assessment_scores_with_grading_strategy(
-                submission_uuid,
-                self.workflow_requirements()
-            )
+        elif peer_median_scores is not None:
+            median_scores = peer_median_scores
         elif "self-assessment" in assessment_steps:
             median_scores = self_api.get_assessment_scores_by_criteria(submission_uuid)
 
@@ -320,6 +336,7 @@ class GradeMixin:
                 peer_assessments,
                 self_assessment,
                 is_staff=is_staff,
+                peer_median_scores=peer_median_scores,
             )
 
             # Record whether there is any feedback provided in the assessments
@@ -346,10 +363,12 @@ class GradeMixin:
 
     def _graded_assessments(
             self, submission_uuid, criterion, assessment_steps, staff_assessment, peer_assessments,
-            self_assessment, is_staff=False
+            self_assessment, is_staff=False, peer_median_scores=None
     ):
         """
         Returns an array of assessments with their associated grades.
+
+        `peer_median_scores` are the peer scores by criterion name, looked up if not given.
         """
         def _get_assessment_part(title, feedback_title, part_criterion_name, assessment):
             """
@@ -377,7 +396,7 @@ class GradeMixin:
                     get_peer_grading_strategy(self.workflow_requirements())
                 ),
                 'criterion': criterion,
-                'option': self._peer_median_option(submission_uuid, criterion),
+                'option': self._peer_median_option(submission_uuid, criterion, peer_median_scores),
                 'individual_assessments': [
                     _get_assessment_part(
                         _('Peer {peer_index}').format(peer_index=index + 1),
@@ -429,25 +448,35 @@ class GradeMixin:
             return _('Peer Mean Grade')
         return _('Peer Median Grade')
 
-    def _peer_median_option(self, submission_uuid, criterion):
+    def _peer_median_scores(self, submission_uuid):
+        """
+        Returns the peer scores of a submission by criterion name, using the configured grading strategy.
+        """
+        # Import is placed here to avoid model import at project startup.
+        from openassessment.assessment.api import peer as peer_api
+
+        return self.data_loader.load(
+            ("peer_median_scores", submission_uuid),
+            peer_api.get_assessment_scores_with_grading_strategy,
+            submission_uuid,
+            self.workflow_requirements()
+        )
+
+    def _peer_median_option(self, submission_uuid, criterion, median_scores=None):
         """
         Returns the option for the median peer grade.
 
         Args:
             submission_uuid (str): The id for the submission.
             criterion (dict): The criterion in question.
+            median_scores (dict): The peer scores by criterion name, looked up if not given.
 
         Returns:
             The option for the median peer grade.
 
         """
-        # Import is placed here to avoid model import at project startup.
-        from openassessment.assessment.api import peer as peer_api
-
-        median_scores = peer_api.get_assessment_scores_with_grading_strategy(
-            submission_uuid,
-            self.workflow_requirements()
-        )
+        if median_scores is None:
+            median_scores = self._peer_median_scores(submission_uuid)
         median_score = median_scores.get(criterion['name'], None)
         median_score = -1 if median_score is None else median_score
 
@@ -10,10 +10,10 @@ from xblock.core import XBlock
 from django.utils.translation import gettext as _
 
 from openassessment.assessment.errors import PeerAssessmentError, SelfAssessmentError
-from openassessment.data import OraSubmissionAnswerFactory
 from openassessment.fileupload import api as file_upload_api
 from openassessment.fileupload.exceptions import FileUploadError
 from openassessment.xblock.utils.data_conversion import create_submission_dict
+from openassessment.xblock.utils.leaderboard import get_leaderboard_snapshot
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -72,33 +72,29 @@ class LeaderboardMixin:
         Returns:
             template_path (string), tuple of context (dict)
         """
-        # Import is placed here to avoid model import at project startup.
-        from submissions import api as sub_api
-
-        # Retrieve top scores from the submissions API
-        # Since this uses the read-replica and caches the results,
-        # there will be some delay in the latency.
-        scores = sub_api.get_top_submissions(
+        # Top scores are cached until one of them changes, and their files' download urls
+        # until shortly before they expire, so only sign urls that aren't cached.
+        scores = get_leaderboard_snapshot(
             student_item_dict['course_id'],
             student_item_dict['item_id'],
             student_item_dict['item_type'],
             self.leaderboard_show
         )
+        download_urls = file_upload_api.get_download_urls(
+            list(dict.fromkeys(uploaded_file['key'] for score in scores for uploaded_file in score['files']))
+        )
         for score in scores:
-            raw_score_content_answer = score['content']
-            answer = OraSubmissionAnswerFactory.parse_submission_raw_answer(raw_score_content_answer)
-            score['files'] = []
-            for uploaded_file in answer.get_file_uploads(missing_blank=True, generate_urls=True):
-                if uploaded_file.url:
-                    score['files'].append(
-                        file_upload_api.FileDescriptor(
-                            download_url=uploaded_file.url,
-                            description=uploaded_file.description,
-                            name=uploaded_file.name,
-                            size=uploaded_file.size,
-                            show_delete_button=False
-                        )._asdict()
-                    )
+            score['files'] = [
+                file_upload_api.FileDescriptor(
+                    download_url=download_urls[uploaded_file['key']],
+                    description=uploaded_file['description'],
+                    name=uploaded_file['name'],
+                    size=uploaded_file['size'],
+                    show_delete_button=False
+                )._asdict()
+                for uploaded_file in score['files']
+                if download_urls[uploaded_file['key']]
+            ]
             if 'text' in score['content'] or 'parts' in score['content']:
                 submission = {'answer': score.pop('content')}
                 score['submission'] = create_submission_dict(submission, self.prompts)
@@ -171,7 +171,11 @@ class OpenAssessmentTemplatesMixin:
             if ui_model:
                 ui_models.append(dict(assessment, **ui_model))
 
-        if not staff_assessment_required and StaffAssessmentAPI.staff_assessment_exists(self.submission_uuid):
+        if not staff_assessment_required and self.data_loader.load(
+            ("staff_assessment_exists", self.submission_uuid),
+            StaffAssessmentAPI.staff_assessment_exists,
+            self.submission_uuid,
+        ):
             ui_models.append(UI_MODELS["staff-assessment"])
 
         ui_models.append(UI_MODELS["grade"])
@@ -55,7 +55,8 @@ from openassessment.xblock.ui_mixins.legacy.handlers_mixin import LegacyHandlers
 from openassessment.xblock.ui_mixins.legacy.views_mixin import LegacyViewsMixin
 from openassessment.xblock.ui_mixins.mfe.mixin import MfeMixin
 from openassessment.xblock.utils.allow_resubmission import allow_resubmission
-from openassessment.xblock.utils.validation import validator
+from openassessment.xblock.utils.instrumentation import instrumented
+from openassessment.xblock.utils.validation import validate_definition
 from openassessment.xblock.config_mixin import ConfigMixin
 from openassessment.xblock.workflow_mixin import WorkflowMixin
 from openassessment.xblock.team_workflow_mixin import TeamWorkflowMixin
@@ -70,6 +71,7 @@ from openassessment.xblock.apis.assessments.self_assessment_api import SelfAsses
 from openassessment.xblock.apis.assessments.staff_assessment_api import StaffAssessmentAPI
 from openassessment.xblock.apis.assessments.student_training_api import StudentTrainingAPI
 from openassessment.xblock.apis.ora_data_accessor import ORADataAccessor
+from openassessment.xblock.apis.data_loader import ORADataLoader, loads_learner_data, memoised_in_scope
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -318,6 +320,24 @@ class OpenAssessmentBlock(
             self._workflow_data = WorkflowAPI(self)
         return self._workflow_data
 
+    _data_loader = None
+
+    @property
+    def data_loader(self):
+        # Shares learner data lookups between the APIs while a page is rendered
+        if self._data_loader is None:
+            self._data_loader = ORADataLoader()
+        return self._data_loader
+
+    def handle(self, handler_name, request, suffix=''):
+        # Every handler the runtime calls goes through here, see ORA_HANDLER_METRICS_SINKS
+        with instrumented(self, 'handler', handler_name):
+            return super().handle(handler_name, request, suffix)
+
+    def render(self, view, context=None):
+        with instrumented(self, 'view', view):
+            return super().render(view, context)
+
     @property
     def submission_data(self):
         return SubmissionAPI(self)
@@ -561,12 +581,12 @@ class OpenAssessmentBlock(
             (Fragment): The HTML Fragment for this XBlock, which determines the
             general frame of the Open Ended Assessment Question.
         """
-        # On page load, update the workflow status.
-        # We need to do this here because peers may have graded us, in which
-        # case we may have a score available.
+        # On page load, bring the workflow status up to date.
+        # Peers grading us update our workflow as they do, but the requirements
+        # may have changed since, or time may have made a score available.
 
         try:
-            self.update_workflow_status()
+            self.refresh_workflow_status()
         except AssessmentWorkflowError:
             # Log the exception, but continue loading the page
             logger.exception('An error occurred while updating the workflow on page load.')
@@ -601,6 +621,7 @@ class OpenAssessmentBlock(
         )
 
     @togglable_mobile_support
+    @loads_learner_data
     def student_view(self, context=None):  # pylint: disable=unused-argument
         """The main view of OpenAssessmentBlock, displayed when viewing courses.
 
@@ -615,12 +636,12 @@ class OpenAssessmentBlock(
             (Fragment): The HTML Fragment for this XBlock, which determines the
             general frame of the Open Ended Assessment Question.
         """
-        # On page load, update the workflow status.
-        # We need to do this here because peers may have graded us, in which
-        # case we may have a score available.
+        # On page load, bring the workflow status up to date.
+        # Peers grading us update our workflow as they do, but the requirements
+        # may have changed since, or time may have made a score available.
 
         try:
-            self.update_workflow_status()
+            self.refresh_workflow_status()
         except AssessmentWorkflowError:
             # Log the exception, but continue loading the page
             logger.exception('An error occurred while updating the workflow on page load.')
@@ -635,7 +656,7 @@ class OpenAssessmentBlock(
         # All data we intend to pass to the front end.
         show_staff_area = self.is_course_staff and not self.in_studio_preview
         block_user = self.runtime.service(self, "user").get_current_user()
-        is_limited_staff = show_staff_area and not and not has_studio_read_access(block_user,self.course_id)
+        is_limited_staff = show_staff_area and not has_studio_read_access(block_user,self.course_id)
         context_dict = {
             "leaderboard_modal": leaderboard_model,
             "prompts": self.prompts,
@@ -924,8 +945,9 @@ class OpenAssessmentBlock(
         config = parse_from_xml(node)
         block = runtime.construct_xblock_from_class(cls, keys)
 
-        xblock_validator = validator(block, block._, strict_post_release=False)
-        xblock_validator(
+        validate_definition(
+            block,
+            block._,
             create_rubric_dict(config['prompts'], config['rubric_criteria']),
             config['rubric_assessments'],
             submission_start=config['submission_start'],
@@ -1034,7 +1056,12 @@ class OpenAssessmentBlock(
         assessment_steps = []
         for assessment in self.valid_assessments:
             if assessment['name'] == 'staff-assessment' and assessment["required"] is False:
-                if not StaffAssessmentAPI.staff_assessment_exists(self.submission_uuid):
+                staff_assessment_exists = self.data_loader.load(
+                    ("staff_assessment_exists", self.submission_uuid),
+                    StaffAssessmentAPI.staff_assessment_exists,
+                    self.submission_uuid,
+                )
+                if not staff_assessment_exists:
                     continue
             assessment_steps.append(assessment['name'])
         return assessment_steps
@@ -1111,6 +1138,7 @@ class OpenAssessmentBlock(
         template = get_template('legacy/oa_error.html')
         return Response(template.render(context), content_type='application/html', charset='UTF-8')
 
+    @memoised_in_scope
     def is_closed(self, step=None, course_staff=None):
         """
         Checks if the question is closed.
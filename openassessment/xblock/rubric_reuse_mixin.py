@@ -1,10 +1,13 @@
 """ Mixin for functionality around the reuse of rubrics between ORAs """
+import json
 import logging
 
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import UsageKey
 from xblock.core import XBlock
 
+from openassessment.xblock.utils.rubric_catalogue import get_rubric_catalogue, rubric_from_block
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +42,21 @@ class RubricReuseMixin:
 
         return [block for block in blocks if not_orphan_or_self(block)]
 
+    def get_rubric_catalogue(self):
+        """
+        Returns the cached catalogue of the ORA blocks in the course and their rubrics,
+        see `openassessment.xblock.utils.rubric_catalogue.get_rubric_catalogue`.
+        Unlike `get_other_course_ora_blocks`, `self` is included.
+        """
+        if not hasattr(self.runtime, 'modulestore'):
+            # Nothing to catalogue, and nothing worth caching
+            return {'blocks': [], 'rubrics': {}}
+
+        def get_course_ora_blocks():
+            return [block for block in self._get_course_ora_blocks() if block.parent is not None]
+
+        return get_rubric_catalogue(self.location.course_key, get_course_ora_blocks)
+
     def get_other_ora_blocks_for_rubric_editor_context(self):
         """
         Return a list of all other openassessment blocks in the course, in the format:
@@ -47,12 +65,12 @@ class RubricReuseMixin:
             'location': <block location, as a string>
         }
         """
-        other_blocks = self.get_other_course_ora_blocks()
+        self_location = str(self.location.for_branch(None))
         return [
             {
-                'display_name': block.display_name,
-                'location': str(block.location.for_branch(None))
-            } for block in other_blocks
+                'display_name': entry['display_name'],
+                'location': entry['location'],
+            } for entry in self.get_rubric_catalogue()['blocks'] if entry['location'] != self_location
         ]
 
     @XBlock.json_handler
@@ -80,6 +98,16 @@ class RubricReuseMixin:
         }
 
     def _get_rubric(self, target_ora_block_locator):
+        """
+        Get the rubric of an ORA block from the course's catalogue, or from the block itself
+        when it isn't catalogued, e.g. when it belongs to another course.
+        """
+        target_location = str(target_ora_block_locator.for_branch(None))
+        catalogue = self.get_rubric_catalogue()
+        for entry in catalogue['blocks']:
+            if entry['location'] == target_location:
+                return json.loads(catalogue['rubrics'][entry['rubric_hash']])
+
         target_block = self._get_ora_block(target_ora_block_locator)
         if target_block.category != 'openassessment':
             logger.warning(
@@ -88,11 +116,7 @@ class RubricReuseMixin:
                 target_block.category
             )
             raise TargetBlockNotORAException
-        return {
-            'criteria': target_block.rubric_criteria,
-            'feedback_prompt': target_block.rubric_feedback_prompt,
-            'feedback_default_text': target_block.rubric_feedback_default_text,
-        }
+        return rubric_from_block(target_block)
 
     def _get_ora_block(self, target_ora_block_locator):
         if not hasattr(self.runtime, 'modulestore'):
@@ -15,6 +15,7 @@ from openassessment.assessment.errors import PeerAssessmentInternalError
 from openassessment.fileupload.api import delete_shared_files_for_team, remove_file
 from openassessment.workflow.errors import AssessmentWorkflowError, AssessmentWorkflowInternalError
 from openassessment.xblock.utils.data_conversion import create_submission_dict
+from openassessment.xblock.utils.draft_store import delete_draft
 from openassessment.xblock.utils.resolve_dates import DISTANT_FUTURE, DISTANT_PAST
 
 from .utils.user_data import get_user_preferences
@@ -85,6 +86,9 @@ class StaffAreaMixin:
     Display debug information to course and global staff.
     """
 
+    # Largest page of students the waiting step details endpoint will return
+    WAITING_STEP_MAX_PAGE_SIZE = 500
+
     @XBlock.handler
     @require_course_staff("STAFF_AREA")
     def render_staff_area(self, data, suffix=''):  # pylint: disable=W0613
@@ -191,6 +195,13 @@ class StaffAreaMixin:
 
         This returns a dict containing a list of users stuck on the waiting step, along
         with information about staff grading and staff overrides applied.
+
+        Optional query parameters:
+            sort_by (str): `created_at` (default), `graded` or `graded_by`.
+            sort_order (str): `asc` (default) or `desc`.
+            page (int): 1-indexed page of students to return. When this or `page_size`
+                is given, the response also includes `page`, `page_size` and `total_count`.
+            page_size (int): Number of students per page, at most `WAITING_STEP_MAX_PAGE_SIZE`.
         """
         student_item = self.get_student_item_dict()
         peer_step_config = self.get_assessment_module('peer-assessment')
@@ -198,25 +209,52 @@ class StaffAreaMixin:
         # Import is placed here to avoid model import at project startup.
         from openassessment.assessment.api import peer as peer_api
         from openassessment.assessment.api import staff as staff_api
-        from openassessment.workflow.api import get_workflows_for_status
         from openassessment.data import map_anonymized_ids_to_usernames
 
-        # Retrieve all items in the `waiting` and `done` steps
-        workflows_waiting = get_workflows_for_status(
-            student_item["course_id"],
-            student_item["item_id"],
-            ["waiting", "done"],
-        )
-        submission_uuids = [item['submission_uuid'] for item in workflows_waiting]
-
-        # Using the workflows retrieved above, filter out all items that
-        # haven't received the required number of peer reviews and retrieve their details.
-        waiting_student_list = peer_api.get_waiting_step_details(
+        sort_by = data.params.get('sort_by', 'created_at')
+        sort_order = data.params.get('sort_order', 'asc')
+        if sort_order not in ('asc', 'desc'):
+            return Response(json_body={'error': f'Invalid sort_order: {sort_order}'}, status=400)
+
+        paginated = 'page' in data.params or 'page_size' in data.params
+        offset, limit = 0, None
+        if paginated:
+            try:
+                page = int(data.params.get('page', 1))
+                page_size = int(data.params.get('page_size', self.WAITING_STEP_MAX_PAGE_SIZE))
+            except ValueError:
+                return Response(json_body={'error': 'page and page_size must be integers'}, status=400)
+            if page < 1 or page_size < 1:
+                return Response(json_body={'error': 'page and page_size must be positive'}, status=400)
+            page_size = min(page_size, self.WAITING_STEP_MAX_PAGE_SIZE)
+            offset, limit = (page - 1) * page_size, page_size
+
+        # Retrieve the students in the `waiting` and `done` steps that haven't received
+        # the required number of peer reviews, joined against their workflow status.
+        workflow_status_list = ["waiting", "done"]
+        try:
+            waiting_student_list = peer_api.get_waiting_step_details(
+                student_item["course_id"],
+                student_item["item_id"],
+                None,
+                peer_step_config.get('must_be_graded_by'),
+                workflow_status_list=workflow_status_list,
+                sort_by=sort_by,
+                descending=sort_order == 'desc',
+                offset=offset,
+                limit=limit,
+                read_replica=True,
+            )
+        except ValueError as ex:
+            return Response(json_body={'error': str(ex)}, status=400)
+        status_counts = peer_api.get_waiting_step_status_counts(
             student_item["course_id"],
             student_item["item_id"],
-            submission_uuids,
             peer_step_config.get('must_be_graded_by'),
+            workflow_status_list,
+            read_replica=True,
         )
+
         # Get external_id to username map
         username_map = map_anonymized_ids_to_usernames(
             [item['student_id'] for item in waiting_student_list]
@@ -247,49 +285,32 @@ class StaffAreaMixin:
             "submitted": self._("Submitted"),
         }
 
-        def _get_submission_status(submission_uuid):
-            """
-            Retrieves the workflow submission status from the list
-            of submissions
-            """
-            return next(
-                (
-                    workflow['status'] for workflow in workflows_waiting
-                    if workflow["submission_uuid"] == submission_uuid
-                ),
-                "waiting",
-            )
-
-        # Create user statistics
-        waiting_count = 0
-        overwritten_count = 0
-
         # Update waiting step details with username mappings
         for item in waiting_student_list:
             # Retrieve values from grade status and workflow status
             staff_grade_status = staff_assessment_data.get(item['submission_uuid'], "not_applicable")
-            workflow_status = _get_submission_status(item['submission_uuid'])
-
-            if workflow_status == 'waiting':
-                waiting_count += 1
-            else:
-                overwritten_count += 1
 
             # Append to waiting step data, and map status to readable strings
             item.update({
                 "username": username_map[item['student_id']],
                 "staff_grade_status": staff_status_map.get(staff_grade_status),
-                "workflow_status": workflow_status_map.get(workflow_status),
+                "workflow_status": workflow_status_map.get(item['workflow_status']),
             })
 
         waiting_step_data = {
             "display_name": self.display_name,
             "must_grade": peer_step_config.get('must_grade'),
             "must_be_graded_by": peer_step_config.get('must_be_graded_by'),
-            "waiting_count": waiting_count,
-            "overwritten_count": overwritten_count,
+            "waiting_count": status_counts['waiting'],
+            "overwritten_count": status_counts['done'],
             "student_data": waiting_student_list,
         }
+        if paginated:
+            waiting_step_data.update({
+                "page": page,
+                "page_size": page_size,
+                "total_count": status_counts['waiting'] + status_counts['done'],
+            })
 
         return Response(json_body=waiting_step_data)
 
@@ -614,6 +635,8 @@ class StaffAreaMixin:
             'item_type': 'openassessment',
         }
         submissions = submission_api.get_submissions(student_item)
+        # Drafts are kept out of the user state the LMS clears
+        delete_draft(student_item)
 
         if self.is_team_assignment():
             self.clear_team_state(user_id, course_id, item_id, requesting_user_id, submissions)
@@ -23,6 +23,7 @@ from openassessment.xblock.utils.data_conversion import (
 from openassessment.xblock.utils.defaults import DEFAULT_EDITOR_ASSESSMENTS_ORDER, DEFAULT_RUBRIC_FEEDBACK_TEXT
 from openassessment.xblock.utils.editor_config import AVAILABLE_EDITORS
 from openassessment.xblock.load_static import LoadStatic
+from openassessment.xblock.utils.rubric_catalogue import bump_rubric_catalogue_version
 from openassessment.xblock.utils.resolve_dates import (
     DateValidationError,
     InvalidDateFormat,
@@ -325,6 +326,12 @@ class StudioMixin:
         self.show_rubric_during_response = data.get('show_rubric_during_response', False)
         self.date_config_type = data['date_config_type']
 
+        # Requirements and dates computed from the old settings no longer apply
+        self.data_loader.clear()
+        # The title and rubric of this block are catalogued for reuse by the other blocks of the course
+        if hasattr(self.runtime, 'modulestore'):
+            bump_rubric_catalogue_version(self.location.course_key)
+
         return {'success': True, 'msg': self._('Successfully updated OpenAssessment XBlock')}
 
     @XBlock.json_handler
@@ -43,7 +43,7 @@ class TestAllowResubmission(unittest.TestCase):
     """Tests for the allow_resubmission module."""
 
     patch_submission_lock = patch(
-        "openassessment.xblock.utils.allow_resubmission.SubmissionGradingLock.get_submission_lock"
+        "openassessment.staffgrader.lock_stores.database.LockStore.get_submission_lock"
     )
 
     def setUp(self):
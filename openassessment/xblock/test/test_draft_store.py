@@ -0,0 +1,158 @@
+"""
+Tests for the store of learners' draft responses.
+"""
+
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+from openassessment.assessment.models import SubmissionDraft
+from openassessment.test_utils import CacheResetTest
+from openassessment.xblock.utils import draft_store
+from openassessment.xblock.utils.draft_store import delete_draft, flush_draft, get_draft, save_draft
+
+STUDENT_ITEM = {
+    'student_id': 'Bob',
+    'course_id': 'edX/Enchantment_101/April_1',
+    'item_id': 'openassessment.d0.u0',
+    'item_type': 'openassessment',
+}
+
+
+class TestDraftStore(CacheResetTest):
+    """ Tests of saving, coalescing and flushing drafts. """
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch('openassessment.workflow.tasks.flush_draft_task')
+        self.mock_flush_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stored_response(self):
+        return SubmissionDraft.objects.get(student_id=STUDENT_ITEM['student_id']).response
+
+    def _save(self, response, now):
+        with mock.patch('openassessment.xblock.utils.draft_store._now', return_value=now):
+            with self.captureOnCommitCallbacks(execute=True):
+                save_draft(STUDENT_ITEM, response)
+
+    def test_no_draft(self):
+        self.assertIsNone(get_draft(STUDENT_ITEM))
+        # The absence of a draft is cached too
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_draft(STUDENT_ITEM))
+
+    def test_saves_coalesced(self):
+        self._save('first', now=1000)
+        self.assertEqual(self._stored_response(), 'first')
+
+        # Saves within the flush interval are cached, and the first of them schedules a flush
+        with self.assertNumQueries(0):
+            self._save('second', now=1010)
+            self._save('third', now=1020)
+        self.assertEqual(get_draft(STUDENT_ITEM), 'third')
+        self.assertEqual(self._stored_response(), 'first')
+        self.mock_flush_task.apply_async.assert_called_once_with([STUDENT_ITEM], countdown=20)
+
+        flush_draft(STUDENT_ITEM)
+        self.assertEqual(self._stored_response(), 'third')
+
+        # Once the interval is over, the next save is written through
+        self._save('fourth', now=1031)
+        self.assertEqual(self._stored_response(), 'fourth')
+        self.mock_flush_task.apply_async.assert_called_once()
+
+    def test_flush_keeps_newer_draft(self):
+        self._save('first', now=1000)
+        self._save('second', now=1010)
+        flush_draft(STUDENT_ITEM)
+        self._save('third', now=1031)
+
+        # A late or repeated flush doesn't replace the draft written since
+        flush_draft(STUDENT_ITEM)
+        self.assertEqual(self._stored_response(), 'third')
+
+    def test_save_written_through_during_flush(self):
+        self._save('first', now=1000)
+        self._save('second', now=1010)
+
+        # The next interval's first save is written through between the flush's read and its write
+        write_draft = draft_store._write_draft  # pylint: disable=protected-access
+
+        def write_after_save(*args):
+            self._save('third', now=1031)
+            write_draft(*args)
+
+        with mock.patch.object(draft_store, '_write_draft', side_effect=self._once(write_after_save, write_draft)):
+            flush_draft(STUDENT_ITEM)
+
+        self.assertEqual(self._stored_response(), 'third')
+        self.assertEqual(get_draft(STUDENT_ITEM), 'third')
+
+    def test_save_cached_during_flush(self):
+        self._save('first', now=1000)
+        self._save('second', now=1010)
+        self.mock_flush_task.apply_async.reset_mock()
+
+        # A save within the interval is cached between the flush's read and its write
+        write_draft = draft_store._write_draft  # pylint: disable=protected-access
+
+        def write_after_save(*args):
+            self._save('third', now=1020)
+            write_draft(*args)
+
+        with mock.patch.object(draft_store, '_write_draft', side_effect=self._once(write_after_save, write_draft)):
+            flush_draft(STUDENT_ITEM)
+        self.assertEqual(self._stored_response(), 'second')
+        self.assertEqual(get_draft(STUDENT_ITEM), 'third')
+
+        # The save scheduled a flush of its own, which writes it
+        self.mock_flush_task.apply_async.assert_called_once_with([STUDENT_ITEM], countdown=10)
+        flush_draft(STUDENT_ITEM)
+        self.assertEqual(self._stored_response(), 'third')
+
+    @staticmethod
+    def _once(first_call, later_calls):
+        """ Side effect calling `first_call` the first time, then `later_calls`. """
+        calls = []
+
+        def side_effect(*args):
+            calls.append(args)
+            return (first_call if len(calls) == 1 else later_calls)(*args)
+        return side_effect
+
+    @override_settings(ORA_DRAFT_FLUSH_INTERVAL=0)
+    def test_coalescing_disabled(self):
+        self._save('first', now=1000)
+        self._save('second', now=1001)
+        self.assertEqual(self._stored_response(), 'second')
+        self.mock_flush_task.apply_async.assert_not_called()
+
+    def test_get_draft_from_database(self):
+        self._save('first', now=1000)
+        cache.clear()
+        self.assertEqual(get_draft(STUDENT_ITEM), 'first')
+
+        # The draft read from the database counts as flushed
+        self._save('second', now=1010)
+        self.assertEqual(self._stored_response(), 'second')
+
+    def test_cache_keys_are_safe(self):
+        student_item = dict(STUDENT_ITEM, student_id='Red Five', course_id='course-v1:edX+Enchantment+April_1')
+        cache_keys = [
+            draft_store._draft_cache_key(student_item),  # pylint: disable=protected-access
+            draft_store._flush_pending_cache_key(student_item),  # pylint: disable=protected-access
+        ]
+        for key in cache_keys:
+            self.assertNotIn(' ', key)
+            self.assertNotIn(':', key)
+
+    def test_delete_draft(self):
+        self._save('first', now=1000)
+        self._save('second', now=1010)
+        delete_draft(STUDENT_ITEM)
+
+        self.assertIsNone(get_draft(STUDENT_ITEM))
+        self.assertFalse(SubmissionDraft.objects.exists())
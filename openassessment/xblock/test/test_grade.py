@@ -5,10 +5,12 @@ Tests for grade handlers in Open Assessment XBlock.
 
 import copy
 import json
+from unittest.mock import patch
 
 import ddt
 
 from openassessment.assessment.api import peer as peer_api
+from openassessment.test_utils import QueryBudgetMixin
 
 from .base import (
     PEER_ASSESSMENTS,
@@ -23,7 +25,7 @@ from .base import (
 
 
 @ddt.ddt
-class TestGrade(XBlockHandlerTestCase, SubmitAssessmentsMixin, SubmissionTestMixin):
+class TestGrade(QueryBudgetMixin, XBlockHandlerTestCase, SubmitAssessmentsMixin, SubmissionTestMixin):
     """
     View-level tests for the XBlock grade handlers.
     """
@@ -216,6 +218,77 @@ class TestGrade(XBlockHandlerTestCase, SubmitAssessmentsMixin, SubmissionTestMix
         self.assertIsNone(criteria[0]['assessments'][1].get('points', None))
         self.assertIsNone(criteria[1]['assessments'][1].get('points', None))
 
+    @scenario('data/feedback_per_criterion.xml', user_id='Bernard')
+    def test_render_grade_computes_peer_scores_once(self, xblock):
+        self.create_submission_and_assessments(
+            xblock, self.SUBMISSION, self.PEERS, PEER_ASSESSMENTS, SELF_ASSESSMENT
+        )
+
+        # The peer scores are shared by every criterion, rather than computed for each of them
+        with patch.object(
+            peer_api,
+            'get_assessment_scores_with_grading_strategy',
+            wraps=peer_api.get_assessment_scores_with_grading_strategy,
+        ) as mock_get_scores:
+            resp = self.request(xblock, 'render_grade', json.dumps({})).decode('utf-8')
+
+        self.assertIn('Ġööḋ / ﻉซƈﻉɭɭﻉกՇ', resp)
+        self.assertEqual(mock_get_scores.call_count, 1)
+
+    def _render_grade_queries(self, user_id, num_peers, num_extra_criteria=0):
+        """
+        Grade a learner with `num_peers` peer assessments, on the grade scenario's rubric
+        with `num_extra_criteria` more criteria, and return the queries made rendering their grade.
+        """
+        self.set_user(user_id)
+        xblock = self.load_scenario('data/grade_scenario.xml')
+
+        rubric_assessments = copy.deepcopy(xblock.rubric_assessments)
+        for assessment in rubric_assessments:
+            if assessment['name'] == 'peer-assessment':
+                assessment['must_grade'] = assessment['must_be_graded_by'] = num_peers
+        xblock.rubric_assessments = rubric_assessments
+
+        criteria = copy.deepcopy(xblock.rubric_criteria)
+        extra_options = {}
+        for index in range(num_extra_criteria):
+            criterion = copy.deepcopy(criteria[-1])
+            criterion['name'] = criterion['label'] = f'Extra criterion {index}'
+            criterion['order_num'] = len(criteria)
+            criteria.append(criterion)
+            extra_options[criterion['name']] = criterion['options'][0]['name']
+        xblock.rubric_criteria = criteria
+        # Save the changes now, rather than when rendering the grade
+        xblock.save()
+
+        peer_assessment = copy.deepcopy(PEER_ASSESSMENTS[0])
+        peer_assessment['options_selected'].update(extra_options)
+        self_assessment = copy.deepcopy(SELF_ASSESSMENT)
+        self_assessment['options_selected'].update(extra_options)
+        self.create_submission_and_assessments(
+            xblock,
+            self.SUBMISSION,
+            [f'{user_id}_peer_{index}' for index in range(num_peers)],
+            [peer_assessment] * num_peers,
+            self_assessment,
+        )
+
+        queries = self.count_queries(self.request, xblock, 'render_grade', json.dumps({}))
+        self.assertIn('єאςєɭɭєภՇ ฬ๏гк!', self.request(xblock, 'render_grade', json.dumps({})).decode('utf-8'))
+        return queries
+
+    def test_render_grade_queries_per_peer(self):
+        # Rendering the grade reads every peer assessment in the same queries
+        queries_for_one = self._render_grade_queries('Greggs', 1)
+        queries_for_many = self._render_grade_queries('Bunk', 5)
+        self.assertQueriesPerItem(queries_for_one, queries_for_many, 4, 0)
+
+    def test_render_grade_queries_per_criterion(self):
+        # ... and every criterion of the rubric
+        queries_for_small_rubric = self._render_grade_queries('Greggs', 2)
+        queries_for_large_rubric = self._render_grade_queries('Bunk', 2, num_extra_criteria=8)
+        self.assertQueriesPerItem(queries_for_small_rubric, queries_for_large_rubric, 8, 0)
+
     @scenario('data/feedback_per_criterion.xml', user_id='Bernard')
     def test_zero_point_criterion(self, xblock):
         """ Test behavior when a learner's median score for a criterion is worth zero points"""
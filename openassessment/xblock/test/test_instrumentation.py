@@ -0,0 +1,90 @@
+"""
+Tests for the handler and view instrumentation of the Open Assessment XBlock.
+"""
+
+
+import json
+from unittest import mock
+
+from django.test.utils import override_settings
+
+import webob
+
+from openassessment.xblock.utils.instrumentation import HANDLER_HISTOGRAMS, LogSink, get_metrics_sinks
+
+from .base import SubmissionTestMixin, XBlockHandlerTestCase, scenario
+
+
+class RecordingSink:
+    """ Sink remembering every metrics it is given. """
+    recorded = []
+
+    def record(self, metrics):
+        self.recorded.append(metrics)
+
+
+class TestInstrumentation(XBlockHandlerTestCase, SubmissionTestMixin):
+    """ Tests of the metrics reported for handlers and views. """
+
+    def setUp(self):
+        super().setUp()
+        HANDLER_HISTOGRAMS.reset()
+        RecordingSink.recorded = []
+
+    def _handle(self, xblock, handler_name, content=None):
+        request = webob.Request({})
+        request.method = 'POST'
+        request.body = json.dumps(content or {}).encode('utf-8')
+        return xblock.handle(handler_name, request)
+
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_off_by_default(self, xblock):
+        self.assertEqual(get_metrics_sinks(), [])
+        with mock.patch('openassessment.xblock.utils.instrumentation.connections') as mock_connections:
+            self._handle(xblock, 'render_submission')
+        mock_connections.all.assert_not_called()
+        self.assertEqual(HANDLER_HISTOGRAMS.dump(), {})
+
+    @override_settings(ORA_HANDLER_METRICS_SINKS=['histogram'])
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_histogram(self, xblock):
+        self.create_test_submission(xblock)
+        self._handle(xblock, 'render_submission')
+        self._handle(xblock, 'render_submission')
+
+        histogram = HANDLER_HISTOGRAMS.dump()['handler.render_submission']
+        self.assertEqual(histogram['count'], 2)
+        self.assertGreater(histogram['queries'], 0)
+        self.assertEqual(sum(histogram['buckets'].values()), 2)
+
+    @override_settings(ORA_HANDLER_METRICS_SINKS=[f'{__name__}.RecordingSink'])
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_custom_sink(self, xblock):
+        self.create_test_submission(xblock)
+        xblock.xmodule_runtime = self._create_mock_runtime(
+            xblock.scope_ids.usage_id, False, False, "Bob"
+        )
+        xblock.mfe_views_enabled = True
+        # Rendered as the LMS does: the block's render() hands the view on to self.runtime.render()
+        xblock.render('student_view', {})
+
+        [metrics] = RecordingSink.recorded
+        self.assertEqual((metrics.kind, metrics.name), ('view', 'student_view'))
+        self.assertGreater(metrics.duration, 0)
+        self.assertGreater(metrics.query_count, 0)
+        # The view looks its learner data up through the block's data loader
+        self.assertGreater(metrics.cache_misses, 0)
+
+    @override_settings(ORA_HANDLER_METRICS_SINKS=['log'])
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_log(self, xblock):
+        with self.assertLogs('openassessment.xblock.utils.instrumentation', level='INFO') as logs:
+            self._handle(xblock, 'render_submission')
+        self.assertIn('ORA handler render_submission took', logs.output[0])
+
+    @override_settings(ORA_HANDLER_METRICS_SINKS=['log'])
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_failing_sink(self, xblock):
+        with mock.patch.object(LogSink, 'record', side_effect=Exception('Sink failure')):
+            response = self._handle(xblock, 'render_submission')
+        self.assertEqual(response.status_code, 200)
@@ -149,6 +149,32 @@ class TestLeaderboardRender(XBlockHandlerTransactionTestCase):
         ])
         self._assert_leaderboard_visible(xblock, True)
 
+    @scenario('data/leaderboard_show.xml')
+    def test_snapshot_rebuilt_when_scores_change(self, xblock):
+        answer = prepare_submission_for_serialization(('test answer 1 part 1', 'test answer 1 part 2'))
+        self._create_submissions_and_scores(xblock, [(answer, 1)])
+        self._assert_scores(xblock, [
+            {'score': 1, 'files': [], 'submission': create_submission_dict({'answer': answer}, xblock.prompts)},
+        ])
+
+        # Setting a score invalidates the cached snapshot, without having to clear the cache
+        better_answer = prepare_submission_for_serialization(('test answer 2 part 1', 'test answer 2 part 2'))
+        self._create_submissions_and_scores(xblock, [(better_answer, 5)])
+        self._assert_scores(xblock, [
+            {'score': 5, 'files': [], 'submission': create_submission_dict({'answer': better_answer}, xblock.prompts)},
+            {'score': 1, 'files': [], 'submission': create_submission_dict({'answer': answer}, xblock.prompts)},
+        ])
+
+    @scenario('data/leaderboard_show.xml')
+    def test_snapshot_cached(self, xblock):
+        answer = prepare_submission_for_serialization(('test answer 1 part 1', 'test answer 1 part 2'))
+        self._create_submissions_and_scores(xblock, [(answer, 1)])
+        xblock.render_leaderboard_complete(xblock.get_student_item_dict())
+
+        with mock.patch('submissions.api.get_top_submissions') as mock_get_top_submissions:
+            xblock.render_leaderboard_complete(xblock.get_student_item_dict())
+        mock_get_top_submissions.assert_not_called()
+
     @mock_s3
     @override_settings(
         AWS_ACCESS_KEY_ID='foobar',
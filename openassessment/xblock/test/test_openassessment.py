@@ -333,12 +333,13 @@ class TestOpenAssessment(XBlockHandlerTestCase):
         # No submission made, so don't update the workflow
         with patch('openassessment.xblock.workflow_mixin.workflow_api') as mock_api:
             self.runtime.render(xblock, "student_view")
+            self.assertEqual(mock_api.read_workflow_for_submission.call_count, 0)
             self.assertEqual(mock_api.update_from_assessments.call_count, 0)
 
         # Simulate one submission made (we have a submission ID)
         xblock.submission_uuid = 'test_submission'
 
-        # Now that we have a submission, the workflow should get updated
+        # Now that we have a submission, the workflow should get updated, unless it is up to date
         with patch('openassessment.xblock.workflow_mixin.workflow_api') as mock_api:
             self.runtime.render(xblock, "student_view")
             expected_reqs = {
@@ -349,7 +350,8 @@ class TestOpenAssessment(XBlockHandlerTestCase):
                     "grading_strategy": "median",
                 }
             }
-            mock_api.update_from_assessments.assert_called_once_with('test_submission', expected_reqs, {})
+            mock_api.read_workflow_for_submission.assert_called_once_with('test_submission', expected_reqs, {})
+            self.assertEqual(mock_api.update_from_assessments.call_count, 0)
 
     @scenario('data/basic_scenario.xml')
     def test_student_view_workflow_error(self, xblock):
@@ -361,7 +363,7 @@ class TestOpenAssessment(XBlockHandlerTestCase):
         # Simulate an error from updating the workflow
         xblock.submission_uuid = 'test_submission'
         with patch('openassessment.xblock.workflow_mixin.workflow_api') as mock_api:
-            mock_api.update_from_assessments.side_effect = AssessmentWorkflowError
+            mock_api.read_workflow_for_submission.side_effect = AssessmentWorkflowError
             xblock_fragment = self.runtime.render(xblock, "student_view")
 
         # Expect that the page renders even if the update fails
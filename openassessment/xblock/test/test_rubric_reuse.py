@@ -3,12 +3,16 @@ from contextlib import contextmanager
 from unittest import mock
 import json
 
+import ddt
+from django.test.utils import override_settings
 from opaque_keys.edx.keys import UsageKey
 
 from openassessment.xblock.test.base import XBlockHandlerTestCase
 from openassessment.xblock.rubric_reuse_mixin import (
     RubricReuseMixin, TargetBlockNotORAException, TargetORABlockNotFoundException
 )
+from openassessment.xblock.utils import rubric_catalogue
+from openassessment.xblock.utils.rubric_catalogue import bump_rubric_catalogue_version
 
 
 class MockBlock(RubricReuseMixin):
@@ -24,6 +28,7 @@ class MockBlock(RubricReuseMixin):
         pass
 
 
+@ddt.ddt
 class RubricReuseMixinUnitTests(XBlockHandlerTestCase):
     """ Unit tests for RubricReuseMixin """
 
@@ -102,15 +107,123 @@ class RubricReuseMixinUnitTests(XBlockHandlerTestCase):
     # get_other_ora_blocks_for_rubric_editor_context
     # -----------------------------------------------
 
-    def get_other_ora_blocks_for_rubric_editor_context(self):
-        other_blocks = [self._make_mock_ora_block() for _ in range(5)]
-        with mock.patch.object(self.block, 'get_other_course_ora_blocks') as mock_get_other_blocks:
-            mock_get_other_blocks.return_value = other_blocks
-            context = self.block.get_other_ora_blocks_for_rubric_editor_context()
-        expected_context = [{'display_name': block.display_name, 'location': block.location} for block in other_blocks]
+    def test_get_other_ora_blocks_for_rubric_editor_context(self):
+        """ Test that the editor is given the other non-orphan ORAs in the course, from the catalogue """
+        other_blocks = self._mock_course_with_catalogued_blocks()
+        context = self.block.get_other_ora_blocks_for_rubric_editor_context()
         self.assertEqual(
-            set(expected_context),
-            set(context),
+            context,
+            [
+                {'display_name': block.display_name, 'location': str(block.location)}
+                for block in other_blocks
+            ],
+        )
+
+    # ----------------
+    # rubric catalogue
+    # ----------------
+
+    def _make_catalogued_ora_block(self, index, orphan=False, rubric_criteria=None):
+        """ Helper function to create a mock ORA XBlock with a serializable rubric """
+        mock_block = self._make_mock_ora_block(
+            orphan=orphan,
+            location=self.block_location.course_key.make_usage_key('openassessment', f'ora_{index}'),
+        )
+        mock_block.display_name = f'ORA {index}'
+        mock_block.rubric_criteria = rubric_criteria or [{'name': 'Ideas', 'options': []}]
+        mock_block.rubric_feedback_prompt = 'Feedback prompt'
+        mock_block.rubric_feedback_default_text = 'Feedback default text'
+        return mock_block
+
+    def _mock_course_with_catalogued_blocks(self):
+        """
+        Mock a modulestore with this block, two other blocks sharing a rubric, one with its own
+        rubric, and an orphan. Returns the three other non-orphan blocks.
+        """
+        other_blocks = [
+            self._make_catalogued_ora_block(0),
+            self._make_catalogued_ora_block(1),
+            self._make_catalogued_ora_block(2, rubric_criteria=[{'name': 'Content', 'options': []}]),
+        ]
+        orphan = self._make_catalogued_ora_block(3, orphan=True)
+        self.block.display_name = 'This ORA'
+        self.block.rubric_criteria = []
+        self.block.rubric_feedback_prompt = ''
+        self.block.rubric_feedback_default_text = ''
+        self._mock_runtime_modulestore_get_items(return_value=[self.block] + other_blocks + [orphan])
+        return other_blocks
+
+    def test_get_rubric_catalogue(self):
+        """ Test that the catalogue lists the non-orphan ORAs of the course, sharing identical rubrics """
+        other_blocks = self._mock_course_with_catalogued_blocks()
+        catalogue = self.block.get_rubric_catalogue()
+
+        self.assertEqual(
+            [entry['location'] for entry in catalogue['blocks']],
+            [str(block.location) for block in [self.block] + other_blocks],
+        )
+        self.assertEqual(catalogue['blocks'][1]['rubric_hash'], catalogue['blocks'][2]['rubric_hash'])
+        self.assertNotEqual(catalogue['blocks'][1]['rubric_hash'], catalogue['blocks'][3]['rubric_hash'])
+        self.assertEqual(len(catalogue['rubrics']), 3)
+
+    def test_get_rubric_catalogue__cached(self):
+        """ Test that the course's ORAs are only loaded again once the catalogue is invalidated """
+        self._mock_course_with_catalogued_blocks()
+        catalogue = self.block.get_rubric_catalogue()
+        self.assertEqual(self.block.get_rubric_catalogue(), catalogue)
+        self.block.runtime.modulestore.get_items.assert_called_once()
+
+        bump_rubric_catalogue_version(self.block_location.course_key)
+        self.block.get_rubric_catalogue()
+        self.assertEqual(self.block.runtime.modulestore.get_items.call_count, 2)
+
+        # Other courses' catalogues are left alone
+        bump_rubric_catalogue_version(self.other_course_block_location.course_key)
+        self.block.get_rubric_catalogue()
+        self.assertEqual(self.block.runtime.modulestore.get_items.call_count, 2)
+
+    @override_settings(ORA_RUBRIC_CATALOGUE_CACHE_TIMEOUT=0)
+    def test_get_rubric_catalogue__cache_disabled(self):
+        """ Test that the catalogue is built for each call when caching is disabled """
+        self._mock_course_with_catalogued_blocks()
+        self.block.get_rubric_catalogue()
+        self.block.get_rubric_catalogue()
+        self.assertEqual(self.block.runtime.modulestore.get_items.call_count, 2)
+
+    @ddt.data(
+        ('openassessment', True, True),
+        ('vertical', True, False),
+        ('vertical', False, True),
+    )
+    @ddt.unpack
+    def test_get_rubric_catalogue__invalidated_by_events(self, block_type, is_edit, invalidated):
+        """ Test that publishing a course or editing its ORAs invalidates the catalogue """
+        self._mock_course_with_catalogued_blocks()
+        self.block.get_rubric_catalogue()
+
+        usage_key = self.block_location.course_key.make_usage_key(block_type, 'changed_block')
+        # pylint: disable=protected-access
+        invalidate = rubric_catalogue._invalidate_for_ora_change if is_edit else (
+            rubric_catalogue._invalidate_for_course_change
+        )
+        invalidate(signal=None, sender=None, xblock_info=mock.Mock(usage_key=usage_key, block_type=block_type))
+
+        self.block.get_rubric_catalogue()
+        self.assertEqual(self.block.runtime.modulestore.get_items.call_count, 2 if invalidated else 1)
+
+    def test_get_rubric__from_catalogue(self):
+        """ Test that get_rubric is served from the catalogue, without loading the block """
+        other_block = self._mock_course_with_catalogued_blocks()[2]
+        with self.mock_get_ora_block(side_effect=TargetORABlockNotFoundException):
+            resp = self._request_get_rubric({'target_rubric_block_id': str(other_block.location)})
+        self.assertTrue(resp['success'])
+        self.assertEqual(
+            resp['rubric'],
+            {
+                'criteria': other_block.rubric_criteria,
+                'feedback_prompt': other_block.rubric_feedback_prompt,
+                'feedback_default_text': other_block.rubric_feedback_default_text,
+            }
         )
 
     # -----------
@@ -71,7 +71,26 @@ class SaveResponseTest(XBlockHandlerTestCase):
         self.assertTrue(resp['success'])
 
         # Verify that the saved response was overwritten
-        self.assertEqual(xblock.saved_response, json.dumps(prepare_submission_for_serialization(submission)))
+        self.assertEqual(
+            xblock.submission_data.saved_response,
+            {'answer': prepare_submission_for_serialization(submission)},
+        )
+
+    @scenario('data/save_scenario.xml', user_id="Herc")
+    def test_saved_response_kept_out_of_user_state(self, xblock):
+        xblock.get_team_info = mock.Mock(return_value={})
+
+        for submission in (["First draft", "of both"], ["Second draft", "of both"]):
+            payload = json.dumps({'submission': submission})
+            resp = self.request(xblock, 'save_submission', payload, response_format="json")
+            self.assertTrue(resp['success'])
+
+        self.assertEqual(xblock.saved_response, '')
+        self.assertTrue(xblock.has_saved)
+        self.assertEqual(
+            xblock.submission_data.saved_response,
+            {'answer': prepare_submission_for_serialization(["Second draft", "of both"])},
+        )
 
     @scenario('data/save_scenario.xml', user_id="Bubbles")
     def test_missing_submission_key(self, xblock):
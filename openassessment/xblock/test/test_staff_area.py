@@ -8,6 +8,7 @@ import json
 import urllib
 
 import ddt
+import webob
 from django.test.utils import override_settings
 from mock import MagicMock, Mock, PropertyMock, call, patch
 from testfixtures import log_capture
@@ -1214,6 +1215,46 @@ class TestCourseStaff(XBlockHandlerTestCase):
             "bob_username"
         )
 
+    @patch('openassessment.data.map_anonymized_ids_to_usernames')
+    @scenario('data/peer_assessment_scenario.xml', user_id='Bob')
+    def test_waiting_step_details_api_paginated(self, xblock, username_map_patch):
+        """
+        The waiting step details can be sorted and paginated, while the counts cover every waiting student.
+        """
+        xblock.xmodule_runtime = Mock(user_is_staff=True)
+        username_map_patch.side_effect = lambda student_ids: {
+            student_id: f"{student_id}_username" for student_id in student_ids
+        }
+
+        # Three students waiting, in submission order
+        self._setup_xblock_and_create_submission(xblock)
+        for student_id in ("Tim", "Sue"):
+            student_item = STUDENT_ITEM.copy()
+            student_item.update({"student_id": student_id, "item_id": xblock.location})
+            self._create_submission(student_item, {'text': "Text Answer"}, ['staff'])
+
+        request = webob.Request.blank('/?page=2&page_size=2&sort_by=created_at&sort_order=desc')
+        resp = self.runtime.handle(xblock, 'waiting_step_data', request)
+        waiting_step_details = json.loads(resp.body.decode('utf-8'))
+
+        self.assertEqual(
+            [student['username'] for student in waiting_step_details['student_data']],
+            ["Bob_username"],
+        )
+        self.assertEqual(waiting_step_details['student_data'][0]['workflow_status'], "Pending")
+        self.assertEqual(waiting_step_details['page'], 2)
+        self.assertEqual(waiting_step_details['page_size'], 2)
+        self.assertEqual(waiting_step_details['total_count'], 3)
+        self.assertEqual(waiting_step_details['waiting_count'], 3)
+        self.assertEqual(waiting_step_details['overwritten_count'], 0)
+
+    @ddt.data('sort_by=username', 'sort_order=sideways', 'page=first', 'page_size=0')
+    @scenario('data/peer_assessment_scenario.xml', user_id='Bob')
+    def test_waiting_step_details_api_invalid_params(self, xblock, query):
+        xblock.xmodule_runtime = Mock(user_is_staff=True)
+        resp = self.runtime.handle(xblock, 'waiting_step_data', webob.Request.blank(f'/?{query}'))
+        self.assertEqual(resp.status_code, 400)
+
     @patch('openassessment.data.map_anonymized_ids_to_usernames')
     @scenario('data/basic_scenario.xml', user_id='Bob')
     def test_waiting_step_details_api_no_permission(self, xblock, username_map_patch):
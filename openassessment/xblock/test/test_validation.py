@@ -16,9 +16,11 @@ from openassessment.xblock.utils.validation import (
     validate_assessments,
     validate_dates,
     validate_rubric,
+    validate_definition,
     validate_submission,
     validator
 )
+from openassessment.xblock.utils.xml import clear_definitions_cache
 
 
 def STUB_I18N(x):
@@ -317,6 +319,41 @@ class ValidationIntegrationTest(TestCase):
         self.assertTrue(is_valid, msg=msg)
         self.assertEqual(msg, "")
 
+    def test_validate_definition_cached(self):
+        clear_definitions_cache()
+        with mock.patch('openassessment.xblock.utils.validation.validator', wraps=validator) as mock_validator:
+            for _ in range(2):
+                is_valid, msg = validate_definition(
+                    self.oa_block, STUB_I18N, self.RUBRIC, self.ASSESSMENTS, leaderboard_show=0
+                )
+                self.assertTrue(is_valid, msg=msg)
+                self.assertEqual(msg, "")
+
+        # Loading the same definition again skips validation
+        mock_validator.assert_called_once()
+
+    def test_validate_definition_invalid_not_cached(self):
+        clear_definitions_cache()
+
+        def translate_upper(text):
+            return text.upper()
+
+        with mock.patch('openassessment.xblock.utils.validation.validator', wraps=validator) as mock_validator:
+            is_valid, msg = validate_definition(
+                self.oa_block, STUB_I18N, self.RUBRIC, self.ASSESSMENTS, leaderboard_show=-1
+            )
+            self.assertFalse(is_valid)
+            self.assertEqual(msg, 'Leaderboard number is invalid.')
+
+            # The definition is reported as invalid again, with the message translated for the new caller
+            is_valid, msg = validate_definition(
+                self.oa_block, translate_upper, self.RUBRIC, self.ASSESSMENTS, leaderboard_show=-1
+            )
+            self.assertFalse(is_valid)
+            self.assertEqual(msg, 'LEADERBOARD NUMBER IS INVALID.')
+
+        self.assertEqual(mock_validator.call_count, 2)
+
     def test_student_training_examples_invalid_criterion(self):
         # Mutate the assessment training examples so the criterion names don't match the rubric
         mutated_assessments = copy.deepcopy(self.ASSESSMENTS)
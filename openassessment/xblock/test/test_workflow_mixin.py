@@ -2,9 +2,10 @@
 Tests for the workflow mixin.
 """
 
+import json
 from unittest.mock import Mock
 import ddt
-from .base import XBlockHandlerTestCase, scenario
+from .base import SubmissionTestMixin, XBlockHandlerTestCase, scenario
 
 
 @ddt.ddt
@@ -32,3 +33,35 @@ class TestGetCourseWorkflowSettings(XBlockHandlerTestCase):
         xblock.course = Mock(force_on_flexible_peer_openassessments=course_setting)
         settings = xblock.get_course_workflow_settings()
         assert settings['force_on_flexible_peer_openassessments'] == course_setting
+
+
+class TestMemoisedBlockSettings(XBlockHandlerTestCase, SubmissionTestMixin):
+    """
+    Tests for computing workflow requirements, course settings and dates once per handler
+    """
+
+    @scenario('data/grade_scenario.xml', user_id='Bob')
+    def test_computed_once_per_handler(self, xblock):
+        self.create_test_submission(xblock)
+        self.request(xblock, 'render_peer_assessment', json.dumps({}))
+
+        computed = xblock.data_loader.computed
+        assert computed['workflow_requirements'] == 1
+        assert computed['get_course_workflow_settings'] == 1
+        assert computed['is_closed'] <= len(xblock.valid_assessments) + 2
+
+    @scenario('data/grade_scenario.xml')
+    def test_recomputed_between_handlers(self, xblock):
+        with xblock.data_loader.scope():
+            assert xblock.workflow_requirements()['peer']['must_grade'] == 2
+
+        xblock.rubric_assessments[0]['must_grade'] = 1
+        assert xblock.workflow_requirements()['peer']['must_grade'] == 1
+
+    @scenario('data/grade_scenario.xml')
+    def test_clear_forgets_settings(self, xblock):
+        with xblock.data_loader.scope():
+            assert xblock.workflow_requirements()['peer']['must_grade'] == 2
+            xblock.rubric_assessments[0]['must_grade'] = 1
+            xblock.data_loader.clear()
+            assert xblock.workflow_requirements()['peer']['must_grade'] == 1
@@ -17,6 +17,8 @@ from openassessment.xblock.openassessmentblock import OpenAssessmentBlock
 from openassessment.xblock.utils.xml import (
     UpdateFromXmlError,
     _parse_prompts_xml,
+    clear_definitions_cache,
+    definitions_cache,
     parse_assessments_xml,
     parse_examples_xml,
     parse_from_xml_str,
@@ -218,6 +220,25 @@ class TestSerializeContent(TestCase):
         xml_str = serialize_assessments_to_xml_str(self.oa_block)
         self.assertIn(data['assessments'][0]['name'], xml_str)
 
+    def test_serialize_cached_definition(self):
+        self._configure_xblock({})
+        clear_definitions_cache()
+        xml = serialize_content(self.oa_block)
+        self.assertEqual(serialize_content(self.oa_block), xml)
+
+        # Another block sharing the rubric gets its own title, with the same rubric
+        self.oa_block.title = 'Another block'
+        other_xml = serialize_content(self.oa_block)
+        self.assertIn('<title>Another block</title>', other_xml)
+        self.assertEqual(
+            etree.tostring(etree.fromstring(other_xml).find('rubric')),
+            etree.tostring(etree.fromstring(xml).find('rubric')),
+        )
+
+        # Changing the rubric changes the serialized rubric
+        self.oa_block.rubric_criteria[0]['prompt'] = 'Changed criterion prompt'
+        self.assertIn('Changed criterion prompt', serialize_content(self.oa_block))
+
     def test_mutated_criteria_dict(self):
         self._configure_xblock({})
 
@@ -554,6 +575,20 @@ class TestParseFromXml(TestCase):
                     )
                 )
 
+    @ddt.file_data('data/update_from_xml.json')
+    def test_parse_from_xml_cached(self, data):
+        clear_definitions_cache()
+        xml = "".join(data['xml'])
+        config = parse_from_xml_str(xml)
+        self.assertGreater(len(definitions_cache), 0)
+
+        # Parsing the same definition again returns equal, but independent, values
+        cached_config = parse_from_xml_str(xml)
+        self.assertEqual(cached_config, config)
+        self.assertIsNot(cached_config['rubric_criteria'], config['rubric_criteria'])
+        cached_config['rubric_criteria'].append({'name': 'Added criterion'})
+        self.assertEqual(parse_from_xml_str(xml)['rubric_criteria'], config['rubric_criteria'])
+
     @ddt.file_data('data/update_from_xml_error.json')
     def test_parse_from_xml_error(self, data):
         with self.assertRaises(UpdateFromXmlError):
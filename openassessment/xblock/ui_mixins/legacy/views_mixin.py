@@ -4,6 +4,8 @@ Views for the old-style ORA UI
 
 from xblock.core import XBlock
 
+from openassessment.xblock.apis.data_loader import loads_learner_data
+
 from .views.peer import render_peer_assessment, peer_path_and_context
 from .views.self import render_self_assessment, self_path_and_context
 from .views.staff import render_staff_assessment, staff_path_and_context
@@ -13,6 +15,7 @@ from .views.submission import render_submission, get_submission_path, get_submis
 
 class LegacyViewsMixin:
     @XBlock.handler
+    @loads_learner_data
     def render_submission(self, data, suffix=""):  # pylint: disable=unused-argument
         return render_submission(self.config_data, self.submission_data)
 
@@ -21,6 +24,7 @@ class LegacyViewsMixin:
         return get_submission_path(self.submission_data), get_submission_context(self.config_data, self.submission_data)
 
     @XBlock.handler
+    @loads_learner_data
     def render_peer_assessment(self, data, suffix=""):  # pylint: disable=unused-argument
         continue_grading = data.params.get("continue_grading", False)
         peer_assessment_data = self.peer_assessment_data(continue_grading)
@@ -50,6 +54,7 @@ class LegacyViewsMixin:
         return training_path_and_context(self.api_data)
 
     @XBlock.handler
+    @loads_learner_data
     def render_self_assessment(self, data, suffix=""):  # pylint: disable=unused-argument
         step_data = self.api_data.self_assessment_data
         if step_data.is_cancelled:
@@ -57,9 +62,11 @@ class LegacyViewsMixin:
         return render_self_assessment(self.api_data)
 
     @XBlock.handler
+    @loads_learner_data
     def render_staff_assessment(self, data, suffix=""):  # pylint: disable=unused-argument
         return render_staff_assessment(self.api_data)
 
     @XBlock.handler
+    @loads_learner_data
     def render_student_training(self, data, suffix=""):  # pylint: disable=unused-argument
         return render_student_training(self.api_data)
@@ -10,6 +10,7 @@ from openassessment.fileupload.exceptions import FileUploadError
 from openassessment.assessment.errors import AssessmentError
 from openassessment.workflow.errors import AssessmentWorkflowError
 from openassessment.xblock.apis.assessments.errors import InvalidStateToAssess
+from openassessment.xblock.apis.data_loader import loads_learner_data
 from openassessment.xblock.apis.assessments.peer_assessment_api import peer_assess
 from openassessment.xblock.apis.assessments.self_assessment_api import self_assess
 from openassessment.xblock.apis.assessments.student_training_api import training_assess
@@ -73,6 +74,7 @@ class MfeMixin:
         return block_info.data
 
     @XBlock.json_handler
+    @loads_learner_data
     def get_learner_data(self, data, suffix=""):  # pylint: disable=unused-argument
         """
         Get data for the user / step of the ORA, based on the following modes:
@@ -145,8 +147,16 @@ class MfeMixin:
 
     def _submission_draft_handler(self, data):
         try:
-            student_submission_data = data['response']['textResponses']
-            submissions_actions.save_submission_draft(student_submission_data, self.config_data, self.submission_data)
+            if 'textResponseUpdates' in data['response']:
+                # Only the responses to the prompts edited since the last save
+                submissions_actions.update_submission_draft(
+                    data['response']['textResponseUpdates'], self.config_data, self.submission_data
+                )
+            else:
+                student_submission_data = data['response']['textResponses']
+                submissions_actions.save_submission_draft(
+                    student_submission_data, self.config_data, self.submission_data
+                )
         except KeyError as e:
             raise OraApiException(400, error_codes.INCORRECT_PARAMETERS) from e
         except SubmissionValidationException as exc:
@@ -291,12 +301,12 @@ class MfeMixin:
     def _get_in_progress_file_upload_data(self, team_id=None):
         if not self.file_upload_type:
             return []
-        return self.file_manager.file_descriptors(team_id=team_id, include_deleted=True)
+        return self.submission_data.files.file_descriptors(team_id=team_id)
 
     def _get_in_progress_team_file_upload_data(self, team_id=None):
         if not self.file_upload_type or not self.is_team_assignment():
             return []
-        return self.submission_data.files.file_manager.team_file_descriptors(team_id=team_id)
+        return self.submission_data.files.team_file_descriptors(team_id=team_id)
 
     def get_learner_submission_data(self):
         # TODO - Move this out of mixin, this is only here because it accesses
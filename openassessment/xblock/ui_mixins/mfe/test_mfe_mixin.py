@@ -1,8 +1,9 @@
 """
 Tests for XBlock handlers for the ORA MFE BFF
 """
-from collections import namedtuple
+from collections import Counter, namedtuple
 from contextlib import contextmanager
+from importlib import import_module
 import copy
 import json
 from unittest.mock import Mock, PropertyMock, patch
@@ -15,9 +16,11 @@ from submissions import team_api as submission_team_api
 
 from openassessment.assessment.errors.base import AssessmentError
 from openassessment.xblock.apis.assessments.peer_assessment_api import PeerAssessmentAPI
+from openassessment.xblock.apis.data_loader import ORADataLoader, load_in_scope
 from openassessment.xblock.apis.workflow_api import WorkflowAPI
 from openassessment.fileupload.api import FileUpload
 from openassessment.fileupload.exceptions import FileUploadError
+from openassessment.test_utils import QueryBudgetMixin
 from openassessment.tests.factories import SharedFileUploadFactory, UserFactory
 from openassessment.workflow import api as workflow_api
 from openassessment.workflow import team_api as team_workflow_api
@@ -34,7 +37,14 @@ from openassessment.xblock.apis.submissions.errors import (
     UnsupportedFileTypeException
 )
 from openassessment.xblock.apis.submissions.file_api import FileAPI
-from openassessment.xblock.test.base import SubmissionTestMixin, XBlockHandlerTestCase, scenario
+from openassessment.xblock.test.base import (
+    PEER_ASSESSMENTS,
+    SELF_ASSESSMENT,
+    SubmissionTestMixin,
+    SubmitAssessmentsMixin,
+    XBlockHandlerTestCase,
+    scenario
+)
 from openassessment.xblock.test.test_staff_area import NullUserService, UserStateService
 from openassessment.xblock.test.test_submission import COURSE_ID, setup_mock_team
 from openassessment.xblock.test.test_team import MOCK_TEAM_ID, MockTeamsService
@@ -576,6 +586,7 @@ class PageDataSubmissionSerializerTest(MFEHandlersTestBase):
         return team_submission, team_workflow
 
 
+@ddt.ddt
 class SubmissionDraftTest(MFEHandlersTestBase):
 
     @contextmanager
@@ -608,6 +619,31 @@ class SubmissionDraftTest(MFEHandlersTestBase):
             assert resp.status_code == 200
             assert_called_once_with_helper(mock_draft, self.DEFAULT_DRAFT_VALUE['response']['textResponses'], 2)
 
+    @scenario("data/basic_scenario.xml", user_id="Alan")
+    def test_draft_partial_update(self, xblock):
+        self.request_save_draft(xblock, {'response': {'textResponses': ['hello world', 'goodnight moon']}})
+        resp = self.request_save_draft(xblock, {'response': {'textResponseUpdates': {'1': 'goodnight stars'}}})
+        assert resp.status_code == 200
+
+        draft = xblock.submission_data.saved_response_submission_dict
+        assert [part['text'] for part in draft['answer']['parts']] == ['hello world', 'goodnight stars']
+        # Drafts are kept out of user state
+        assert xblock.saved_response == ''
+
+    @scenario("data/basic_scenario.xml", user_id="Alan")
+    def test_draft_partial_update_without_draft(self, xblock):
+        resp = self.request_save_draft(xblock, {'response': {'textResponseUpdates': {'0': 'hello world'}}})
+        assert resp.status_code == 200
+
+        draft = xblock.submission_data.saved_response_submission_dict
+        assert [part['text'] for part in draft['answer']['parts']] == ['hello world', '']
+
+    @ddt.data({'2': 'out of range'}, {'-1': 'out of range'}, {'first': 'not an index'}, ['not', 'a dict'])
+    @scenario("data/basic_scenario.xml", user_id="Alan")
+    def test_draft_partial_update_invalid(self, xblock, text_response_updates):
+        resp = self.request_save_draft(xblock, {'response': {'textResponseUpdates': text_response_updates}})
+        assert_error_response(resp, 400, error_codes.INVALID_RESPONSE_SHAPE, 'The submission format is invalid.')
+
 
 class SubmissionCreateTest(MFEHandlersTestBase):
 
@@ -1034,3 +1070,134 @@ class AssessmentSubmitTest(MFEHandlersTestBase):
         assess_mocks.self.assert_not_called()
         assess_mocks.training.assert_not_called()
         assess_mocks.peer.assert_not_called()
+
+
+@ddt.ddt
+class GetLearnerDataLookupsTest(QueryBudgetMixin, MFEHandlersTestBase, SubmitAssessmentsMixin):
+    """
+    Regression tests for the number of learner data lookups and queries made while serializing each page state.
+    Each record should be read at most once per request, however many APIs and serializers use it.
+    """
+
+    # Query budgets for each page state: the queries measured, plus a slack of 2 so that reordering
+    # lookups doesn't fail them. Raise one only when the new queries are intended.
+    # They include the workbench's reads of the block's fields, which the first request for a block
+    # makes one by one ('submission'), and the scoring of the workflow on the first render of 'done'.
+    GET_LEARNER_DATA_QUERIES = {'submission': 63, 'peer': 31, 'self': 26, 'done': 59}
+    STUDENT_VIEW_QUERIES = {'submission': 23, 'peer': 20, 'self': 17, 'done': 42}
+
+    LOOKUPS = [
+        'openassessment.workflow.api.read_workflow_for_submission',
+        'openassessment.xblock.apis.submissions.submissions_api.get_submission',
+        'submissions.api.get_submission',
+        'openassessment.workflow.api.get_assessment_workflow_cancellation',
+        'openassessment.assessment.api.peer.get_assessments',
+        'openassessment.assessment.api.peer.get_score',
+        'openassessment.assessment.api.peer.get_graded_by_count',
+        'openassessment.assessment.api.peer.has_finished_required_evaluating',
+        'openassessment.assessment.api.self.get_assessment',
+        'openassessment.assessment.api.staff.get_assessment',
+    ]
+
+    @contextmanager
+    def count_lookups(self):
+        """ Spy on each learner data lookup, yielding a dict of lookup path to spy """
+        spies = {}
+        patchers = []
+        for path in self.LOOKUPS:
+            module_path, name = path.rsplit('.', 1)
+            module = import_module(module_path)
+            patcher = patch(path, wraps=getattr(module, name))
+            spies[path] = patcher.start()
+            patchers.append(patcher)
+        try:
+            yield spies
+        finally:
+            for patcher in patchers:
+                patcher.stop()
+
+    def assert_each_record_read_once(self, spies):
+        for path, spy in spies.items():
+            call_counts = Counter(repr(call) for call in spy.call_args_list)
+            for call, count in call_counts.items():
+                self.assertEqual(count, 1, f"{path} was called {count} times with {call}")
+
+    def get_learner_data_for_state(self, xblock, state):
+        """ Move the learner into the given page state and return the step to request """
+        if state == 'submission':
+            return None
+        if state == 'peer':
+            self.create_test_submission(xblock)
+            return 'peer'
+        self_assessment = SELF_ASSESSMENT if state == 'done' else None
+        self.create_submission_and_assessments(
+            xblock, self.SUBMISSION, self.PEERS, PEER_ASSESSMENTS, self_assessment
+        )
+        return state
+
+    def render_student_view(self, xblock):
+        """ Render the student view as the LMS does, for the scenario's learner """
+        xblock.xmodule_runtime = self._create_mock_runtime(xblock.scope_ids.usage_id, False, False, 'Greggs')
+        xblock.mfe_views_enabled = True
+        return xblock.student_view(context={})
+
+    @ddt.data('submission', 'peer', 'self', 'done')
+    @scenario("data/grade_scenario.xml", user_id='Greggs')
+    def test_get_learner_data(self, xblock, state):
+        suffix = self.get_learner_data_for_state(xblock, state)
+        with self.count_lookups() as spies:
+            response = self.request_get_learner_data(xblock, suffix=suffix)
+
+        assert response.status_code == 200
+        self.assert_each_record_read_once(spies)
+
+    @ddt.data('submission', 'peer', 'self', 'done')
+    @scenario("data/grade_scenario.xml", user_id='Greggs')
+    def test_student_view(self, xblock, state):
+        self.get_learner_data_for_state(xblock, state)
+        with self.count_lookups() as spies:
+            self.render_student_view(xblock)
+
+        self.assert_each_record_read_once(spies)
+
+    @ddt.data('submission', 'peer', 'self', 'done')
+    @scenario("data/grade_scenario.xml", user_id='Greggs')
+    def test_get_learner_data_query_budget(self, xblock, state):
+        suffix = self.get_learner_data_for_state(xblock, state)
+        with self.assertMaxNumQueries(self.GET_LEARNER_DATA_QUERIES[state]):
+            response = self.request_get_learner_data(xblock, suffix=suffix)
+
+        assert response.status_code == 200
+
+    @ddt.data('submission', 'peer', 'self', 'done')
+    @scenario("data/grade_scenario.xml", user_id='Greggs')
+    def test_student_view_query_budget(self, xblock, state):
+        self.get_learner_data_for_state(xblock, state)
+        with self.assertMaxNumQueries(self.STUDENT_VIEW_QUERIES[state]):
+            self.render_student_view(xblock)
+
+    def test_loader_only_remembers_lookups_within_scope(self):
+        loader = ORADataLoader()
+        lookup = Mock(return_value={'status': 'peer'})
+
+        loader.load(('workflow', 'abc'), lookup, 'abc')
+        with loader.scope():
+            loader.load(('workflow', 'abc'), lookup, 'abc')
+            value = loader.load(('workflow', 'abc'), lookup, 'abc')
+            value['status'] = 'done'
+            assert loader.load(('workflow', 'abc'), lookup, 'abc') == {'status': 'peer'}
+        loader.load(('workflow', 'abc'), lookup, 'abc')
+
+        assert lookup.call_count == 3
+
+    def test_apis_share_lookups_of_open_scope(self):
+        loader = ORADataLoader()
+        lookup = Mock(return_value=2)
+
+        load_in_scope(('peer_graded_by_count', 'abc'), lookup, 'abc')
+        with loader.scope():
+            load_in_scope(('peer_graded_by_count', 'abc'), lookup, 'abc')
+            assert loader.load(('peer_graded_by_count', 'abc'), lookup, 'abc') == 2
+        load_in_scope(('peer_graded_by_count', 'abc'), lookup, 'abc')
+
+        assert lookup.call_count == 3
@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 import pytz
 
-from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+from openassessment.staffgrader.lock_stores import get_lock_store
 
 
 def allow_resubmission(config_data, workflow_data, submission_data: dict) -> bool:
@@ -118,5 +118,5 @@ def has_grade_in_process(submission_uuid: str) -> bool:
     Returns:
         bool: True if the submission has a grade in process, False otherwise.
     """
-    lock = SubmissionGradingLock.get_submission_lock(submission_uuid)
+    lock = get_lock_store().get_submission_lock(submission_uuid)
     return lock is not None and lock.is_active
@@ -0,0 +1,182 @@
+"""
+Learners' draft responses, stored apart from courseware user state.
+
+Autosaves come in bursts while learners type. Each save lands in the cache, and is written
+through to the SubmissionDraft table at most once per flush interval for a learner and item:
+saves made within the interval only update the cache, and schedule a task which writes the
+latest one once the interval is over.
+
+Each draft is versioned by the time it was saved, and the table only ever takes a newer
+version, so a flush racing a later save can't replace the later draft.
+"""
+from functools import partial
+from hashlib import sha1
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now as tz_now
+
+# Seconds between two writes of a learner's draft to the database, unless overridden by the
+# ORA_DRAFT_FLUSH_INTERVAL setting. 0 writes every save through.
+DEFAULT_DRAFT_FLUSH_INTERVAL = 30
+
+# Seconds a draft is cached for. Long enough for its flush to run, however backed up tasks are.
+# Until it is flushed, a draft only lives in the cache: if the cache evicts it first, the saves
+# of that flush interval are lost, and the learner gets back the draft last written to the table,
+# at most one flush interval older.
+DRAFT_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Seconds a scheduled flush keeps later saves from scheduling another one. Past it, a flush that
+# was lost or is still queued no longer holds back the next one.
+DRAFT_FLUSH_PENDING_TIMEOUT = 5 * 60
+
+
+def _now():
+    """
+    Seconds since the epoch, which versions drafts and times their flushes.
+    """
+    return time.time()
+
+
+def _student_item_digest(student_item):
+    """
+    Course, item and student ids contain spaces and colons, so they are hashed to keep cache keys
+    short and free of unsafe characters.
+    """
+    canonical_form = "{course_id}.{item_id}.{student_id}".format(**student_item)
+    return sha1(canonical_form.encode('utf-8')).hexdigest()
+
+
+def _draft_cache_key(student_item):
+    return f"openassessment.draft.{_student_item_digest(student_item)}"
+
+
+def _flush_pending_cache_key(student_item):
+    return f"openassessment.draft_flush_pending.{_student_item_digest(student_item)}"
+
+
+def _drafts(student_item):
+    from openassessment.assessment.models import SubmissionDraft
+
+    return SubmissionDraft.objects.filter(
+        student_id=student_item['student_id'],
+        course_id=student_item['course_id'],
+        item_id=student_item['item_id'],
+    )
+
+
+def get_draft(student_item):
+    """
+    Get the draft response of a learner.
+
+    Args:
+        student_item (dict): The learner's student item, see OpenAssessmentBlock.get_student_item_dict.
+
+    Returns:
+        str: The response, serialized as the `saved_response` XBlock field is, or None
+            when the learner has no draft in the store.
+    """
+    entry = cache.get(_draft_cache_key(student_item))
+    if entry is not None:
+        return entry['response']
+
+    draft, version = _drafts(student_item).values_list('response', 'version').first() or (None, 0)
+    # Cached even when there is no draft. The next save is written through.
+    cache.set(
+        _draft_cache_key(student_item),
+        {'response': draft, 'version': version, 'flush_after': 0},
+        DRAFT_CACHE_TIMEOUT,
+    )
+    return draft
+
+
+def save_draft(student_item, response):
+    """
+    Save the draft response of a learner, replacing any previous one.
+
+    Args:
+        student_item (dict): The learner's student item, see OpenAssessmentBlock.get_student_item_dict.
+        response (str): The response, serialized as the `saved_response` XBlock field is.
+    """
+    now = _now()
+    version = int(now * 1000000)
+    flush_interval = getattr(settings, 'ORA_DRAFT_FLUSH_INTERVAL', DEFAULT_DRAFT_FLUSH_INTERVAL)
+    if not flush_interval:
+        _write_draft(student_item, response, version)
+        return
+
+    cache_key = _draft_cache_key(student_item)
+    entry = cache.get(cache_key)
+    if entry is None or now >= entry['flush_after']:
+        _write_draft(student_item, response, version)
+        cache.set(
+            cache_key,
+            {'response': response, 'version': version, 'flush_after': now + flush_interval},
+            DRAFT_CACHE_TIMEOUT,
+        )
+        return
+
+    cache.set(
+        cache_key,
+        {'response': response, 'version': version, 'flush_after': entry['flush_after']},
+        DRAFT_CACHE_TIMEOUT,
+    )
+    # Saved after the pending flush, if any, read the draft: have this one written at the end of
+    # the interval. A flush clears its pending key before reading, so no save is left unflushed.
+    if cache.add(_flush_pending_cache_key(student_item), version, DRAFT_FLUSH_PENDING_TIMEOUT):
+        from openassessment.workflow.tasks import flush_draft_task
+        transaction.on_commit(partial(
+            flush_draft_task.apply_async, [student_item], countdown=max(entry['flush_after'] - now, 0)
+        ))
+
+
+def flush_draft(student_item):
+    """
+    Write the cached draft of a learner to the database, unless a newer one is written already.
+
+    Args:
+        student_item (dict): The learner's student item, see OpenAssessmentBlock.get_student_item_dict.
+    """
+    cache.delete(_flush_pending_cache_key(student_item))
+    entry = cache.get(_draft_cache_key(student_item))
+    if entry is None or entry['response'] is None:
+        return
+    _write_draft(student_item, entry['response'], entry['version'])
+
+
+def delete_draft(student_item):
+    """
+    Delete the draft of a learner, e.g. when their state is cleared.
+
+    Args:
+        student_item (dict): The learner's student item, see OpenAssessmentBlock.get_student_item_dict.
+    """
+    cache.delete_many([_draft_cache_key(student_item), _flush_pending_cache_key(student_item)])
+    _drafts(student_item).delete()
+
+
+def _write_draft(student_item, response, version):
+    """
+    Store a draft, unless the stored one is as recent.
+    """
+    from openassessment.assessment.models import SubmissionDraft
+
+    drafts = _drafts(student_item)
+    if drafts.filter(version__lt=version).update(response=response, version=version, modified=tz_now()):
+        return
+    if drafts.exists():
+        return
+    try:
+        with transaction.atomic():
+            SubmissionDraft.objects.create(
+                student_id=student_item['student_id'],
+                course_id=student_item['course_id'],
+                item_id=student_item['item_id'],
+                response=response,
+                version=version,
+            )
+    except IntegrityError:
+        # Created by a concurrent save: replace it if it is older
+        drafts.filter(version__lt=version).update(response=response, version=version, modified=tz_now())
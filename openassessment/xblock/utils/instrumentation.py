@@ -0,0 +1,207 @@
+"""
+Opt-in latency, query and cache instrumentation for the ORA XBlock handlers and views.
+
+Each handler or view the runtime calls on the block is measured when at least one
+sink is configured, see `get_metrics_sinks`. When none is, the cost is a settings lookup.
+"""
+from collections import namedtuple
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+from edx_django_utils.monitoring import set_custom_attribute
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+# What was measured during one call of a handler or view.
+#   kind (str): "handler" or "view".
+#   name (str): Name of the handler or view, e.g. "render_peer_assessment" or "student_view".
+#   duration (float): Wall time, in seconds.
+#   query_count (int): Number of database queries, over every configured database.
+#   query_time (float): Time spent in those queries, in seconds.
+#   cache_hits (int): Learner data lookups served by the block's data loader.
+#   cache_misses (int): Learner data lookups the block's data loader had to compute.
+HandlerMetrics = namedtuple(
+    'HandlerMetrics',
+    ['kind', 'name', 'duration', 'query_count', 'query_time', 'cache_hits', 'cache_misses']
+)
+
+
+class LogSink:
+    """
+    Logs the metrics of each call at info level.
+    """
+    def record(self, metrics):
+        logger.info(
+            "ORA %s %s took %.1fms: %d queries in %.1fms, %d cache hits, %d cache misses",
+            metrics.kind, metrics.name, metrics.duration * 1000,
+            metrics.query_count, metrics.query_time * 1000,
+            metrics.cache_hits, metrics.cache_misses,
+        )
+
+
+class MonitoringSink:
+    """
+    Reports the metrics of each call as custom attributes of the current transaction.
+    """
+    def record(self, metrics):
+        set_custom_attribute('ora_handler', f'{metrics.kind}.{metrics.name}')
+        set_custom_attribute('ora_handler.duration_ms', round(metrics.duration * 1000, 1))
+        set_custom_attribute('ora_handler.query_count', metrics.query_count)
+        set_custom_attribute('ora_handler.query_time_ms', round(metrics.query_time * 1000, 1))
+        set_custom_attribute('ora_handler.cache_hits', metrics.cache_hits)
+        set_custom_attribute('ora_handler.cache_misses', metrics.cache_misses)
+
+
+class HistogramSink:
+    """
+    Keeps a histogram of the wall time of each handler and view in memory, for the
+    life of the process. `dump()` returns what was collected so far.
+    """
+    # Upper bounds of the buckets, in milliseconds. The last bucket takes everything slower.
+    BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def _new_histogram(self):
+        return {
+            'count': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'queries': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'buckets': [0] * (len(self.BUCKETS) + 1),
+        }
+
+    def record(self, metrics):
+        duration_ms = metrics.duration * 1000
+        bucket = next(
+            (index for index, bound in enumerate(self.BUCKETS) if duration_ms <= bound),
+            len(self.BUCKETS)
+        )
+        with self._lock:
+            histogram = self._histograms.setdefault(f'{metrics.kind}.{metrics.name}', self._new_histogram())
+            histogram['count'] += 1
+            histogram['total_ms'] += duration_ms
+            histogram['max_ms'] = max(histogram['max_ms'], duration_ms)
+            histogram['queries'] += metrics.query_count
+            histogram['cache_hits'] += metrics.cache_hits
+            histogram['cache_misses'] += metrics.cache_misses
+            histogram['buckets'][bucket] += 1
+
+    def dump(self):
+        """
+        Returns:
+            dict mapping "<kind>.<name>" to a dict with the number of calls, their total
+            and maximum wall time, the queries and cache lookups they made, and the number
+            of calls in each bucket, keyed by the bucket's upper bound ("+inf" for the last one).
+        """
+        labels = [f'<={bound}ms' for bound in self.BUCKETS] + ['+inf']
+        with self._lock:
+            return {
+                name: dict(histogram, buckets=dict(zip(labels, histogram['buckets'])))
+                for name, histogram in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+
+HANDLER_HISTOGRAMS = HistogramSink()
+
+METRICS_SINKS = {
+    'log': LogSink(),
+    'monitoring': MonitoringSink(),
+    'histogram': HANDLER_HISTOGRAMS,
+}
+
+
+@lru_cache(maxsize=None)
+def _import_sink(path):
+    return import_string(path)()
+
+
+def get_metrics_sinks():
+    """
+    Returns the sinks handler and view metrics are reported to, or an empty list when
+    instrumentation is off.
+    """
+    # .. setting_name: ORA_HANDLER_METRICS_SINKS
+    # .. setting_default: []
+    # .. setting_description: Where to report the wall time, database queries and learner data cache
+    #     hits and misses of each ORA XBlock handler and view. A list of any of 'log' (info level logs),
+    #     'monitoring' (edx_django_utils custom attributes), 'histogram' (kept in memory, see
+    #     openassessment.xblock.utils.instrumentation.HANDLER_HISTOGRAMS), or the dotted path of a class
+    #     whose instances have a `record(metrics)` method. Empty turns instrumentation off.
+    sink_names = getattr(settings, 'ORA_HANDLER_METRICS_SINKS', None)
+    if not sink_names:
+        return []
+    return [METRICS_SINKS[name] if name in METRICS_SINKS else _import_sink(name) for name in sink_names]
+
+
+class _QueryRecorder:
+    """
+    Database execute wrapper counting and timing the queries it runs.
+    """
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.time += time.perf_counter() - start
+
+
+@contextmanager
+def instrumented(block, kind, name):
+    """
+    Measure the handler or view called in the body and report it to the configured sinks.
+
+    Args:
+        block (OpenAssessmentBlock): The block handling the call.
+        kind (str): "handler" or "view".
+        name (str): The name of the handler or view.
+    """
+    sinks = get_metrics_sinks()
+    if not sinks:
+        yield
+        return
+
+    queries = _QueryRecorder()
+    loader = block.data_loader
+    hits, misses = loader.hits, loader.misses
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(queries))
+            yield
+    finally:
+        metrics = HandlerMetrics(
+            kind=kind,
+            name=name,
+            duration=time.perf_counter() - start,
+            query_count=queries.count,
+            query_time=queries.time,
+            cache_hits=loader.hits - hits,
+            cache_misses=loader.misses - misses,
+        )
+        for sink in sinks:
+            try:
+                sink.record(metrics)
+            except Exception:  # pylint: disable=broad-except
+                # Reporting must never break the handler
+                logger.exception("Could not report metrics of ORA %s %s to %r", kind, name, sink)
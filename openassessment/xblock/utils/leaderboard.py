@@ -0,0 +1,80 @@
+"""
+Cached snapshots of the top scores shown by the leaderboard.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from openassessment.assessment.cache import bump_cache_version
+
+# Seconds a snapshot is cached for, unless overridden by the ORA_LEADERBOARD_CACHE_TIMEOUT
+# setting. 0 disables caching. Snapshots are also invalidated whenever a score changes.
+DEFAULT_LEADERBOARD_CACHE_TIMEOUT = 300
+
+
+def get_leaderboard_snapshot(course_id, item_id, item_type, leaderboard_show):
+    """
+    Get the top scores for an item, with the files submitted with each of them.
+
+    Args:
+        course_id (str): The course of the item.
+        item_id (str): The item the scores are for.
+        item_type (str): The type of the item, e.g. "openassessment".
+        leaderboard_show (int): The number of top scores to return.
+
+    Returns:
+        list of dicts with the keys of `submissions.api.get_top_submissions`, plus 'files':
+        a list of dicts with the 'key', 'name', 'description' and 'size' of each file.
+        Download urls are not included, since they expire sooner than the snapshot.
+    """
+    cache_timeout = getattr(settings, 'ORA_LEADERBOARD_CACHE_TIMEOUT', DEFAULT_LEADERBOARD_CACHE_TIMEOUT)
+    if not cache_timeout:
+        return _build_leaderboard_snapshot(course_id, item_id, item_type, leaderboard_show, use_cache=True)
+
+    cache_key = "openassessment.leaderboard.{}.{}.{}.v{}".format(
+        course_id, item_id, leaderboard_show, cache.get(_leaderboard_version_key(course_id, item_id), 0)
+    )
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        # The snapshot replaces the submissions API's own top scores cache, which isn't
+        # invalidated when scores change
+        snapshot = _build_leaderboard_snapshot(course_id, item_id, item_type, leaderboard_show, use_cache=False)
+        cache.set(cache_key, snapshot, cache_timeout)
+    return snapshot
+
+
+def _build_leaderboard_snapshot(course_id, item_id, item_type, leaderboard_show, use_cache):
+    """
+    Query the top scores and parse the files out of each submission.
+    """
+    # Imports are placed here to avoid model import at project startup.
+    from submissions import api as sub_api
+
+    from openassessment.data import OraSubmissionAnswerFactory
+
+    scores = sub_api.get_top_submissions(course_id, item_id, item_type, leaderboard_show, use_cache=use_cache)
+    for score in scores:
+        answer = OraSubmissionAnswerFactory.parse_submission_raw_answer(score['content'])
+        score['files'] = [
+            {
+                'key': uploaded_file.key,
+                'name': uploaded_file.name,
+                'description': uploaded_file.description,
+                'size': uploaded_file.size,
+            }
+            for uploaded_file in answer.get_file_uploads(missing_blank=True)
+        ]
+    return scores
+
+
+def _leaderboard_version_key(course_id, item_id):
+    """
+    Cache key of the counter that versions cached snapshots for an item.
+    """
+    return f"openassessment.leaderboard_version.{course_id}.{item_id}"
+
+
+def bump_leaderboard_version(course_id, item_id):
+    """
+    Invalidate cached snapshots for an item, after one of its scores is set or reset.
+    """
+    bump_cache_version(_leaderboard_version_key(course_id, item_id))
@@ -1,6 +1,7 @@
 """
 This module contains utility functions for sending notifications.
 """
+from functools import partial
 import logging
 
 from opaque_keys.edx.keys import UsageKey, CourseKey
@@ -8,6 +9,7 @@ from opaque_keys import InvalidKeyError
 
 from django.conf import settings
 from django.core.exceptions import FieldError
+from django.db import transaction
 from openedx_events.learning.signals import COURSE_NOTIFICATION_REQUESTED, USER_NOTIFICATION_REQUESTED
 from openedx_events.learning.data import CourseNotificationData, UserNotificationData
 from django.contrib.auth import get_user_model
@@ -43,37 +45,90 @@ def send_staff_notification(course_id, problem_id, ora_name):
         logger.error(f"Error while sending ora staff notification: {e}")
 
 
-def send_grade_assigned_notification(usage_id, ora_user_anonymized_id, score):
+def queue_grade_assigned_notification(usage_id, ora_user_anonymized_id, score):
     """
-        Send a user notification for a course for a new grade being assigned
+    Send a grade assigned notification once the current transaction commits, so that nothing
+    is sent for a grade which is rolled back, and the learner is not looked up inside the transaction.
+
+    Args:
+        usage_id (str): The ORA block usage key.
+        ora_user_anonymized_id (str): The anonymous user id of the learner.
+        score (dict): The new score, with `points_earned` and `points_possible` keys.
+    """
+    notification = (
+        usage_id,
+        ora_user_anonymized_id,
+        {'points_earned': score['points_earned'], 'points_possible': score['points_possible']},
+    )
+    transaction.on_commit(partial(send_grade_assigned_notifications, [notification]))
+
+
+def send_grade_assigned_notifications(notifications):
+    """
+    Send user notifications for a batch of newly assigned grades.
+
+    Usernames and users are resolved with one bulk lookup each, and learners who got
+    the same score on the same ORA share a single notification event.
+
+    Args:
+        notifications (list): (usage_id, ora_user_anonymized_id, score) items, where
+            `score` has `points_earned` and `points_possible` keys. When the same learner
+            appears more than once for an ORA, only the last score is notified.
     """
     from openassessment.data import map_anonymized_ids_to_usernames as map_to_username
 
-    user_name_list = []
+    latest_scores = {
+        (usage_id, ora_user_anonymized_id): score
+        for usage_id, ora_user_anonymized_id, score in notifications
+    }
+    if not latest_scores:
+        return
+
+    anonymized_ids = {ora_user_anonymized_id for _, ora_user_anonymized_id in latest_scores}
     try:
-        # Get ORA user name
-        user_name_list = map_to_username([ora_user_anonymized_id])
+        user_name_map = map_to_username(anonymized_ids)
     except FieldError as exc:
-        logger.error(f'Error while getting user name for the user id {ora_user_anonymized_id}: {exc}')
+        logger.error(f'Error while getting user names for the user ids {sorted(anonymized_ids)}: {exc}')
+        return
+
+    user_id_map = dict(
+        User.objects.filter(username__in=set(user_name_map.values())).values_list('username', 'id')
+    )
+
+    users_by_grade = {}
+    for (usage_id, ora_user_anonymized_id), score in latest_scores.items():
+        user_id = user_id_map.get(user_name_map.get(ora_user_anonymized_id))
+        if user_id is None:
+            logger.error(f'Unknown User Error: no user found for the user id {ora_user_anonymized_id}')
+            continue
+        grade_key = (usage_id, score['points_earned'], score['points_possible'])
+        users_by_grade.setdefault(grade_key, []).append(user_id)
+
+    ora_metadata_cache = {}
+    for (usage_id, points_earned, points_possible), user_ids in users_by_grade.items():
+        try:
+            if usage_id not in ora_metadata_cache:
+                ora_usage_key = UsageKey.from_string(usage_id)
+                course_id = CourseKey.from_string(str(ora_usage_key.course_key))
+                ora_metadata_cache[usage_id] = (
+                    ora_usage_key,
+                    course_id,
+                    modulestore().get_item(ora_usage_key).display_name,
+                    modulestore().get_course(course_id).display_name,
+                )
+            ora_usage_key, course_id, ora_name, course_name = ora_metadata_cache[usage_id]
+        # Catch bad ORA location
+        except (InvalidKeyError, ItemNotFoundError):
+            logger.error(f"Bad ORA location provided: {usage_id}")
+            continue
 
-    try:
-        if (not user_name_list) or (not user_name_list[ora_user_anonymized_id]):
-            return
-        # Get ORA user
-        ora_user = User.objects.get(username=user_name_list[ora_user_anonymized_id])
-        # Get ORA block
-        ora_usage_key = UsageKey.from_string(usage_id)
-        ora_metadata = modulestore().get_item(ora_usage_key)
-        # Get course metadata
-        course_id = CourseKey.from_string(str(ora_usage_key.course_key))
-        course_metadata = modulestore().get_course(course_id)
         notification_data = UserNotificationData(
-            user_ids=[ora_user.id],
+            user_ids=user_ids,
             context={
-                'ora_name': ora_metadata.display_name,
-                'course_name': course_metadata.display_name,
-                'points_earned': score['points_earned'],
-                'points_possible': score['points_possible'],
+                'ora_name': ora_name,
+                'course_name': course_name,
+                'points_earned': points_earned,
+                'points_possible': points_possible,
             },
             notification_type="ora_grade_assigned",
             content_url=f"{getattr(settings, 'LMS_ROOT_URL', '')}/courses/{str(course_id)}"
@@ -82,11 +137,3 @@ def send_grade_assigned_notification(usage_id, ora_user_anonymized_id, score):
             course_key=course_id,
         )
         USER_NOTIFICATION_REQUESTED.send_event(notification_data=notification_data)
-
-    # Catch bad ORA location
-    except (InvalidKeyError, ItemNotFoundError):
-        logger.error(f"Bad ORA location provided: {usage_id}")
-
-    # Error with getting User
-    except User.DoesNotExist as exc:
-        logger.error(f'Unknown User Error: {exc}')
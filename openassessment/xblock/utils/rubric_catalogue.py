@@ -0,0 +1,119 @@
+"""
+Cached catalogue of the rubrics of every ORA block in a course, for rubric reuse in Studio.
+"""
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from openedx_events.content_authoring.signals import (
+    XBLOCK_CREATED,
+    XBLOCK_DELETED,
+    XBLOCK_DUPLICATED,
+    XBLOCK_PUBLISHED,
+    XBLOCK_UPDATED,
+)
+
+from openassessment.assessment.cache import bump_cache_version
+from openassessment.xblock.utils.xml import definition_hash
+
+# Seconds a catalogue is cached for, unless overridden by the ORA_RUBRIC_CATALOGUE_CACHE_TIMEOUT
+# setting. 0 disables caching. Catalogues are also invalidated when the course is published,
+# and when its ORA blocks are created, edited, duplicated or deleted.
+DEFAULT_RUBRIC_CATALOGUE_CACHE_TIMEOUT = 60 * 60
+
+
+def get_rubric_catalogue(course_key, get_course_ora_blocks):
+    """
+    Get the catalogue of the ORA blocks of a course, building it when it isn't cached.
+
+    Args:
+        course_key (CourseKey): The course.
+        get_course_ora_blocks (function): Returns every ORA block of the course which isn't an orphan.
+
+    Returns:
+        dict with
+            'blocks': list of dicts with the 'location' (str, without branch), 'display_name'
+                and 'rubric_hash' of each block, in course order.
+            'rubrics': dict mapping each rubric hash to its rubric, as compact JSON.
+                Blocks with identical rubrics share one entry.
+    """
+    cache_timeout = getattr(settings, 'ORA_RUBRIC_CATALOGUE_CACHE_TIMEOUT', DEFAULT_RUBRIC_CATALOGUE_CACHE_TIMEOUT)
+    if not cache_timeout:
+        return _build_rubric_catalogue(get_course_ora_blocks())
+
+    cache_key = "openassessment.rubric_catalogue.{}.v{}".format(
+        course_key, cache.get(_rubric_catalogue_version_key(course_key), 0)
+    )
+    catalogue = cache.get(cache_key)
+    if catalogue is None:
+        catalogue = _build_rubric_catalogue(get_course_ora_blocks())
+        cache.set(cache_key, catalogue, cache_timeout)
+    return catalogue
+
+
+def _build_rubric_catalogue(blocks):
+    """
+    Describe each block and its rubric.
+    """
+    catalogue = {'blocks': [], 'rubrics': {}}
+    for block in blocks:
+        rubric = rubric_from_block(block)
+        rubric_hash = definition_hash(rubric)
+        catalogue['rubrics'][rubric_hash] = json.dumps(rubric, separators=(',', ':'), sort_keys=True)
+        catalogue['blocks'].append({
+            'location': str(block.location.for_branch(None)),
+            'display_name': block.display_name,
+            'rubric_hash': rubric_hash,
+        })
+    return catalogue
+
+
+def rubric_from_block(block):
+    """
+    The rubric of an ORA block, as returned by the get_rubric handler.
+    """
+    return {
+        'criteria': block.rubric_criteria,
+        'feedback_prompt': block.rubric_feedback_prompt,
+        'feedback_default_text': block.rubric_feedback_default_text,
+    }
+
+
+def _rubric_catalogue_version_key(course_key):
+    """
+    Cache key of the counter that versions cached catalogues for a course.
+    """
+    return f"openassessment.rubric_catalogue_version.{course_key}"
+
+
+def bump_rubric_catalogue_version(course_key):
+    """
+    Invalidate the cached catalogue of a course, after its ORA blocks change.
+    """
+    bump_cache_version(_rubric_catalogue_version_key(course_key))
+
+
+def _invalidate_for_course_change(signal, sender, xblock_info=None, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the catalogue of the course of a published, duplicated or deleted block.
+
+    Publishing or deleting a unit or section publishes or deletes the ORA blocks it contains,
+    so changes to blocks of any type count.
+    """
+    if xblock_info is not None:
+        bump_rubric_catalogue_version(xblock_info.usage_key.course_key)
+
+
+def _invalidate_for_ora_change(signal, sender, xblock_info=None, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the catalogue of the course of a created or edited ORA block.
+    """
+    if xblock_info is not None and xblock_info.block_type == 'openassessment':
+        bump_rubric_catalogue_version(xblock_info.usage_key.course_key)
+
+
+XBLOCK_PUBLISHED.connect(_invalidate_for_course_change)
+XBLOCK_DUPLICATED.connect(_invalidate_for_course_change)
+XBLOCK_DELETED.connect(_invalidate_for_course_change)
+XBLOCK_CREATED.connect(_invalidate_for_ora_change)
+XBLOCK_UPDATED.connect(_invalidate_for_ora_change)
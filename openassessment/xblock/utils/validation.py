@@ -10,6 +10,7 @@ from openassessment.assessment.api.student_training import validate_training_exa
 from openassessment.assessment.serializers import InvalidRubric, rubric_from_dict
 from openassessment.xblock.utils.data_conversion import convert_training_examples_list_to_dict
 from openassessment.xblock.utils.resolve_dates import DateValidationError, InvalidDateFormat, resolve_dates
+from openassessment.xblock.utils.xml import definition_hash, definitions_cache
 
 
 def _match_by_order(items, others):
@@ -374,6 +375,36 @@ def validator(oa_block, _, strict_post_release=True):
     return _inner
 
 
+def validate_definition(oa_block, _, rubric_dict, assessments, **kwargs):
+    """
+    Validate a block definition loaded from XML, as `validator(oa_block, _, strict_post_release=False)`
+    would. Without post-release restrictions the result only depends on the definition and the
+    block's dates, so it is remembered for them: importing or publishing a course validates
+    the same definitions again and again. Only valid definitions are remembered, since the
+    message for an invalid one is translated for the caller.
+
+    Args:
+        oa_block (OpenAssessmentBlock): The XBlock being loaded.
+        _ (function): The service function used to get the appropriate i18n text
+        rubric_dict (dict): The rubric, with its prompts.
+        assessments (list of dict): The assessments.
+
+    Keyword Arguments:
+        Passed on to the validator: leaderboard_show, submission_start and submission_due.
+
+    Returns:
+        tuple of (is_valid, msg)
+    """
+    key = ('validated', definition_hash(rubric_dict, assessments, kwargs, oa_block.start, oa_block.due))
+    if definitions_cache.get(key):
+        return True, ''
+
+    is_valid, msg = validator(oa_block, _, strict_post_release=False)(rubric_dict, assessments, **kwargs)
+    if is_valid:
+        definitions_cache.set(key, True)
+    return is_valid, msg
+
+
 def validate_submission(submission, prompts, _, text_response='required'):
     """
     Validate submission dict.
@@ -3,20 +3,30 @@ Serialize and deserialize OpenAssessment XBlock content to/from XML.
 """
 
 
+import copy
+import hashlib
 import json
 import logging
 from uuid import uuid4 as uuid
+from xml.etree import ElementTree
 
 import dateutil.parser
 import defusedxml.ElementTree as safe_etree
 import pytz
 
 from lxml import etree
+from openassessment.assessment.cache import LocalLRUCache
 from openassessment.xblock.utils.data_conversion import update_assessments_format
 from openassessment.xblock.lms_mixin import GroupAccessDict
 
 log = logging.getLogger(__name__)
 
+# Parsed and serialized rubrics and assessments, and validated definitions, keyed by a hash of their content.
+# Course import, publish and export handle the same definitions again and again,
+# and blocks created from the same template or reused rubric share them.
+DEFINITIONS_CACHE_MAX_ENTRIES = 1000
+definitions_cache = LocalLRUCache(DEFINITIONS_CACHE_MAX_ENTRIES)
+
 
 class UpdateFromXmlError(Exception):
     """
@@ -30,6 +40,65 @@ class ValidationError(UpdateFromXmlError):
     """
 
 
+def definition_hash(*parts):
+    """
+    Hash block definition content: XML as bytes, or JSON serializable values.
+
+    Returns:
+        str
+    """
+    hasher = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, default=str).encode('utf-8')
+        hasher.update(part)
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+def clear_definitions_cache():
+    """
+    Forget every cached definition and validation result.
+    """
+    definitions_cache.clear()
+
+
+def _element_to_bytes(element):
+    """
+    Serialize an lxml element, or an ElementTree one as returned by `_unicode_to_xml`.
+    """
+    if etree.iselement(element):
+        return etree.tostring(element, with_tail=False)
+    return ElementTree.tostring(element)
+
+
+def _parse_cached(parse_func, element):
+    """
+    Return a copy of `parse_func(element)`, parsing each distinct element once.
+    Errors are not cached, so an invalid element raises every time it is parsed.
+    """
+    key = ('parsed', parse_func.__name__, definition_hash(_element_to_bytes(element)))
+    parsed = definitions_cache.get(key)
+    if parsed is None:
+        parsed = parse_func(element)
+        definitions_cache.set(key, parsed)
+    return copy.deepcopy(parsed)
+
+
+def _serialize_cached(tag, serialize_func, oa_block, content):
+    """
+    Return a copy of the `tag` element built by `serialize_func(element, oa_block)`,
+    building it once for each distinct `content` it depends on.
+    """
+    key = ('serialized', tag, definition_hash(content))
+    element = definitions_cache.get(key)
+    if element is None:
+        element = etree.Element(tag)
+        serialize_func(element, oa_block)
+        definitions_cache.set(key, element)
+    return copy.deepcopy(element)
+
+
 def _sort_by_order_num(items):
     """
     Sort dictionaries by the key "order_num".
@@ -763,8 +832,7 @@ def serialize_content_to_xml(oa_block, root):
     title.text = str(oa_block.title)
 
     # Assessment list
-    assessments_root = etree.SubElement(root, 'assessments')
-    serialize_assessments(assessments_root, oa_block)
+    root.append(_serialize_cached('assessments', serialize_assessments, oa_block, oa_block.rubric_assessments))
 
     # Prompts
     prompts_root = etree.SubElement(root, 'prompts')
@@ -773,8 +841,12 @@ def serialize_content_to_xml(oa_block, root):
     root.set('prompts_type', str(oa_block.prompts_type))
 
     # Rubric
-    rubric_root = etree.SubElement(root, 'rubric')
-    serialize_rubric(rubric_root, oa_block)
+    root.append(_serialize_cached(
+        'rubric',
+        serialize_rubric,
+        oa_block,
+        [oa_block.rubric_criteria, oa_block.rubric_feedback_prompt, oa_block.rubric_feedback_default_text],
+    ))
 
     # Team info
     if oa_block.teams_enabled is not None:
@@ -949,7 +1021,7 @@ def parse_from_xml(root):
     rubric_el = root.find('rubric')
     if rubric_el is None:
         raise UpdateFromXmlError('Every assessment must contain a "rubric" element.')
-    rubric = parse_rubric_xml(rubric_el)
+    rubric = _parse_cached(parse_rubric_xml, rubric_el)
 
     # Retrieve the prompts
     prompts = _parse_prompts_xml(root)
@@ -978,7 +1050,7 @@ def parse_from_xml(root):
     assessments_el = root.find('assessments')
     if assessments_el is None:
         raise UpdateFromXmlError('Every assessment must contain an "assessments" element.')
-    assessments = parse_assessments_xml(assessments_el)
+    assessments = _parse_cached(parse_assessments_xml, assessments_el)
 
     return {
         'title': title,
@@ -7,6 +7,7 @@ from submissions.api import get_submissions, SubmissionInternalError, Submission
 from openassessment.assessment.api.peer import PeerGradingStrategy
 from openassessment.workflow import api as workflow_api
 from openassessment.workflow.models import AssessmentWorkflowCancellation
+from openassessment.xblock.apis.data_loader import memoised_in_scope
 
 
 class WorkflowMixin:
@@ -55,6 +56,7 @@ class WorkflowMixin:
         steps = self._create_step_list()
         workflow_api.create_workflow(submission_uuid, steps, on_init_params={})
 
+    @memoised_in_scope
     def workflow_requirements(self):
         """
         Retrieve the requirements from each assessment module
@@ -89,6 +91,7 @@ class WorkflowMixin:
 
         return requirements
 
+    @memoised_in_scope
     def get_course_workflow_settings(self):
         """
         Retrieve any course-level information that may be needed for workflow updates
@@ -130,10 +133,37 @@ class WorkflowMixin:
             course_settings = self.get_course_workflow_settings()
             workflow_api.update_from_assessments(submission_uuid, requirements, course_settings)
 
+        # Submissions, assessments and scores read before the update may be out of date
+        self.data_loader.clear()
+
+    def refresh_workflow_status(self):
+        """
+        Bring the status of the current student's workflow up to date for a page view.
+
+        Unlike `update_workflow_status`, the workflow is only updated when it isn't known to be
+        up to date with the current requirements and course settings, see
+        `workflow_api.read_workflow_for_submission`. The workflow read is kept for the rest of
+        the view.
+
+        Raises:
+            AssessmentWorkflowError
+        """
+        submission_uuid = self.submission_uuid
+        if submission_uuid is None:
+            return
+        self.data_loader.load(
+            ("workflow", submission_uuid),
+            workflow_api.read_workflow_for_submission,
+            submission_uuid,
+            self.workflow_requirements(),
+            self.get_course_workflow_settings()
+        )
+
     def get_workflow_info(self, submission_uuid=None):
         """
         Retrieve a description of the student's progress in a workflow.
-        Note that this *may* update the workflow status if it's changed.
+        Note that this *may* update the workflow status, if it isn't known
+        to be up to date with the current requirements.
 
         Keyword Arguments:
             submission_uuid (str): The submission associated with the workflow to return.
@@ -158,7 +188,9 @@ class WorkflowMixin:
         if submission_uuid is None:
             return {}
 
-        return workflow_api.get_workflow_for_submission(
+        return self.data_loader.load(
+            ("workflow", submission_uuid),
+            workflow_api.read_workflow_for_submission,
             submission_uuid,
             self.workflow_requirements(),
             self.get_course_workflow_settings()